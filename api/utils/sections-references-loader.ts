@@ -6,37 +6,38 @@
  * proper access by both api/interfaces and app/state/contexts.
  */
 
-// Import all sections-references JSON files (relative to api/utils)
-import section1Data from '../sections-references/section-1.json';
-import section2Data from '../sections-references/section-2.json';
-import section4Data from '../sections-references/section-4.json';
-import section3Data from '../sections-references/section-3.json';
-import section5Data from '../sections-references/section-5.json';
-import section6Data from '../sections-references/section-6.json';
-import section7Data from '../sections-references/section-7.json';
-import section8Data from '../sections-references/section-8.json';
-import section9Data from '../sections-references/section-9.json';
-import section10Data from '../sections-references/section-10.json';
-import section11Data from '../sections-references/section-11.json';
-import section12Data from '../sections-references/section-12.json';
-import section13Data from '../sections-references/section-13.json';
-import section14Data from '../sections-references/section-14.json';
-import section15Data from '../sections-references/section-15.json';
-import section16Data from '../sections-references/section-16.json';
-import section17Data from '../sections-references/section-17.json';
-import section18Data from '../sections-references/section-18.json';
-import section19Data from '../sections-references/section-19.json';
-import section20Data from '../sections-references/section-20.json';
-import section21Data from '../sections-references/section-21.json';
-import section22Data from '../sections-references/section-22.json';
-import section23Data from '../sections-references/section-23.json';
-import section24Data from '../sections-references/section-24.json';
-import section25Data from '../sections-references/section-25.json';
-import section26Data from '../sections-references/section-26.json';
-import section27Data from '../sections-references/section-27.json';
-import section28Data from '../sections-references/section-28.json';
-import section29Data from '../sections-references/section-29.json';
-import section30Data from '../sections-references/section-30.json';
+// Import the pre-indexed section bundles (generated from sections-references by
+// scripts/generate-reference-bundles.py; relative to api/utils)
+import section1Data from '../sections-references/bundles/section-1.json';
+import section2Data from '../sections-references/bundles/section-2.json';
+import section4Data from '../sections-references/bundles/section-4.json';
+import section3Data from '../sections-references/bundles/section-3.json';
+import section5Data from '../sections-references/bundles/section-5.json';
+import section6Data from '../sections-references/bundles/section-6.json';
+import section7Data from '../sections-references/bundles/section-7.json';
+import section8Data from '../sections-references/bundles/section-8.json';
+import section9Data from '../sections-references/bundles/section-9.json';
+import section10Data from '../sections-references/bundles/section-10.json';
+import section11Data from '../sections-references/bundles/section-11.json';
+import section12Data from '../sections-references/bundles/section-12.json';
+import section13Data from '../sections-references/bundles/section-13.json';
+import section14Data from '../sections-references/bundles/section-14.json';
+import section15Data from '../sections-references/bundles/section-15.json';
+import section16Data from '../sections-references/bundles/section-16.json';
+import section17Data from '../sections-references/bundles/section-17.json';
+import section18Data from '../sections-references/bundles/section-18.json';
+import section19Data from '../sections-references/bundles/section-19.json';
+import section20Data from '../sections-references/bundles/section-20.json';
+import section21Data from '../sections-references/bundles/section-21.json';
+import section22Data from '../sections-references/bundles/section-22.json';
+import section23Data from '../sections-references/bundles/section-23.json';
+import section24Data from '../sections-references/bundles/section-24.json';
+import section25Data from '../sections-references/bundles/section-25.json';
+import section26Data from '../sections-references/bundles/section-26.json';
+import section27Data from '../sections-references/bundles/section-27.json';
+import section28Data from '../sections-references/bundles/section-28.json';
+import section29Data from '../sections-references/bundles/section-29.json';
+import section30Data from '../sections-references/bundles/section-30.json';
 
 // ============================================================================
 // TYPES
@@ -50,7 +51,7 @@ export interface FieldReference {
   type: 'PDFTextField' | 'PDFCheckBox' | 'PDFRadioGroup' | 'PDFDropdown';
   maxLength?: number;
   options?: string[];
-  rect: {
+  rect?: {
     x: number;
     y: number;
     width: number;
@@ -75,41 +76,86 @@ export interface SectionReference {
   fields: FieldReference[];
 }
 
+/**
+ * Lookup tables precomputed for a section bundle; values are indexes into fields
+ */
+export interface SectionReferenceIndex {
+  byName: Record<string, number>;
+  byId: Record<string, number>;
+  byUniqueId: Record<string, number>;
+  trigrams: Record<string, number[]>;
+  commonTrigrams: string[];
+}
+
+/**
+ * A field as stored in a bundle: label, type and options are indexes into the
+ * bundle dictionaries, and keys holding the section default are omitted
+ */
+export interface EncodedFieldReference {
+  id: string;
+  name: string;
+  page?: number;
+  label?: number;
+  type?: number;
+  maxLength?: number;
+  options?: number;
+  section?: number;
+  confidence?: number;
+  uniqueId: string;
+}
+
+/**
+ * Distinct values the encoded fields of a bundle index into
+ */
+export interface SectionReferenceDictionaries {
+  label: string[];
+  type: FieldReference['type'][];
+  options: string[][];
+}
+
+export interface SectionReferenceBundle {
+  metadata: SectionReference['metadata'];
+  dictionaries: SectionReferenceDictionaries;
+  defaults: Partial<EncodedFieldReference>;
+  fields: EncodedFieldReference[];
+  index: SectionReferenceIndex;
+}
+
 // ============================================================================
 // SECTIONS REGISTRY
 // ============================================================================
 
-const sectionsRegistry: Record<number, SectionReference> = {
-  1: section1Data as SectionReference,
-  2: section2Data as SectionReference,
-  3: section3Data as SectionReference,
-  4: section4Data as SectionReference,
-  5: section5Data as SectionReference,
-  6: section6Data as SectionReference,
-  7: section7Data as SectionReference,
-  8: section8Data as SectionReference,
-  9: section9Data as SectionReference,
-  10: section10Data as SectionReference,
-  11: section11Data as SectionReference,
-  12: section12Data as SectionReference,
-  13: section13Data as SectionReference,
-  14: section14Data as SectionReference,
-  15: section15Data as SectionReference,
-  16: section16Data as SectionReference,
-  17: section17Data as SectionReference,
-  18: section18Data as SectionReference,
-  19: section19Data as SectionReference,
-  20: section20Data as SectionReference,
-  21: section21Data as SectionReference,
-  22: section22Data as SectionReference,
-  23: section23Data as SectionReference,
-  24: section24Data as SectionReference,
-  25: section25Data as SectionReference,
-  26: section26Data as SectionReference,
-  27: section27Data as SectionReference,
-  28: section28Data as SectionReference,
-  29: section29Data as SectionReference,
-  30: section30Data as SectionReference
+const sectionsRegistry: Record<number, SectionReferenceBundle> = {
+  1: section1Data as SectionReferenceBundle,
+  2: section2Data as SectionReferenceBundle,
+  3: section3Data as SectionReferenceBundle,
+  4: section4Data as SectionReferenceBundle,
+  5: section5Data as SectionReferenceBundle,
+  6: section6Data as SectionReferenceBundle,
+  7: section7Data as SectionReferenceBundle,
+  8: section8Data as SectionReferenceBundle,
+  9: section9Data as SectionReferenceBundle,
+  10: section10Data as SectionReferenceBundle,
+  11: section11Data as SectionReferenceBundle,
+  12: section12Data as SectionReferenceBundle,
+  13: section13Data as SectionReferenceBundle,
+  14: section14Data as SectionReferenceBundle,
+  15: section15Data as SectionReferenceBundle,
+  16: section16Data as SectionReferenceBundle,
+  17: section17Data as SectionReferenceBundle,
+  18: section18Data as SectionReferenceBundle,
+  19: section19Data as SectionReferenceBundle,
+  20: section20Data as SectionReferenceBundle,
+  21: section21Data as SectionReferenceBundle,
+  22: section22Data as SectionReferenceBundle,
+  23: section23Data as SectionReferenceBundle,
+  24: section24Data as SectionReferenceBundle,
+  25: section25Data as SectionReferenceBundle,
+  26: section26Data as SectionReferenceBundle,
+  27: section27Data as SectionReferenceBundle,
+  28: section28Data as SectionReferenceBundle,
+  29: section29Data as SectionReferenceBundle,
+  30: section30Data as SectionReferenceBundle
 };
 
 // ============================================================================
@@ -117,58 +163,120 @@ const sectionsRegistry: Record<number, SectionReference> = {
 // ============================================================================
 
 /**
- * Get all fields for a specific section
+ * Get the bundle for a section
  */
-export function getSectionFields(sectionId: number): FieldReference[] {
+function getSectionBundle(sectionId: number): SectionReferenceBundle {
   const sectionData = sectionsRegistry[sectionId];
   if (!sectionData) {
     throw new Error(`Section ${sectionId} not found in sections-references`);
   }
-  return sectionData.fields;
+  return sectionData;
+}
+
+// Fields decoded so far, per section and bundle position
+const decodedFields: Record<number, FieldReference[]> = {};
+
+/**
+ * Rebuild the full field at a bundle position from the encoded field, the
+ * section defaults and the dictionaries
+ */
+function decodeField(bundle: SectionReferenceBundle, position: number): FieldReference {
+  const encoded: Partial<EncodedFieldReference> = { ...bundle.defaults, ...bundle.fields[position] };
+  const { label, type, options, ...rest } = encoded;
+  const field = { ...rest } as FieldReference;
+  if (label !== undefined) field.label = bundle.dictionaries.label[label];
+  if (type !== undefined) field.type = bundle.dictionaries.type[type];
+  if (options !== undefined) field.options = bundle.dictionaries.options[options];
+  return field;
+}
+
+/**
+ * Get the field at a bundle position, decoding it on first use
+ */
+function fieldAtPosition(sectionId: number, position: number): FieldReference {
+  let decoded = decodedFields[sectionId];
+  if (!decoded) {
+    decoded = decodedFields[sectionId] = [];
+  }
+  if (!decoded[position]) {
+    decoded[position] = decodeField(getSectionBundle(sectionId), position);
+  }
+  return decoded[position];
+}
+
+/**
+ * Get all fields for a specific section
+ */
+export function getSectionFields(sectionId: number): FieldReference[] {
+  const { fields } = getSectionBundle(sectionId);
+  return fields.map((_, position) => fieldAtPosition(sectionId, position));
 }
 
 /**
  * Get section metadata
  */
 export function getSectionMetadata(sectionId: number) {
-  const sectionData = sectionsRegistry[sectionId];
-  if (!sectionData) {
-    throw new Error(`Section ${sectionId} not found in sections-references`);
-  }
-  return sectionData.metadata;
+  return getSectionBundle(sectionId).metadata;
+}
+
+/**
+ * Resolve an entry of one of the bundle's lookup tables to its field
+ */
+function fieldAt(sectionId: number, table: Record<string, number>, key: string): FieldReference | undefined {
+  return Object.prototype.hasOwnProperty.call(table, key) ? fieldAtPosition(sectionId, table[key]) : undefined;
 }
 
 /**
  * Find a field by its PDF field name
  */
 export function findFieldByName(sectionId: number, fieldName: string): FieldReference | undefined {
-  const fields = getSectionFields(sectionId);
-  return fields.find(field => field.name === fieldName);
+  return fieldAt(sectionId, getSectionBundle(sectionId).index.byName, fieldName);
 }
 
 /**
  * Find a field by its ID (with or without ' 0 R' suffix)
  */
 export function findFieldById(sectionId: number, fieldId: string): FieldReference | undefined {
-  const fields = getSectionFields(sectionId);
-  const cleanId = fieldId.replace(' 0 R', '');
-  return fields.find(field => field.id.replace(' 0 R', '') === cleanId);
+  return fieldAt(sectionId, getSectionBundle(sectionId).index.byId, fieldId.replace(' 0 R', ''));
 }
 
 /**
  * Find fields by partial name match (useful for finding related fields)
+ *
+ * Candidates come from intersecting the trigram posting lists of the query;
+ * queries shorter than 3 characters or made only of common trigrams are scanned.
  */
 export function findFieldsByPartialName(sectionId: number, partialName: string): FieldReference[] {
-  const fields = getSectionFields(sectionId);
-  return fields.filter(field => field.name.includes(partialName));
+  const bundle = getSectionBundle(sectionId);
+  const { trigrams, commonTrigrams } = bundle.index;
+
+  const postings: number[][] = [];
+  for (let i = 0; i + 3 <= partialName.length; i++) {
+    const trigram = partialName.slice(i, i + 3);
+    if (commonTrigrams.includes(trigram)) continue;
+    if (!Object.prototype.hasOwnProperty.call(trigrams, trigram)) return [];
+    postings.push(trigrams[trigram]);
+  }
+
+  let candidates: number[];
+  if (postings.length === 0) {
+    candidates = bundle.fields.map((_, position) => position);
+  } else {
+    postings.sort((a, b) => a.length - b.length);
+    const others = postings.slice(1).map(positions => new Set(positions));
+    candidates = postings[0].filter(position => others.every(positions => positions.has(position)));
+  }
+  // Names are stored unencoded, so only matches are decoded
+  return candidates
+    .filter(position => bundle.fields[position].name.includes(partialName))
+    .map(position => fieldAtPosition(sectionId, position));
 }
 
 /**
  * Get field by unique identifier
  */
 export function findFieldByUniqueId(sectionId: number, uniqueId: string): FieldReference | undefined {
-  const fields = getSectionFields(sectionId);
-  return fields.find(field => field.uniqueId === uniqueId);
+  return fieldAt(sectionId, getSectionBundle(sectionId).index.byUniqueId, uniqueId);
 }
 
 // ============================================================================
@@ -214,7 +322,7 @@ export function createFieldFromReference<T = any>(
     type: fieldRef.type,
     label: fieldRef.label,
     value: defaultValue,
-    rect: fieldRef.rect
+    rect: fieldRef.rect ?? { x: 0, y: 0, width: 0, height: 0 } // Bundles omit rect
   };
 }
 
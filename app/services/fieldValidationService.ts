@@ -6,6 +6,10 @@
  * data to ensure accurate PDF field mapping.
  */
 
+/**
+ * The 'validation' projection of a section reference (see
+ * api/sections-references/projections/schema.json)
+ */
 interface SectionReference {
   metadata: {
     sectionId: number;
@@ -15,10 +19,7 @@ interface SectionReference {
   fields: Array<{
     id: string;
     name: string;
-    type: string;
-    page: number;
-    label: string;
-    options?: string[];
+    section: number;
   }>;
 }
 
@@ -52,14 +53,14 @@ export class FieldValidationService {
 
   /**
    * Initialize section references from the sections-references directory
-   * This loads the source of truth for all 30 sections
+   * This loads the validation projection (id, name, section) of all 30 sections
    */
   private async initializeReferences(): Promise<void> {
     try {
       // Load section references dynamically
       for (let sectionId = 1; sectionId <= 30; sectionId++) {
         try {
-          const sectionData = await import(`../../api/sections-references/section-${sectionId}.json`);
+          const sectionData = await import(`../../api/sections-references/projections/validation/section-${sectionId}.json`);
           this.sectionReferences.set(sectionId, sectionData);
           
           // Build field indexes for fast lookup
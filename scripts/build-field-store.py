@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build Memory-Mapped Field Store
+Writes the reference fields to reports/field-store (a symlink to the latest
+complete build) as a fixed-width record array plus string heaps (see
+sf86_toolkit/field_store.py) for scripts and process pools that map it
+read-only instead of loading the section exports.
+With --workers, opens the store from a pool of processes and reports how
+much private memory each worker needed next to loading the exports
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from sf86_toolkit.field_store import DEFAULT_STORE_DIR, FieldStore, build_field_store, store_is_current, store_lock
+from sf86_toolkit.references import load_all_section_references
+
+def private_kib():
+    """Resident memory of this process that is not shared with others (Linux only)"""
+    with open('/proc/self/smaps_rollup', 'r') as f:
+        fields = dict(line.split(':', 1) for line in f if ':' in line)
+    return sum(int(fields[key].split()[0]) for key in ('Private_Clean', 'Private_Dirty', 'Anonymous') if key in fields)
+
+def open_store_worker(store_dir):
+    before = private_kib()
+    store = FieldStore(store_dir)
+    checkboxes = len(store.select(field_type='PDFCheckBox'))
+    pages = int(np.unique(store.records['page']).size)
+    store.field(store.find_name(store.name(len(store) - 1)))
+    return private_kib() - before, checkboxes, pages
+
+def load_exports_worker(_):
+    before = private_kib()
+    fields = [field for data in load_all_section_references().values() for field in data['fields']]
+    checkboxes = sum(1 for field in fields if field['type'] == 'PDFCheckBox')
+    pages = len({field.get('page') for field in fields})
+    return private_kib() - before, checkboxes, pages
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the memory-mapped reference field store')
+    parser.add_argument('--output', default=DEFAULT_STORE_DIR, help='store directory')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild even if the store is current')
+    parser.add_argument('--workers', type=int, default=0, help='compare per-worker memory across a process pool')
+    args = parser.parse_args()
+
+    with store_lock(args.output):
+        if args.rebuild or not store_is_current(args.output):
+            start = time.perf_counter()
+            manifest = build_field_store(args.output)
+            print(f"🔧 Stored {manifest['fieldCount']} fields in {time.perf_counter() - start:.2f}s -> {args.output}")
+        else:
+            print(f'✅ Field store is current ({args.output})')
+
+    total = sum(os.path.getsize(os.path.join(args.output, name)) for name in os.listdir(args.output))
+    print(f'📊 {len(FieldStore(args.output))} fields, {total / 1024:.0f} KiB on disk')
+    if not args.workers:
+        return
+
+    with Pool(args.workers) as pool:
+        mapped = pool.map(open_store_worker, [args.output] * args.workers)
+    with Pool(args.workers) as pool:
+        loaded = pool.map(load_exports_worker, range(args.workers))
+    if {result[1:] for result in mapped} != {result[1:] for result in loaded}:
+        print('❌ Store and exports disagree on checkbox / page counts')
+        raise SystemExit(1)
+    print(f'📋 Private memory per worker ({args.workers} workers):')
+    print(f'   mapped store:   {max(result[0] for result in mapped):>8,} KiB')
+    print(f'   loaded exports: {max(result[0] for result in loaded):>8,} KiB')
+
+if __name__ == '__main__':
+    main()
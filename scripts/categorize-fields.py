@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Offline Field-to-Section Categorization
+Compiles every sectionFieldPatterns regex from utilities/page-categorization-bridge.ts
+into one combined automaton, pairs it with a page-interval index built from
+refinedSectionPageRanges, and categorizes all fields in a single pass. The
+resulting field -> {section, stage, confidence} table is written to
+reports/field-section-mapping.json; the bridge only trusts entries at or above
+its precomputed-confidence threshold and runs its own page-first heuristics for
+the rest
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import time
+from collections import Counter
+
+from sf86_toolkit.pattern_automaton import PatternAutomaton, compile_pattern
+from sf86_toolkit.references import REPO_ROOT, load_all_section_references
+
+BRIDGE_PATH = os.path.join(REPO_ROOT, 'utilities', 'page-categorization-bridge.ts')
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'reports', 'field-section-mapping.json')
+
+# Section 6 is matched on exact field names only, as in identifySectionByField
+STRICT_SECTIONS = {6}
+
+EXPLICIT_NAME_PATTERN = re.compile(r'Section(\d+)(?:[-_]?\d*)?', re.IGNORECASE)
+EXPLICIT_LABEL_PATTERN = re.compile(r'Section\s+(\d+)(?:[.\-_]|$)', re.IGNORECASE)
+REGEX_LITERAL_PATTERN = re.compile(r'/((?:\\.|\[(?:\\.|[^\]\\])*\]|[^/\\\n\[])+)/([gimsuy]*)')
+LINE_COMMENT_PATTERN = re.compile(r'(^|[\s,])//.*$')
+
+def extract_ts_block(source, declaration):
+    """Body of `declaration = { ... };` from a TypeScript source"""
+    start = source.index(declaration)
+    end = source.index('\n};', start)
+    return source[source.index('{', start) + 1:end]
+
+def parse_section_field_patterns(source):
+    """sectionFieldPatterns as (section, regex source, ignore_case) in declaration order"""
+    patterns = []
+    section = None
+    for line in extract_ts_block(source, 'export const sectionFieldPatterns').splitlines():
+        line = LINE_COMMENT_PATTERN.sub(r'\1', line)
+        key = re.match(r'\s*(\d+):', line)
+        if key:
+            section = int(key.group(1))
+            line = line[key.end():]
+        for match in REGEX_LITERAL_PATTERN.finditer(line):
+            patterns.append((section, match.group(1), 'i' in match.group(2)))
+    return patterns
+
+def parse_page_ranges(source):
+    """refinedSectionPageRanges as {section: (first page, last page)}"""
+    block = extract_ts_block(source, 'export const refinedSectionPageRanges')
+    return {int(section): (int(first), int(last))
+            for section, first, last in re.findall(r'(\d+):\s*\[(\d+),\s*(\d+)\]', block)}
+
+class PageIntervalIndex:
+    """Elementary-interval index: bisect a page to the sections whose range covers it"""
+
+    def __init__(self, page_ranges):
+        bounds = sorted({first for first, _ in page_ranges.values()} | {last + 1 for _, last in page_ranges.values()})
+        self.starts = bounds[:-1]
+        self.covering = [
+            tuple(sorted(section for section, (first, last) in page_ranges.items() if first <= start <= last))
+            for start in self.starts
+        ]
+
+    def sections_for(self, page):
+        position = bisect.bisect_right(self.starts, page) - 1
+        return self.covering[position] if position >= 0 else ()
+
+class CategorizationEngine:
+    """identifySectionByField's name/label/pattern/page cascade, precompiled"""
+
+    def __init__(self, patterns, page_ranges):
+        self.strict_names = {}
+        automaton_patterns = []
+        for section, source, ignore_case in patterns:
+            if section in STRICT_SECTIONS:
+                literals, _, _ = compile_pattern(source)
+                for literal in literals or []:
+                    self.strict_names[literal] = section
+            else:
+                automaton_patterns.append((section, source, ignore_case))
+        self.automaton = PatternAutomaton(automaton_patterns)
+        self.pages = PageIntervalIndex(page_ranges)
+
+    def categorize(self, name, label, page):
+        """Return (section, stage) or (None, 'uncategorized')"""
+        match = EXPLICIT_NAME_PATTERN.search(name)
+        if match and 0 < int(match.group(1)) <= 30:
+            return int(match.group(1)), 'name'
+        match = EXPLICIT_LABEL_PATTERN.search(label) if label else None
+        if match and 0 < int(match.group(1)) <= 30:
+            return int(match.group(1)), 'label'
+        if name in self.strict_names:
+            return self.strict_names[name], 'strict'
+
+        sections = self.automaton.matches(name)
+        if label:
+            sections |= self.automaton.matches(label)
+        if sections:
+            return min(sections), 'pattern'
+
+        covering = self.pages.sections_for(page) if page else ()
+        if covering:
+            # Page 5 holds sections 1-6; the runtime splits it on the section5 subform only
+            if page == 5:
+                return (5 if 'section5[0]' in name else 6), 'page'
+            return covering[0], 'page'
+        return None, 'uncategorized'
+
+# Base confidence of each stage and the confidence when the field's page falls
+# in the section's range, mirroring enhancedSectionCategorization's scores
+STAGE_CONFIDENCE = {
+    'name': (0.86, 0.96),
+    'label': (0.82, 0.96),
+    'strict': (0.98, 0.98),
+    'pattern': (0.88, 0.96),
+    'page': (0.88, 0.88),
+}
+
+def stage_confidence(stage, section, page, page_ranges):
+    """Confidence of a categorization, raised when the page confirms the section"""
+    base, confirmed = STAGE_CONFIDENCE[stage]
+    first, last = page_ranges.get(section, (0, 0))
+    return confirmed if page and first <= page <= last else base
+
+def load_fields(fields_path):
+    """Fields to categorize: a JSON list (or {'fields': [...]}) or every reference export"""
+    if fields_path:
+        with open(fields_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['fields'] if isinstance(data, dict) else data
+    references = load_all_section_references()
+    return [field for _, data in sorted(references.items()) for field in data['fields']]
+
+def main():
+    parser = argparse.ArgumentParser(description='Categorize PDF fields into sections offline and write a field -> section table')
+    parser.add_argument('--fields', help='JSON field list (name/label/page); defaults to all sections-references exports')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='path of the field -> section JSON table')
+    parser.add_argument('--min-confidence', type=float, default=0.95,
+                        help='confidence the bridge trusts without re-running its heuristics (for the report)')
+    args = parser.parse_args()
+
+    print('🔧 OFFLINE FIELD CATEGORIZATION')
+    print('=' * 60)
+
+    with open(BRIDGE_PATH, 'r', encoding='utf-8') as f:
+        bridge_source = f.read()
+    patterns = parse_section_field_patterns(bridge_source)
+    page_ranges = parse_page_ranges(bridge_source)
+
+    compile_start = time.perf_counter()
+    engine = CategorizationEngine(patterns, page_ranges)
+    compile_ms = (time.perf_counter() - compile_start) * 1000
+    print(f'📊 Compiled {len(patterns)} section patterns: {engine.automaton.literal_count} literals, '
+          f'{len(engine.automaton.guarded)} guarded regexes, {len(engine.strict_names)} strict names ({compile_ms:.1f} ms)')
+
+    fields = load_fields(args.fields)
+    table = {}
+    stages = Counter()
+    agreement = Counter()
+    confident_agreement = Counter()
+
+    categorize_start = time.perf_counter()
+    for field in fields:
+        name = field.get('name', '')
+        if not name or name in table:
+            continue
+        page = field.get('page') or 0
+        section, stage = engine.categorize(name, field.get('label') or '', page)
+        stages[stage] += 1
+        if section is not None:
+            confidence = stage_confidence(stage, section, page, page_ranges)
+            table[name] = {'section': section, 'stage': stage, 'confidence': confidence}
+        if 'section' in field:
+            outcome = 'match' if section == field['section'] else 'differ'
+            agreement[outcome] += 1
+            if section is not None and confidence >= args.min_confidence:
+                confident_agreement[outcome] += 1
+    categorize_ms = (time.perf_counter() - categorize_start) * 1000
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(table, f, indent=2)
+
+    print(f'📊 Categorized {sum(stages.values())} distinct fields in {categorize_ms:.1f} ms')
+    for stage in ['name', 'label', 'strict', 'pattern', 'page', 'uncategorized']:
+        print(f'   {stage:<14} {stages[stage]:>5}')
+    if agreement:
+        total = sum(agreement.values())
+        print(f'   Agreement with reference sections: {agreement["match"]}/{total} '
+              f'({agreement["match"] / total * 100:.1f}%)')
+    if confident_agreement:
+        total = sum(confident_agreement.values())
+        print(f'   Agreement at confidence >= {args.min_confidence}: {confident_agreement["match"]}/{total} '
+              f'({confident_agreement["match"] / total * 100:.1f}%)')
+    print(f'✅ Field -> section table saved to: {args.output}')
+
+if __name__ == '__main__':
+    main()
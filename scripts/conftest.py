@@ -0,0 +1,10 @@
+"""
+pytest configuration for the Python toolkit
+Makes sf86_toolkit importable from scripts/tests the way the scripts in this
+directory import it
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Applicant Save Deltas
+diff: compare two saved versions of a section ({section, data} records or bare
+ApplicantFormValues trees) field by field on stable reference ids and write a
+compact patch. apply: replay a patch onto a saved version, rewriting its
+Field<T> values in place
+"""
+
+import argparse
+import json
+import sys
+
+from sf86_toolkit.constraints import ConstraintTables
+from sf86_toolkit.deltas import apply_patch, apply_patch_to_tree, diff_values, field_values
+from sf86_toolkit.records import record_data
+
+def load_json(path):
+    if path == '-':
+        return json.load(sys.stdin)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(data, path, indent=None):
+    text = json.dumps(data, indent=indent, separators=None if indent else (',', ':'), ensure_ascii=False)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+def main():
+    parser = argparse.ArgumentParser(description='Field-level deltas between applicant saves')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    diff_parser = commands.add_parser('diff', help='write the patch from one save to the next')
+    diff_parser.add_argument('before', help='earlier save (JSON, - for stdin)')
+    diff_parser.add_argument('after', help='later save (JSON)')
+    diff_parser.add_argument('--output', help='patch path (default: stdout)')
+
+    apply_parser = commands.add_parser('apply', help='apply a patch to a save')
+    apply_parser.add_argument('patch', help='patch JSON')
+    apply_parser.add_argument('base', help='save the patch was computed from')
+    apply_parser.add_argument('--output', help='patched save path (default: stdout)')
+    apply_parser.add_argument('--force', action='store_true', help='apply even if the base fingerprint differs')
+    args = parser.parse_args()
+
+    constraints = ConstraintTables.from_references()
+
+    if args.command == 'diff':
+        before = field_values(record_data(load_json(args.before)), constraints)
+        after = field_values(record_data(load_json(args.after)), constraints)
+        patch = diff_values(before, after)
+        write_json(patch, args.output)
+        print(f"📦 {len(patch.get('set', {}))} set, {len(patch.get('unset', []))} unset "
+              f"of {len(after)} fields", file=sys.stderr)
+        return
+
+    patch = load_json(args.patch)
+    record = load_json(args.base)
+    data = record_data(record)
+    try:
+        expected = apply_patch(field_values(data, constraints), patch, check_base=not args.force)
+    except ValueError as error:
+        print(f'❌ {error}', file=sys.stderr)
+        raise SystemExit(1)
+
+    missing = apply_patch_to_tree(data, patch, constraints)
+    write_json(record, args.output, indent=2)
+    if missing:
+        print(f'⚠️ {len(missing)} patched fields have no Field<T> node in this save: {", ".join(missing[:10])}',
+              file=sys.stderr)
+    else:
+        # Unset fields stay in the tree as cleared nodes
+        expected.update((field_id, '') for field_id in patch.get('unset', ()))
+        if field_values(data, constraints) != expected:
+            print('⚠️ Patched save does not match the patch result', file=sys.stderr)
+    print(f"✅ Applied {len(patch.get('set', {}))} set, {len(patch.get('unset', []))} unset", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
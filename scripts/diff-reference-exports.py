@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Diff Section Reference Exports
+Compares two versions of the api/sections-references exports and reports
+added, removed, renamed, retyped, re-paged, re-sectioned and moved (rect
+delta) fields per section. With --fail-on it works as a gate: run it before
+regenerating mappings and it exits non-zero when a breaking change is found
+
+    python3 diff-reference-exports.py git:HEAD ../api/sections-references
+    python3 diff-reference-exports.py old-exports/ new-exports/ --fail-on removed,renamed
+"""
+
+import argparse
+import json
+
+from sf86_toolkit.reference_diff import (CHANGE_KINDS, DEFAULT_RECT_TOLERANCE, diff_exports, load_export_set,
+                                         section_counts)
+from sf86_toolkit.references import REFERENCES_DIR
+
+# Changes that invalidate generated mappings (field names, ids and types)
+DEFAULT_FAIL_ON = 'removed,renamed,retyped,resectioned'
+
+def export_dates(exports):
+    dates = {export.get('metadata', {}).get('exportDate') for export in exports.values()}
+    dates.discard(None)
+    return f'{min(dates)} .. {max(dates)}' if len(dates) > 1 else next(iter(dates), 'unknown')
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two versions of the section reference exports')
+    parser.add_argument('old', help='old exports: directory, section-N.json file, or git:<rev>')
+    parser.add_argument('new', nargs='?', default=REFERENCES_DIR, help='new exports (default: the working tree)')
+    parser.add_argument('--rect-tolerance', type=float, default=DEFAULT_RECT_TOLERANCE,
+                        help='points a rect edge may move before the field counts as moved')
+    parser.add_argument('--output', help='write the full change list as JSON')
+    parser.add_argument('--show', type=int, default=5, help='example changes printed per kind')
+    parser.add_argument('--fail-on', default=DEFAULT_FAIL_ON,
+                        help=f'comma-separated change kinds that fail the gate ({",".join(CHANGE_KINDS)}, or none)')
+    args = parser.parse_args()
+
+    fail_on = [] if args.fail_on == 'none' else [kind.strip() for kind in args.fail_on.split(',') if kind.strip()]
+    unknown = set(fail_on) - set(CHANGE_KINDS)
+    if unknown:
+        raise SystemExit(f'Unknown change kinds: {", ".join(sorted(unknown))}')
+
+    old_exports = load_export_set(args.old)
+    new_exports = load_export_set(args.new)
+    changes = diff_exports(old_exports, new_exports, args.rect_tolerance)
+
+    print('🔍 REFERENCE EXPORT DIFF')
+    print('=' * 60)
+    print(f'   Old: {args.old} ({len(old_exports)} sections, exported {export_dates(old_exports)})')
+    print(f'   New: {args.new} ({len(new_exports)} sections, exported {export_dates(new_exports)})')
+
+    counts = section_counts(changes)
+    if counts:
+        print(f'\n   {"Section":>7}  ' + '  '.join(f'{kind:>11}' for kind in CHANGE_KINDS))
+        for section, section_changes in counts.items():
+            print(f'   {section:>7}  ' + '  '.join(f'{section_changes[kind]:>11}' for kind in CHANGE_KINDS))
+
+    for kind in CHANGE_KINDS:
+        entries = changes[kind]
+        if not entries:
+            continue
+        print(f'\n📊 {kind}: {len(entries)}')
+        for entry in entries[:args.show]:
+            if kind == 'moved':
+                detail = f"  by {entry['delta']}pt"
+            elif 'old' in entry:
+                detail = f"  {entry['old']!r} -> {entry['new']!r}"
+            else:
+                detail = ''
+            print(f"   S{entry['section']}  {entry['name']}{detail}")
+        if len(entries) > args.show:
+            print(f'   ... {len(entries) - args.show} more')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'old': args.old, 'new': args.new, 'changes': changes}, f, indent=2, ensure_ascii=False)
+        print(f'\n💾 Full diff written to {args.output}')
+
+    failures = {kind: len(changes[kind]) for kind in fail_on if changes[kind]}
+    if failures:
+        summary = ', '.join(f'{count} {kind}' for kind, count in failures.items())
+        print(f'\n❌ Gate failed: {summary}')
+        raise SystemExit(1)
+    total = sum(len(entries) for entries in changes.values())
+    print(f'\n✅ {total} changes, none of them breaking ({", ".join(fail_on) or "no gate"})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Field Catalog
+Keeps an SQLite catalog (reports/field-catalog.sqlite) of every reference
+field, its options, subform and page, plus the field identifiers each
+section source mentions, and runs ad-hoc SQL or preset questions against it.
+The catalog is updated before every command, reloading only changed files
+
+    python3 field-catalog.py update
+    python3 field-catalog.py checkboxes --page 18 --label Estimate
+    python3 field-catalog.py unmapped --section 20 --type PDFDropdown
+    python3 field-catalog.py sql "SELECT type, COUNT(*) FROM fields GROUP BY type"
+"""
+
+import argparse
+import json
+import time
+
+from sf86_toolkit.catalog import DEFAULT_CATALOG_PATH, connect, update_catalog
+
+FIELD_COLUMNS = 'fields.section_id, fields.page, fields.type, fields.pdf_id, fields.name, fields.label'
+
+def labelled_fields(args):
+    """Fields of one type on a page whose label contains some text"""
+    return (f"""
+        SELECT {FIELD_COLUMNS} FROM fields
+        WHERE fields.page = ? AND fields.type = ? AND fields.label LIKE '%' || ? || '%'
+        ORDER BY fields.section_id, fields.position
+    """, (args.page, args.type, args.label))
+
+def unmapped_fields(args):
+    """Fields of one type in a section that no section source mentions"""
+    return (f"""
+        SELECT {FIELD_COLUMNS} FROM fields
+        WHERE fields.section_id = ? AND fields.type = ?
+          AND NOT EXISTS (SELECT 1 FROM field_mappings WHERE field_mappings.field_row = fields.field_row)
+        ORDER BY fields.position
+    """, (args.section, args.type))
+
+def print_rows(cursor, as_json):
+    columns = [description[0] for description in cursor.description]
+    rows = cursor.fetchall()
+    if as_json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2, ensure_ascii=False))
+        return rows
+    widths = [min(60, max([len(column)] + [len(str(row[index])) for row in rows]))
+              for index, column in enumerate(columns)]
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print('  '.join(str(value)[:width].ljust(width) for value, width in zip(row, widths)))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental SQLite catalog of reference fields and mappings')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='catalog database path')
+    parser.add_argument('--force', action='store_true', help='reload every file, not only the changed ones')
+    parser.add_argument('--json', action='store_true', help='print result rows as JSON')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('update', help='only bring the catalog up to date')
+    sql = commands.add_parser('sql', help='run an SQL query')
+    sql.add_argument('query', help='SELECT statement (tables: sections, pages, subforms, fields, '
+                                   'field_options, mappings, source_files; view: field_mappings)')
+    checkboxes = commands.add_parser('checkboxes', help='fields on a page whose label contains some text')
+    checkboxes.add_argument('--page', type=int, required=True)
+    checkboxes.add_argument('--label', required=True, help='text the label contains (case-insensitive)')
+    checkboxes.add_argument('--type', default='PDFCheckBox')
+    unmapped = commands.add_parser('unmapped', help='fields of a section that no section source mentions')
+    unmapped.add_argument('--section', type=int, required=True)
+    unmapped.add_argument('--type', default='PDFDropdown')
+    args = parser.parse_args()
+
+    connection = connect(args.catalog)
+    start = time.perf_counter()
+    changes = update_catalog(connection, force=args.force)
+    if changes:
+        loaded = sum(1 for change in changes.values() if change == 'loaded')
+        print(f'🔧 Catalog updated in {time.perf_counter() - start:.2f}s: '
+              f'{loaded} files loaded, {len(changes) - loaded} removed -> {args.catalog}')
+    if args.command == 'update':
+        if not changes:
+            print(f'✅ Catalog is current ({args.catalog})')
+        fields, mappings = connection.execute(
+            'SELECT (SELECT COUNT(*) FROM fields), (SELECT COUNT(*) FROM field_mappings)').fetchone()
+        print(f'📊 {fields} fields, {mappings} mapped field references')
+        return
+
+    if args.command == 'sql':
+        query, parameters = args.query, ()
+    elif args.command == 'checkboxes':
+        query, parameters = labelled_fields(args)
+    else:
+        query, parameters = unmapped_fields(args)
+
+    start = time.perf_counter()
+    cursor = connection.execute(query, parameters)
+    rows = print_rows(cursor, args.json)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if not args.json:
+        print(f'📊 {len(rows)} rows ({elapsed_ms:.1f} ms)')
+
+if __name__ == '__main__':
+    main()
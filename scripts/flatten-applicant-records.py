@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Flatten Applicant Records to PDF Payloads
+Compiles a flattening plan (Field<T> object paths declared by the section
+interfaces and seen in sample records, or loaded from a saved plan, plus
+id -> PDF field and type coercion tables from the reference data) and streams
+exported {section, data} records through it, writing one flat
+{pdfFieldName: value} payload per record as NDJSON. Field<T> nodes outside the
+plan are still flattened by a full walk of their subtree and reported
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+from sf86_toolkit.constraints import ConstraintTables, iter_form_fields
+from sf86_toolkit.flatten_plan import FlatteningPlan
+from sf86_toolkit.records import iter_records, record_data
+
+DEFAULT_SAMPLE_SIZE = 200
+
+def main():
+    parser = argparse.ArgumentParser(description='Flatten exported applicant records into {pdfFieldName: value} payloads')
+    parser.add_argument('inputs', nargs='*', default=['-'], help='NDJSON or JSON-array record files (- for stdin)')
+    parser.add_argument('--output', help='NDJSON payload path (default: stdout)')
+    parser.add_argument('--plan', help='load a saved plan instead of building one from the interfaces and input')
+    parser.add_argument('--save-plan', help='write the plan, including paths learnt while flattening, to this path')
+    parser.add_argument('--sample', type=int, default=DEFAULT_SAMPLE_SIZE,
+                        help='records whose paths are added to the interface plan when --plan is not given')
+    parser.add_argument('--verify', action='store_true',
+                        help='also walk each record fully and report Field<T> nodes the plan missed')
+    args = parser.parse_args()
+
+    constraints = ConstraintTables.from_references()
+    records = (json.loads(text) for text in iter_records(args.inputs))
+
+    if args.plan:
+        plan = FlatteningPlan.load(constraints, args.plan)
+        sample = []
+    else:
+        plan = FlatteningPlan.from_interfaces(constraints)
+        sample = list(itertools.islice(records, args.sample))
+        for record in sample:
+            plan.learn(record_data(record))
+    print(f'📋 Flattening plan: {plan.path_count()} Field<T> paths', file=sys.stderr)
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    totals = {'records': 0, 'fields': 0, 'unresolved': 0, 'invalid': 0, 'missed': 0}
+    start = time.perf_counter()
+
+    try:
+        for number, record in enumerate(itertools.chain(sample, records)):
+            data = record_data(record)
+            payload, unresolved, invalid, visited = plan.apply(data)
+            report = {
+                'record': number,
+                'section': record.get('section') if isinstance(record, dict) else None,
+                'fields': payload,
+            }
+            if unresolved:
+                report['unresolved'] = unresolved
+            if invalid:
+                report['invalid'] = invalid
+            if args.verify:
+                missed = sum(1 for _ in iter_form_fields(data)) - visited
+                report['missedByPlan'] = missed
+                totals['missed'] += missed
+            output.write(json.dumps(report, ensure_ascii=False) + '\n')
+            totals['records'] += 1
+            totals['fields'] += len(payload)
+            totals['unresolved'] += len(unresolved)
+            totals['invalid'] += len(invalid)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if args.save_plan:
+        plan.save(args.save_plan)
+
+    elapsed = time.perf_counter() - start
+    rate = totals['records'] / elapsed if elapsed else 0
+    print(f"✅ Flattened {totals['records']} records in {elapsed:.2f}s ({rate:,.0f} records/s): "
+          f"{totals['fields']} PDF values, {totals['unresolved']} unresolved ids, "
+          f"{totals['invalid']} object/array values skipped"
+          + (f", {totals['missed']} Field<T> nodes missed" if args.verify else ''), file=sys.stderr)
+    if plan.unplanned:
+        print(f'⚠️  {len(plan.unplanned)} Field<T> paths were not in the plan and were flattened by a full walk, '
+              f'e.g. {min(plan.unplanned)}' + ('' if args.save_plan else ' (--save-plan keeps them)'), file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
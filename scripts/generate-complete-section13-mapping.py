@@ -4,10 +4,26 @@ Generate Complete Section 13 Field Mapping for All 1,086 Fields
 Creates TypeScript interface mappings for every PDF form field
 """
 
+import argparse
 import json
 import os
+import re
 from collections import defaultdict
 
+from sf86_toolkit.json_modules import add_emit_argument, report_json_module, write_json_module
+from sf86_toolkit.mapping_keys import (
+    FIELD_CATEGORIES, build_category_tables, generate_mapping_key, generate_value_key
+)
+
+# Subform segment shared by every field of one subform, e.g. "form1[0].section13_2-2[0]."
+PREFIX_PATTERN = re.compile(r'^form1\[0\]\.[^.]+\.')
+
+# Type of SECTION13_COMPLETE_FIELD_MAPPINGS when emitted as JSON
+SECTION13_MAPPINGS_TYPE = (
+    "Readonly<Record<'TEXT_FIELDS' | 'CHECKBOX_FIELDS' | 'RADIO_FIELDS' | 'DROPDOWN_FIELDS' | 'STRING_VALUES', "
+    "Readonly<Record<string, string>>>>"
+)
+
 def load_reference_data():
     """Load the section-13.json reference data"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,66 +34,7 @@ def load_reference_data():
 
 def generate_field_mappings(data):
     """Generate comprehensive field mappings for all 1,086 fields"""
-    fields_array = data['fields']
-    
-    mappings = {
-        'TEXT_FIELDS': {},
-        'CHECKBOX_FIELDS': {},
-        'RADIO_FIELDS': {},
-        'DROPDOWN_FIELDS': {},
-        'STRING_VALUES': {}
-    }
-    
-    # Process each field
-    for i, field in enumerate(fields_array):
-        field_type = field.get('type', 'unknown')
-        field_name = field.get('name', f'field_{i}')
-        field_value = field.get('value')
-        field_id = field.get('id', '')
-        unique_id = field.get('uniqueId', '')
-        
-        # Generate a clean mapping key
-        mapping_key = generate_mapping_key(field_name, i)
-        
-        # Categorize by field type
-        if field_type == 'PDFTextField':
-            mappings['TEXT_FIELDS'][mapping_key] = field_name
-        elif field_type == 'PDFCheckBox':
-            mappings['CHECKBOX_FIELDS'][mapping_key] = field_name
-        elif field_type == 'PDFRadioGroup':
-            mappings['RADIO_FIELDS'][mapping_key] = field_name
-        elif field_type == 'PDFDropdown':
-            mappings['DROPDOWN_FIELDS'][mapping_key] = field_name
-        
-        # Add string values
-        if isinstance(field_value, str):
-            value_key = generate_value_key(field_value)
-            mappings['STRING_VALUES'][value_key] = field_value
-    
-    return mappings
-
-def generate_mapping_key(field_name, index):
-    """Generate a clean TypeScript-compatible mapping key"""
-    # Replace special characters and make it TypeScript-friendly
-    key = field_name.replace('form1[0].', '').replace('[', '_').replace(']', '').replace('.', '_').replace('#', 'FIELD_').replace('-', '_')
-    
-    # Make it uppercase and add index for uniqueness
-    key = key.upper()
-    
-    # Ensure uniqueness
-    return f"{key}_{index}"
-
-def generate_value_key(value):
-    """Generate a clean key for string values"""
-    # Handle special characters in values
-    key = value.replace('.', '_').replace(' ', '_').replace('(', '').replace(')', '').replace(',', '').replace('#', 'NUM')
-    
-    # Remove non-alphanumeric characters except underscores
-    import re
-    key = re.sub(r'[^a-zA-Z0-9_]', '', key)
-    
-    # Make it uppercase
-    return key.upper()
+    return build_category_tables(enumerate(data['fields']))
 
 def generate_typescript_mappings(mappings):
     """Generate TypeScript mapping code"""
@@ -153,23 +110,168 @@ export const SECTION13_COMPLETE_FIELD_MAPPINGS = {
     
     typescript_code += """  }
 } as const;
+""" + generate_field_counts(mappings)
+    
+    return typescript_code
+
+def split_field_prefix(field_name):
+    """Split a PDF field name into its subform prefix and the name relative to it"""
+    match = PREFIX_PATTERN.match(field_name)
+    if not match:
+        return '', field_name
+    return match.group(0), field_name[match.end():]
+
+def generate_compact_typescript_mappings(mappings):
+    """Generate compact TypeScript mapping code
+
+    Instead of one literal entry per field, emits a table of subform prefixes,
+    a table of prefix-relative field names and, per category, flat
+    [prefix, relative name, field index] triples. Mapping keys are rebuilt with
+    the same rules as generate_mapping_key/generate_value_key when the lookup
+    is first requested.
+    """
+    prefixes = {}
+    relative_names = {}
+    category_triples = {}
+
+    for category in FIELD_CATEGORIES:
+        triples = []
+        for key, field_name in sorted(mappings[category].items()):
+            index = int(key.rsplit('_', 1)[1])
+            if generate_mapping_key(field_name, index) != key:
+                raise ValueError(f'Mapping key {key} cannot be rebuilt from {field_name}')
+
+            prefix, relative = split_field_prefix(field_name)
+            prefix_index = prefixes.setdefault(prefix, len(prefixes))
+            relative_index = relative_names.setdefault(relative, len(relative_names))
+            triples.extend([prefix_index, relative_index, index])
+        category_triples[category] = triples
+
+    string_values = []
+    for key, value in sorted(mappings['STRING_VALUES'].items()):
+        if generate_value_key(value) != key:
+            raise ValueError(f'String value key {key} cannot be rebuilt from {value!r}')
+        string_values.append(value)
+
+    def string_table(values):
+        return ',\n'.join(f'  {json.dumps(value)}' for value in values)
+
+    category_lines = '\n'.join(
+        f"  {category}: [{', '.join(str(n) for n in category_triples[category])}],"
+        for category in FIELD_CATEGORIES
+    )
+
+    typescript_code = """
+// ============================================================================
+// COMPLETE SECTION 13 FIELD MAPPINGS (All 1,086 Fields) - COMPACT FORM
+// ============================================================================
 
+/**
+ * Subform prefixes shared by the PDF field names below
+ */
+const FIELD_PREFIXES: readonly string[] = [
+""" + string_table(prefixes) + """
+];
+
+/**
+ * PDF field names relative to their subform prefix
+ */
+const RELATIVE_FIELD_NAMES: readonly string[] = [
+""" + string_table(relative_names) + """
+];
+
+/**
+ * Flat [prefix index, relative name index, field index] triples per category
+ */
+const COMPACT_FIELD_MAPPINGS = {
+""" + category_lines + """
+} as const;
+
+/**
+ * Distinct string values found in section-13.json
+ */
+const STRING_VALUE_LIST: readonly string[] = [
+""" + string_table(string_values) + """
+];
+
+export type Section13CompleteFieldMappings = Record<
+  keyof typeof COMPACT_FIELD_MAPPINGS | 'STRING_VALUES',
+  Record<string, string>
+>;
+
+const toMappingKey = (fieldName: string, index: number): string =>
+  `${fieldName
+    .split('form1[0].').join('')
+    .replace(/\\[/g, '_')
+    .replace(/\\]/g, '')
+    .replace(/\\./g, '_')
+    .replace(/#/g, 'FIELD_')
+    .replace(/-/g, '_')
+    .toUpperCase()}_${index}`;
+
+const toValueKey = (value: string): string =>
+  value
+    .replace(/\\./g, '_')
+    .replace(/ /g, '_')
+    .replace(/[(),]/g, '')
+    .replace(/#/g, 'NUM')
+    .replace(/[^a-zA-Z0-9_]/g, '')
+    .toUpperCase();
+
+let completeFieldMappings: Section13CompleteFieldMappings | null = null;
+
+/**
+ * Complete field mappings for Section 13 - ALL 1,086 PDF form fields
+ * Same shape as SECTION13_COMPLETE_FIELD_MAPPINGS, expanded on first access
+ */
+export function getSection13CompleteFieldMappings(): Section13CompleteFieldMappings {
+  if (completeFieldMappings) {
+    return completeFieldMappings;
+  }
+
+  const expanded = { STRING_VALUES: {} } as Section13CompleteFieldMappings;
+  for (const [category, triples] of Object.entries(COMPACT_FIELD_MAPPINGS)) {
+    const fields: Record<string, string> = {};
+    for (let i = 0; i < triples.length; i += 3) {
+      const fieldName = FIELD_PREFIXES[triples[i]] + RELATIVE_FIELD_NAMES[triples[i + 1]];
+      fields[toMappingKey(fieldName, triples[i + 2])] = fieldName;
+    }
+    expanded[category as keyof typeof COMPACT_FIELD_MAPPINGS] = fields;
+  }
+  for (const value of STRING_VALUE_LIST) {
+    expanded.STRING_VALUES[toValueKey(value)] = value;
+  }
+
+  completeFieldMappings = expanded;
+  return completeFieldMappings;
+}
+""" + generate_field_counts(mappings)
+
+    return typescript_code
+
+def generate_field_counts(mappings):
+    """Generate the SECTION13_FIELD_COUNTS verification block"""
+    counts = '\n'.join(f'  {category}: {len(mappings[category])},' for category in FIELD_CATEGORIES + ['STRING_VALUES'])
+    total_fields = sum(len(mappings[category]) for category in FIELD_CATEGORIES)
+    return """
 /**
  * Field count verification
  */
 export const SECTION13_FIELD_COUNTS = {
-  TEXT_FIELDS: """ + str(len(mappings['TEXT_FIELDS'])) + """,
-  CHECKBOX_FIELDS: """ + str(len(mappings['CHECKBOX_FIELDS'])) + """,
-  RADIO_FIELDS: """ + str(len(mappings['RADIO_FIELDS'])) + """,
-  DROPDOWN_FIELDS: """ + str(len(mappings['DROPDOWN_FIELDS'])) + """,
-  STRING_VALUES: """ + str(len(mappings['STRING_VALUES'])) + """,
-  TOTAL_FIELDS: """ + str(len(mappings['TEXT_FIELDS']) + len(mappings['CHECKBOX_FIELDS']) + len(mappings['RADIO_FIELDS']) + len(mappings['DROPDOWN_FIELDS'])) + """
+""" + counts + """
+  TOTAL_FIELDS: """ + str(total_fields) + """
 } as const;
 """
-    
-    return typescript_code
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate complete Section 13 field mappings')
+    parser.add_argument('--compact', action='store_true',
+                        help='emit prefix tables plus a lazy expansion helper instead of literal mappings')
+    add_emit_argument(parser)
+    args = parser.parse_args()
+    if args.compact and args.emit != 'ts':
+        parser.error('--compact only applies to --emit ts')
+    
     print('🔧 GENERATING COMPLETE SECTION 13 FIELD MAPPINGS')
     print('=' * 60)
     
@@ -190,12 +292,29 @@ def main():
     print(f'   TOTAL FIELDS: {total_fields}/1086')
     
     # Generate TypeScript code
-    typescript_code = generate_typescript_mappings(mappings)
+    literal_code = generate_typescript_mappings(mappings)
+    if args.compact:
+        typescript_code = generate_compact_typescript_mappings(mappings)
+        literal_size = len(literal_code.encode('utf-8'))
+        compact_size = len(typescript_code.encode('utf-8'))
+        print(f'   Literal module size: {literal_size:,} bytes')
+        print(f'   Compact module size: {compact_size:,} bytes ({literal_size / compact_size:.1f}x smaller)')
+    else:
+        typescript_code = literal_code
     
     # Save to file
     output_path = 'api/interfaces/sections2.0/section13-complete-mappings.ts'
-    with open(output_path, 'w') as f:
-        f.write(typescript_code)
+    if args.emit == 'ts':
+        with open(output_path, 'w') as f:
+            f.write(typescript_code)
+    else:
+        table = {category: dict(sorted(mappings[category].items())) for category in FIELD_CATEGORIES + ['STRING_VALUES']}
+        written = write_json_module(
+            table, output_path, 'SECTION13_COMPLETE_FIELD_MAPPINGS', SECTION13_MAPPINGS_TYPE, args.emit,
+            header_lines=['COMPLETE SECTION 13 FIELD MAPPINGS (All 1,086 Fields)',
+                          'Generated by generate-complete-section13-mapping.py'],
+            footer=generate_field_counts(mappings))
+        report_json_module(table, written, literal_size=len(literal_code.encode('utf-8')))
     
     print(f'\\n✅ COMPLETE MAPPINGS GENERATED!')
     print(f'   Output file: {output_path}')
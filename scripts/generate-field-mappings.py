@@ -9,6 +9,20 @@ import os
 import re
 from collections import defaultdict
 
+# Leading subform segment of a PDF field name, e.g. "form1[0].section13_2[1]"
+SUBFORM_PATTERN = re.compile(r'^(form1\[0\]\.[^.\[]+)\[(\d+)\]')
+
+def split_subform(field_name):
+    """Split a PDF field name into (subform base, entry index, relative name)
+
+    The entry index is the instance suffix of the subform, so
+    "form1[0].section13_2[1].TextField11[0]" is entry 1 of "form1[0].section13_2".
+    """
+    match = SUBFORM_PATTERN.match(field_name)
+    if not match:
+        return None, 0, field_name
+    return match.group(1), int(match.group(2)), field_name[match.end():]
+
 def parse_field_value(value):
     """Parse the logical field path from the value property"""
     if not isinstance(value, str):
@@ -27,6 +41,9 @@ def generate_logical_path(field_name, field_value, section_pattern):
     if len(pdf_parts) < 2:
         return None
 
+    # Multi-entry subforms repeat the same layout; the suffix selects the entry
+    _, entry_index, _ = split_subform(field_name)
+
     # Extract section and field info
     section_part = pdf_parts[1] if len(pdf_parts) > 1 else ''
 
@@ -60,25 +77,25 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     19: 'supervisorNameAlt'
                 }
                 if num in field_map:
-                    return f'section13.federalEmployment.entries[0].{field_map[num]}.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].{field_map[num]}.value'
 
         elif 'RadioButtonList' in field_name:
             radio_num = re.search(r'RadioButtonList\[(\d+)\]', field_name)
             if radio_num:
                 num = int(radio_num.group(1))
                 if num == 0:
-                    return 'section13.federalEmployment.entries[0].employmentType.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].employmentType.value'
                 elif num == 1:
-                    return 'section13.federalEmployment.entries[0].hasAdditionalInfo.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].hasAdditionalInfo.value'
 
         elif 'From_Datefield_Name_2' in field_name:
             date_num = re.search(r'From_Datefield_Name_2\[(\d+)\]', field_name)
             if date_num:
                 num = int(date_num.group(1))
                 if num == 0:
-                    return 'section13.federalEmployment.entries[0].fromDate.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].fromDate.value'
                 elif num == 1:
-                    return 'section13.federalEmployment.entries[0].toDate.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].toDate.value'
 
         elif 'School6_State' in field_name:
             state_num = re.search(r'School6_State\[(\d+)\]', field_name)
@@ -92,7 +109,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     4: 'dutyStateAlt'
                 }
                 if num in state_map:
-                    return f'section13.federalEmployment.entries[0].{state_map[num]}.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].{state_map[num]}.value'
 
         elif 'DropDownList' in field_name:
             dropdown_num = re.search(r'DropDownList(\d+)\[(\d+)\]', field_name)
@@ -106,7 +123,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     20: 'dutyCountry'
                 }
                 if list_num in dropdown_map:
-                    return f'section13.federalEmployment.entries[0].{dropdown_map[list_num]}.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].{dropdown_map[list_num]}.value'
 
         elif 'p3-t68' in field_name:
             phone_num = re.search(r'p3-t68\[(\d+)\]', field_name)
@@ -120,16 +137,16 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     4: 'dutyStation'
                 }
                 if num in phone_map:
-                    return f'section13.federalEmployment.entries[0].{phone_map[num]}.value'
+                    return f'section13.federalEmployment.entries[{entry_index}].{phone_map[num]}.value'
 
         elif '#field' in field_name:
             field_num = re.search(r'#field\[(\d+)\]', field_name)
             if field_num:
                 num = int(field_num.group(1))
-                return f'section13.federalEmployment.entries[0].field{num}.value'
+                return f'section13.federalEmployment.entries[{entry_index}].field{num}.value'
 
         elif 'p13a-1-1cb' in field_name:
-            return 'section13.federalEmployment.entries[0].checkbox.value'
+            return f'section13.federalEmployment.entries[{entry_index}].checkbox.value'
     
     elif 'section13_2' in field_name and 'section13_2-2' not in field_name:
         # Non-Federal Employment (13A.2)
@@ -166,7 +183,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     25: 'employerNameAlt'
                 }
                 if num in field_map:
-                    return f'section13.nonFederalEmployment.entries[0].{field_map[num]}.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].{field_map[num]}.value'
 
         elif 'RadioButtonList' in field_name:
             radio_num = re.search(r'RadioButtonList\[(\d+)\]', field_name)
@@ -178,16 +195,16 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     2: 'isCurrentEmployment'
                 }
                 if num in radio_map:
-                    return f'section13.nonFederalEmployment.entries[0].{radio_map[num]}.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].{radio_map[num]}.value'
 
         elif 'From_Datefield_Name_2' in field_name:
             date_num = re.search(r'From_Datefield_Name_2\[(\d+)\]', field_name)
             if date_num:
                 num = int(date_num.group(1))
                 if num == 0:
-                    return 'section13.nonFederalEmployment.entries[0].fromDate.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].fromDate.value'
                 elif num == 1:
-                    return 'section13.nonFederalEmployment.entries[0].toDate.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].toDate.value'
 
         elif 'School6_State' in field_name:
             state_num = re.search(r'School6_State\[(\d+)\]', field_name)
@@ -203,7 +220,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     6: 'additionalState'
                 }
                 if num in state_map:
-                    return f'section13.nonFederalEmployment.entries[0].{state_map[num]}.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].{state_map[num]}.value'
 
         elif 'DropDownList' in field_name:
             dropdown_num = re.search(r'DropDownList(\d+)\[(\d+)\]', field_name)
@@ -216,7 +233,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     16: 'supervisorCountry'
                 }
                 if list_num in dropdown_map:
-                    return f'section13.nonFederalEmployment.entries[0].{dropdown_map[list_num]}.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].{dropdown_map[list_num]}.value'
 
         elif 'p3-t68' in field_name:
             phone_num = re.search(r'p3-t68\[(\d+)\]', field_name)
@@ -231,13 +248,13 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     5: 'emergencyContact'
                 }
                 if num in phone_map:
-                    return f'section13.nonFederalEmployment.entries[0].{phone_map[num]}.value'
+                    return f'section13.nonFederalEmployment.entries[{entry_index}].{phone_map[num]}.value'
 
         elif '#field' in field_name:
             field_num = re.search(r'#field\[(\d+)\]', field_name)
             if field_num:
                 num = int(field_num.group(1))
-                return f'section13.nonFederalEmployment.entries[0].field{num}.value'
+                return f'section13.nonFederalEmployment.entries[{entry_index}].field{num}.value'
 
         elif 'Table1' in field_name:
             # Handle table fields for employment history
@@ -246,7 +263,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                 table_num = int(table_match.group(1))
                 row_num = int(table_match.group(2))
                 cell_num = int(table_match.group(4))
-                return f'section13.nonFederalEmployment.entries[0].table{table_num}Row{row_num}Cell{cell_num}.value'
+                return f'section13.nonFederalEmployment.entries[{entry_index}].table{table_num}Row{row_num}Cell{cell_num}.value'
     
     elif 'section13_3' in field_name and 'section13_3-2' not in field_name:
         # Self-Employment (13A.3)
@@ -283,7 +300,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     25: 'businessNameAlt'
                 }
                 if num in field_map:
-                    return f'section13.selfEmployment.entries[0].{field_map[num]}.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].{field_map[num]}.value'
 
         elif 'RadioButtonList' in field_name:
             radio_num = re.search(r'RadioButtonList\[(\d+)\]', field_name)
@@ -295,16 +312,16 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     2: 'isCurrentBusiness'
                 }
                 if num in radio_map:
-                    return f'section13.selfEmployment.entries[0].{radio_map[num]}.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].{radio_map[num]}.value'
 
         elif 'From_Datefield_Name_2' in field_name:
             date_num = re.search(r'From_Datefield_Name_2\[(\d+)\]', field_name)
             if date_num:
                 num = int(date_num.group(1))
                 if num == 0:
-                    return 'section13.selfEmployment.entries[0].fromDate.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].fromDate.value'
                 elif num == 1:
-                    return 'section13.selfEmployment.entries[0].toDate.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].toDate.value'
 
         elif 'School6_State' in field_name:
             state_num = re.search(r'School6_State\[(\d+)\]', field_name)
@@ -320,7 +337,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     6: 'additionalState'
                 }
                 if num in state_map:
-                    return f'section13.selfEmployment.entries[0].{state_map[num]}.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].{state_map[num]}.value'
 
         elif 'DropDownList' in field_name:
             dropdown_num = re.search(r'DropDownList(\d+)\[(\d+)\]', field_name)
@@ -333,7 +350,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     11: 'businessCountry3'
                 }
                 if list_num in dropdown_map:
-                    return f'section13.selfEmployment.entries[0].{dropdown_map[list_num]}.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].{dropdown_map[list_num]}.value'
 
         elif 'p3-t68' in field_name:
             phone_num = re.search(r'p3-t68\[(\d+)\]', field_name)
@@ -347,13 +364,13 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     4: 'businessWebsite'
                 }
                 if num in phone_map:
-                    return f'section13.selfEmployment.entries[0].{phone_map[num]}.value'
+                    return f'section13.selfEmployment.entries[{entry_index}].{phone_map[num]}.value'
 
         elif '#field' in field_name:
             field_num = re.search(r'#field\[(\d+)\]', field_name)
             if field_num:
                 num = int(field_num.group(1))
-                return f'section13.selfEmployment.entries[0].field{num}.value'
+                return f'section13.selfEmployment.entries[{entry_index}].field{num}.value'
     
     elif 'section13_4' in field_name:
         # Unemployment (13A.4)
@@ -377,7 +394,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     12: 'additionalInfo'
                 }
                 if num in field_map:
-                    return f'section13.unemployment.entries[0].{field_map[num]}.value'
+                    return f'section13.unemployment.entries[{entry_index}].{field_map[num]}.value'
 
         elif 'RadioButtonList' in field_name:
             radio_num = re.search(r'RadioButtonList\[(\d+)\]', field_name)
@@ -389,7 +406,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     2: 'isCurrentlyUnemployed'
                 }
                 if num in radio_map:
-                    return f'section13.unemployment.entries[0].{radio_map[num]}.value'
+                    return f'section13.unemployment.entries[{entry_index}].{radio_map[num]}.value'
 
         elif 'From_Datefield_Name_2' in field_name:
             date_num = re.search(r'From_Datefield_Name_2\[(\d+)\]', field_name)
@@ -408,7 +425,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     9: 'referenceToDate'
                 }
                 if num in date_map:
-                    return f'section13.unemployment.entries[0].{date_map[num]}.value'
+                    return f'section13.unemployment.entries[{entry_index}].{date_map[num]}.value'
 
         elif 'School6_State' in field_name:
             state_num = re.search(r'School6_State\[(\d+)\]', field_name)
@@ -420,7 +437,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     2: 'additionalState'
                 }
                 if num in state_map:
-                    return f'section13.unemployment.entries[0].{state_map[num]}.value'
+                    return f'section13.unemployment.entries[{entry_index}].{state_map[num]}.value'
 
         elif 'DropDownList' in field_name:
             dropdown_num = re.search(r'DropDownList(\d+)\[(\d+)\]', field_name)
@@ -431,19 +448,19 @@ def generate_logical_path(field_name, field_value, section_pattern):
                     6: 'referenceCountry'
                 }
                 if list_num in dropdown_map:
-                    return f'section13.unemployment.entries[0].{dropdown_map[list_num]}.value'
+                    return f'section13.unemployment.entries[{entry_index}].{dropdown_map[list_num]}.value'
 
         elif 'p3-t68' in field_name:
             phone_num = re.search(r'p3-t68\[(\d+)\]', field_name)
             if phone_num:
                 num = int(phone_num.group(1))
-                return f'section13.unemployment.entries[0].phone{num}.value'
+                return f'section13.unemployment.entries[{entry_index}].phone{num}.value'
 
         elif '#field' in field_name:
             field_num = re.search(r'#field\[(\d+)\]', field_name)
             if field_num:
                 num = int(field_num.group(1))
-                return f'section13.unemployment.entries[0].field{num}.value'
+                return f'section13.unemployment.entries[{entry_index}].field{num}.value'
 
         elif '#area' in field_name:
             # Handle area-specific fields
@@ -451,7 +468,7 @@ def generate_logical_path(field_name, field_value, section_pattern):
             if area_match:
                 area_num = int(area_match.group(1))
                 field_num = int(area_match.group(2))
-                return f'section13.unemployment.entries[0].area{area_num}Field{field_num}.value'
+                return f'section13.unemployment.entries[{entry_index}].area{area_num}Field{field_num}.value'
     
     elif 'section13_5' in field_name:
         # Employment Issues (13A.5)
@@ -661,48 +678,50 @@ def generate_logical_path(field_name, field_value, section_pattern):
 def generate_additional_section_mapping(field_name, section_prefix):
     """Generate mappings for additional section patterns like section13_2-2, section13_3-2"""
 
+    _, entry_index, _ = split_subform(field_name)
+
     if 'TextField11' in field_name:
         field_num = re.search(r'TextField11\[(\d+)\]', field_name)
         if field_num:
             num = int(field_num.group(1))
-            return f'section13.{section_prefix}.entries[0].textField{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].textField{num}.value'
 
     elif 'RadioButtonList' in field_name:
         radio_num = re.search(r'RadioButtonList\[(\d+)\]', field_name)
         if radio_num:
             num = int(radio_num.group(1))
-            return f'section13.{section_prefix}.entries[0].radioButton{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].radioButton{num}.value'
 
     elif 'From_Datefield_Name_2' in field_name:
         date_num = re.search(r'From_Datefield_Name_2\[(\d+)\]', field_name)
         if date_num:
             num = int(date_num.group(1))
-            return f'section13.{section_prefix}.entries[0].dateField{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].dateField{num}.value'
 
     elif 'School6_State' in field_name:
         state_num = re.search(r'School6_State\[(\d+)\]', field_name)
         if state_num:
             num = int(state_num.group(1))
-            return f'section13.{section_prefix}.entries[0].state{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].state{num}.value'
 
     elif 'DropDownList' in field_name:
         dropdown_num = re.search(r'DropDownList(\d+)\[(\d+)\]', field_name)
         if dropdown_num:
             list_num = int(dropdown_num.group(1))
             item_num = int(dropdown_num.group(2))
-            return f'section13.{section_prefix}.entries[0].dropdown{list_num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].dropdown{list_num}.value'
 
     elif 'p3-t68' in field_name:
         phone_num = re.search(r'p3-t68\[(\d+)\]', field_name)
         if phone_num:
             num = int(phone_num.group(1))
-            return f'section13.{section_prefix}.entries[0].phone{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].phone{num}.value'
 
     elif '#field' in field_name:
         field_num = re.search(r'#field\[(\d+)\]', field_name)
         if field_num:
             num = int(field_num.group(1))
-            return f'section13.{section_prefix}.entries[0].field{num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].field{num}.value'
 
     elif 'Table1' in field_name:
         table_match = re.search(r'Table1\[(\d+)\].*Row(\d+)\[(\d+)\].*Cell(\d+)\[(\d+)\]', field_name)
@@ -710,10 +729,149 @@ def generate_additional_section_mapping(field_name, section_prefix):
             table_num = int(table_match.group(1))
             row_num = int(table_match.group(2))
             cell_num = int(table_match.group(4))
-            return f'section13.{section_prefix}.entries[0].table{table_num}Row{row_num}Cell{cell_num}.value'
+            return f'section13.{section_prefix}.entries[{entry_index}].table{table_num}Row{row_num}Cell{cell_num}.value'
 
     return None
 
+def resolve_logical_path(field_name, template_cache):
+    """Resolve a field's logical path, classifying each (subform, field) template only once
+
+    Every instance of a multi-entry subform shares the same layout, so the
+    pattern matching runs for the first instance seen and later entries only
+    substitute their entry index.
+    """
+    base, entry_index, relative = split_subform(field_name)
+    cache_key = (base, relative)
+    
+    if cache_key not in template_cache:
+        canonical_name = f'{base}[0]{relative}' if base else field_name
+        template = generate_logical_path(canonical_name, None, canonical_name)
+        if template and base:
+            template = template.replace('.entries[0].', '.entries[{entry}].', 1)
+        template_cache[cache_key] = template
+    
+    template = template_cache[cache_key]
+    if not template:
+        return None
+    return template.replace('{entry}', str(entry_index))
+
+def split_entry_path(logical_path):
+    """Split "section13.x.entries[N].rest" into (collection, N); (None, None) otherwise"""
+    match = re.match(r'^(.+?)\.entries\[(\d+)\]\.', logical_path)
+    if not match:
+        return None, None
+    return match.group(1), int(match.group(2))
+
+def build_entry_templates(mappings):
+    """Collapse per-entry mappings into entries[0] templates plus per-entry subforms
+
+    Returns (templates, entry_subforms, entry_specific):
+      templates       logical path -> PDF field, with entry collections written as entries[0]
+      entry_subforms  collection -> list of subform prefixes indexed by entry
+      entry_specific  concrete mappings whose template is not present in every entry
+    """
+    entry_subforms = defaultdict(dict)
+    entry_members = defaultdict(lambda: defaultdict(dict))
+    templates = {}
+    
+    for logical_path, pdf_field in mappings.items():
+        collection, entry_index = split_entry_path(logical_path)
+        base, _, relative = split_subform(pdf_field)
+        if collection is None or base is None:
+            templates[logical_path] = pdf_field
+            continue
+        
+        template_path = logical_path.replace(f'.entries[{entry_index}].', '.entries[0].', 1)
+        entry_subforms[collection][entry_index] = f'{base}[{entry_index}]'
+        entry_members[collection][template_path][entry_index] = relative
+    
+    subform_lists = {}
+    entry_specific = {}
+    for collection, subforms in entry_subforms.items():
+        entry_count = max(subforms) + 1
+        complete = len(subforms) == entry_count
+        if complete:
+            subform_lists[collection] = [subforms[i] for i in range(entry_count)]
+        
+        for template_path, relatives in entry_members[collection].items():
+            shared = complete and len(relatives) == entry_count and len(set(relatives.values())) == 1
+            if shared:
+                templates[template_path] = subforms[0] + relatives[0]
+                continue
+            for entry_index, relative in relatives.items():
+                concrete_path = template_path.replace('.entries[0].', f'.entries[{entry_index}].', 1)
+                entry_specific[concrete_path] = subforms[entry_index] + relative
+    
+    return templates, subform_lists, entry_specific
+
+def generate_typescript_templates(templates, entry_subforms, entry_specific):
+    """Generate the templated TypeScript module with its lazy expansion helper"""
+    lines = [
+        '// Auto-generated field mappings from section-13.json',
+        '// Generated by generate-field-mappings.py',
+        '',
+        '/**',
+        ' * One mapping per field template. Keys under a collection listed in',
+        ' * GENERATED_SECTION13_ENTRY_SUBFORMS are written for entries[0] and',
+        ' * expand to every entry of that collection.',
+        ' */',
+        'export const GENERATED_SECTION13_FIELD_MAPPINGS = {',
+    ]
+    for logical_path, pdf_field in sorted(templates.items()):
+        lines.append(f"  '{logical_path}': '{pdf_field}',")
+    lines.append('} as const;')
+    lines.append('')
+    
+    lines.append('/**')
+    lines.append(' * Subform instance backing each entry of a multi-entry collection, by entry index')
+    lines.append(' */')
+    lines.append('export const GENERATED_SECTION13_ENTRY_SUBFORMS: Record<string, readonly string[]> = {')
+    for collection, subforms in sorted(entry_subforms.items()):
+        subform_list = ', '.join(f"'{subform}'" for subform in subforms)
+        lines.append(f"  '{collection}': [{subform_list}],")
+    lines.append('};')
+    lines.append('')
+    
+    lines.append('/**')
+    lines.append(' * Mappings that exist only for some entries of their collection')
+    lines.append(' */')
+    lines.append('export const GENERATED_SECTION13_ENTRY_SPECIFIC_MAPPINGS: Record<string, string> = {')
+    for logical_path, pdf_field in sorted(entry_specific.items()):
+        lines.append(f"  '{logical_path}': '{pdf_field}',")
+    lines.append('};')
+    lines.append('')
+    
+    lines.append('let expandedSection13FieldMappings: Record<string, string> | null = null;')
+    lines.append('')
+    lines.append('/**')
+    lines.append(' * Full logical path -> PDF field lookup, expanded on first access')
+    lines.append(' */')
+    lines.append('export function getExpandedSection13FieldMappings(): Record<string, string> {')
+    lines.append('  if (expandedSection13FieldMappings) {')
+    lines.append('    return expandedSection13FieldMappings;')
+    lines.append('  }')
+    lines.append('')
+    lines.append('  const expanded: Record<string, string> = {};')
+    lines.append('  for (const [logicalPath, pdfField] of Object.entries(GENERATED_SECTION13_FIELD_MAPPINGS)) {')
+    lines.append("    const marker = logicalPath.indexOf('.entries[0].');")
+    lines.append('    const subforms = marker >= 0 ? GENERATED_SECTION13_ENTRY_SUBFORMS[logicalPath.slice(0, marker)] : undefined;')
+    lines.append('    if (!subforms) {')
+    lines.append('      expanded[logicalPath] = pdfField;')
+    lines.append('      continue;')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    const relative = pdfField.slice(subforms[0].length);')
+    lines.append('    subforms.forEach((subform, entryIndex) => {')
+    lines.append("      expanded[logicalPath.replace('.entries[0].', `.entries[${entryIndex}].`)] = subform + relative;")
+    lines.append('    });')
+    lines.append('  }')
+    lines.append('')
+    lines.append('  expandedSection13FieldMappings = Object.assign(expanded, GENERATED_SECTION13_ENTRY_SPECIFIC_MAPPINGS);')
+    lines.append('  return expandedSection13FieldMappings;')
+    lines.append('}')
+    lines.append('')
+    return '\n'.join(lines) + '\n'
+
 def main():
     # Load section-13.json
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -733,6 +891,7 @@ def main():
     mappings = {}
     unmapped_fields = []
     section_stats = defaultdict(int)
+    template_cache = {}
     
     if 'fields' in data and isinstance(data['fields'], list):
         for field in data['fields']:
@@ -740,10 +899,9 @@ def main():
                 continue
             
             field_name = field['name']
-            field_value = field.get('value', '')
             
-            # Generate logical path
-            logical_path = generate_logical_path(field_name, field_value, field_name)
+            # Resolve the logical path once per template, then place it in its entry
+            logical_path = resolve_logical_path(field_name, template_cache)
             
             if logical_path:
                 mappings[logical_path] = field_name
@@ -781,20 +939,20 @@ def main():
     # Generate TypeScript mapping code
     print(f'\n🔧 GENERATING TYPESCRIPT MAPPINGS...')
     
-    ts_mappings = []
-    for logical_path, pdf_field in sorted(mappings.items()):
-        ts_mappings.append(f"  '{logical_path}': '{pdf_field}',")
+    templates, entry_subforms, entry_specific = build_entry_templates(mappings)
+    
+    print(f'   Templates emitted: {len(templates)}')
+    print(f'   Entry collections: {len(entry_subforms)}')
+    if entry_specific:
+        print(f'   Entry-specific mappings (no shared template): {len(entry_specific)}')
     
     # Save TypeScript mappings to file
     output_path = os.path.join(script_dir, 'generated-field-mappings.ts')
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('// Auto-generated field mappings from section-13.json\n')
-            f.write('// Generated by generate-field-mappings.py\n\n')
-            f.write('export const GENERATED_SECTION13_FIELD_MAPPINGS = {\n')
-            f.write('\n'.join(ts_mappings))
-            f.write('\n} as const;\n\n')
+            f.write(generate_typescript_templates(templates, entry_subforms, entry_specific))
             f.write(f'// Total mappings: {len(mappings)}\n')
+            f.write(f'// Templates: {len(templates)}\n')
             f.write(f'// Coverage: {(len(mappings) / len(data.get("fields", [])) * 100):.1f}%\n')
         
         print(f'✅ TypeScript mappings saved to: {output_path}')
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Generate Field Membership Filter
+Writes reports/field-membership/filter.json, a Bloom filter over every valid
+field name and id, and index.json, the exact key -> section index that
+confirms filter positives (see sf86_toolkit/membership_filter.py). Only worth
+shipping to a lookup that does not already hold the reference data.
+Checks that no valid key is rejected and measures the false-positive rate on
+near-miss names that are not fields
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+from sf86_toolkit.membership_filter import DEFAULT_FALSE_POSITIVE_RATE, BloomFilter, exact_field_index
+from sf86_toolkit.references import REPO_ROOT, load_all_section_references
+
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'reports', 'field-membership')
+
+def near_misses(keys):
+    """Invalid keys shaped like real ones: every [n] index of a name bumped past its range"""
+    valid = set(keys)
+    for key in keys:
+        for match in re.finditer(r'\[(\d+)\]', key):
+            candidate = f'{key[:match.start()]}[{int(match.group(1)) + 97}]{key[match.end():]}'
+            if candidate not in valid:
+                yield candidate
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the Bloom membership filter over valid field names and ids')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='directory for filter.json and index.json')
+    parser.add_argument('--false-positive-rate', type=float, default=DEFAULT_FALSE_POSITIVE_RATE,
+                        help='target false-positive rate')
+    args = parser.parse_args()
+
+    print('🔧 GENERATING FIELD MEMBERSHIP FILTER')
+    print('=' * 60)
+    index = exact_field_index(load_all_section_references())
+    bloom = BloomFilter.from_keys(index, args.false_positive_rate)
+
+    rejected = [key for key in index if key not in bloom]
+    if rejected:
+        print(f'❌ {len(rejected)} valid keys rejected by the filter, e.g. {rejected[0]}')
+        raise SystemExit(1)
+
+    misses = list(near_misses(index))
+    start = time.perf_counter()
+    false_positives = sum(1 for key in misses if key in bloom)
+    probe_us = (time.perf_counter() - start) / max(1, len(misses)) * 1e6
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    filter_path = os.path.join(args.output_dir, 'filter.json')
+    index_path = os.path.join(args.output_dir, 'index.json')
+    with open(filter_path, 'w', encoding='utf-8') as f:
+        json.dump(bloom.export(len(index), args.false_positive_rate), f, indent=2)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f'   Keys (names and ids): {len(index):,}')
+    print(f'   Filter: {bloom.bit_count:,} bits ({bloom.bit_count // 8:,} bytes), {bloom.hash_count} probes per lookup')
+    print(f'   Near-miss names: {len(misses):,}, false positives {false_positives:,} '
+          f'({false_positives / max(1, len(misses)):.2%}, target {args.false_positive_rate:.2%})')
+    print(f'   Probe time: {probe_us:.1f} µs per key')
+    print(f'\n✅ Filter written to {filter_path} ({os.path.getsize(filter_path):,} bytes)')
+    print(f'💾 Exact index written to {index_path} ({os.path.getsize(index_path):,} bytes)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Generate Field Neighbour Adjacency Table
+Precomputes same-page k-nearest widgets and same-subform siblings for every
+field in the reference exports and writes reports/field-neighbor-table.json,
+loaded once by the page categorization bridge instead of rescanning field
+metadata per categorized field
+"""
+
+import argparse
+import os
+import time
+
+from sf86_toolkit.neighbors import DEFAULT_NEIGHBOR_COUNT, NeighborTable, build_neighbor_table, save_neighbor_table
+from sf86_toolkit.references import REPO_ROOT, load_all_section_references
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'reports', 'field-neighbor-table.json')
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute same-page nearest neighbours and subform siblings for all fields')
+    parser.add_argument('-k', type=int, default=DEFAULT_NEIGHBOR_COUNT, help='nearest neighbours kept per field')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='path of the adjacency table JSON')
+    args = parser.parse_args()
+
+    print('🔧 GENERATING FIELD NEIGHBOUR TABLE')
+    print('=' * 60)
+
+    references = load_all_section_references()
+    fields = [field for _, data in sorted(references.items()) for field in data['fields']]
+
+    start = time.perf_counter()
+    table = build_neighbor_table(fields, args.k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    save_neighbor_table(table, args.output)
+
+    loaded = NeighborTable.load(args.output)
+    sample = fields[0]['name']
+    print(f'📊 NEIGHBOUR TABLE:')
+    print(f'   Fields: {len(fields)} on {len(set(table["pages"]))} pages')
+    print(f'   Nearest neighbours: k={args.k} ({sum(1 for n in table["neighbors"] if n >= 0)} edges)')
+    print(f'   Subforms: {len(table["subforms"])}')
+    print(f'   Built in {elapsed_ms:.1f} ms, {os.path.getsize(args.output):,} bytes')
+    print(f'   {sample}: {len(loaded.nearest(sample))} nearest, {len(loaded.siblings(sample))} siblings')
+    print(f'✅ Neighbour table saved to: {args.output}')
+
+if __name__ == '__main__':
+    main()
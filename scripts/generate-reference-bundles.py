@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Generate Pre-Indexed Section Reference Bundles
+Writes one slim bundle per section for api/utils/sections-references-loader.ts:
+only the field keys the loader exposes, with labels, types and option lists
+dictionary-encoded and each section's most common value of every other shared
+key moved into section defaults, plus precomputed name / id / uniqueId index
+tables and a trigram index for partial-name lookups
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+from sf86_toolkit.references import REFERENCES_DIR, load_all_section_references
+
+DEFAULT_OUTPUT_DIR = os.path.join(REFERENCES_DIR, 'bundles')
+
+# FieldReference keys kept in the bundle; rect, value and the healing/detection
+# bookkeeping are not read through the loader
+BUNDLE_FIELD_KEYS = ['id', 'name', 'page', 'label', 'type', 'maxLength', 'options', 'section', 'confidence', 'uniqueId']
+
+# Keys stored as indexes into per-bundle dictionaries of distinct values
+DICTIONARY_KEYS = ['label', 'type', 'options']
+# Keys never moved into section defaults (unique per field)
+IDENTITY_KEYS = {'id', 'name', 'uniqueId'}
+
+# Trigrams found in more than this share of a section's fields barely narrow a
+# search, so they are listed as common instead of getting a posting list
+COMMON_TRIGRAM_SHARE = 0.25
+MIN_COMMON_POSTINGS = 8
+
+def normalize_field_id(field_id):
+    """Same normalization as findFieldById: drop the first ' 0 R' suffix"""
+    return field_id.replace(' 0 R', '', 1)
+
+def name_trigrams(name):
+    """Distinct 3-character substrings of a field name"""
+    return {name[i:i + 3] for i in range(len(name) - 2)}
+
+def slim_field(field):
+    return {key: field[key] for key in BUNDLE_FIELD_KEYS if key in field}
+
+def encode_fields(fields):
+    """(encoded fields, dictionaries, defaults) for slim fields
+
+    Values of DICTIONARY_KEYS become indexes into dictionaries[key] (distinct
+    values in first-occurrence order). A key every field carries gets the
+    most common (encoded) value as the section default, and fields holding
+    the default omit it; decode_field reverses both steps.
+    """
+    dictionaries = {key: [] for key in DICTIONARY_KEYS}
+    codes = {key: {} for key in DICTIONARY_KEYS}
+    encoded = []
+    for field in fields:
+        field = dict(field)
+        for key in DICTIONARY_KEYS:
+            if key in field:
+                value = json.dumps(field[key], ensure_ascii=False)
+                if value not in codes[key]:
+                    codes[key][value] = len(dictionaries[key])
+                    dictionaries[key].append(field[key])
+                field[key] = codes[key][value]
+        encoded.append(field)
+
+    defaults = {}
+    for key in BUNDLE_FIELD_KEYS:
+        if key in IDENTITY_KEYS or not encoded or not all(key in field for field in encoded):
+            continue
+        counts = Counter(json.dumps(field[key]) for field in encoded)
+        value, count = counts.most_common(1)[0]
+        if count > 1:
+            defaults[key] = json.loads(value)
+    for field in encoded:
+        for key, value in defaults.items():
+            if field[key] == value:
+                del field[key]
+    return encoded, dictionaries, defaults
+
+def decode_field(bundle, position):
+    """Python mirror of the loader's decodeField: the full slim field at a position"""
+    field = dict(bundle['defaults'], **bundle['fields'][position])
+    for key, values in bundle['dictionaries'].items():
+        if key in field:
+            field[key] = values[field[key]]
+    return {key: field[key] for key in BUNDLE_FIELD_KEYS if key in field}
+
+def build_first_occurrence_index(values):
+    """value -> index of its first occurrence, matching Array.find semantics"""
+    index = {}
+    for position, value in enumerate(values):
+        if value not in index:
+            index[value] = position
+    return index
+
+def build_trigram_index(names):
+    """Posting lists (ascending field indexes) for selective trigrams
+
+    Returns (postings, common): common trigrams occur in too many names to be
+    worth indexing; a query made only of common trigrams falls back to a scan.
+    """
+    postings = {}
+    for position, name in enumerate(names):
+        for trigram in name_trigrams(name):
+            postings.setdefault(trigram, []).append(position)
+
+    limit = max(MIN_COMMON_POSTINGS, int(len(names) * COMMON_TRIGRAM_SHARE))
+    common = sorted(trigram for trigram, positions in postings.items() if len(positions) > limit)
+    selective = {trigram: postings[trigram] for trigram in sorted(postings) if len(postings[trigram]) <= limit}
+    return selective, common
+
+def build_bundle(data):
+    fields = [slim_field(field) for field in data['fields']]
+    names = [field['name'] for field in fields]
+    trigrams, common_trigrams = build_trigram_index(names)
+    encoded, dictionaries, defaults = encode_fields(fields)
+    return {
+        'metadata': data['metadata'],
+        'dictionaries': dictionaries,
+        'defaults': defaults,
+        'fields': encoded,
+        'index': {
+            'byName': build_first_occurrence_index(names),
+            'byId': build_first_occurrence_index(normalize_field_id(field['id']) for field in fields),
+            'byUniqueId': build_first_occurrence_index(field['uniqueId'] for field in fields if 'uniqueId' in field),
+            'trigrams': trigrams,
+            'commonTrigrams': common_trigrams,
+        },
+    }
+
+def find_partial(bundle, partial_name):
+    """Python mirror of findFieldsByPartialName over a bundle"""
+    fields = bundle['fields']
+    index = bundle['index']
+    query = name_trigrams(partial_name)
+    selective = [index['trigrams'].get(trigram) for trigram in query if trigram not in index['commonTrigrams']]
+    if len(partial_name) < 3 or not selective:
+        candidates = range(len(fields))
+    elif any(positions is None for positions in selective):
+        return []
+    else:
+        candidates = set.intersection(*(set(positions) for positions in selective))
+    return [fields[i] for i in sorted(candidates) if partial_name in fields[i]['name']]
+
+def verify_bundle(bundle, data):
+    """Every field must decode to its slim export and every indexed lookup must
+    agree with the linear scan it replaces"""
+    errors = 0
+    fields = data['fields']
+    for position, field in enumerate(fields):
+        if decode_field(bundle, position) != slim_field(field):
+            errors += 1
+        name, uid = field['name'], field.get('uniqueId')
+        expected = next(f for f in fields if f['name'] == name)
+        if bundle['fields'][bundle['index']['byName'][name]]['id'] != expected['id']:
+            errors += 1
+        clean_id = normalize_field_id(field['id'])
+        expected = next(f for f in fields if normalize_field_id(f['id']) == clean_id)
+        if bundle['fields'][bundle['index']['byId'][clean_id]]['name'] != expected['name']:
+            errors += 1
+        if uid is not None:
+            expected = next(f for f in fields if f.get('uniqueId') == uid)
+            if bundle['fields'][bundle['index']['byUniqueId'][uid]]['id'] != expected['id']:
+                errors += 1
+        # Partial queries: the leaf segment and a slice crossing the parent boundary
+        for partial in (name.rpartition('.')[2], name[len(name) // 3:len(name) // 3 + 12]):
+            expected_ids = [f['id'] for f in fields if partial in f['name']]
+            if [f['id'] for f in find_partial(bundle, partial)] != expected_ids:
+                errors += 1
+    return errors
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate pre-indexed section reference bundles for the references loader')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='directory for the section-N.json bundles')
+    parser.add_argument('--skip-verify', action='store_true', help='do not cross-check indexes against linear scans')
+    args = parser.parse_args()
+
+    print('🔧 GENERATING PRE-INDEXED REFERENCE BUNDLES')
+    print('=' * 60)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    source_bytes = 0
+    bundle_bytes = 0
+
+    for section_id, data in sorted(load_all_section_references().items()):
+        bundle = build_bundle(data)
+        if not args.skip_verify:
+            errors = verify_bundle(bundle, data)
+            if errors:
+                print(f'❌ Section {section_id}: {errors} decoded fields or indexed lookups disagree with the export')
+                raise SystemExit(1)
+
+        output_path = os.path.join(args.output_dir, f'section-{section_id}.json')
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(bundle, f, separators=(',', ':'), ensure_ascii=False)
+
+        size = os.path.getsize(output_path)
+        source_size = os.path.getsize(os.path.join(REFERENCES_DIR, f'section-{section_id}.json'))
+        source_bytes += source_size
+        bundle_bytes += size
+        index = bundle['index']
+        print(f'   Section {section_id:>2}: {len(bundle["fields"]):>5} fields  '
+              f'{len(bundle["dictionaries"]["label"]):>4} labels  {len(index["trigrams"]):>5} trigrams  '
+              f'{source_size:>10,} -> {size:>9,} bytes')
+
+    print(f'\n✅ REFERENCE BUNDLES GENERATED!')
+    print(f'   Source exports: {source_bytes:,} bytes')
+    print(f'   Bundles: {bundle_bytes:,} bytes')
+    print(f'   Output: {args.output_dir}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Generate Consumer Projections of Section References
+Writes api/sections-references/projections/<consumer>/section-N.json for
+every consumer declared in projections/schema.json, keeping only the
+metadata and field keys that consumer reads, and verifies each projection
+against the canonical export. With --check nothing is written and stale or
+inconsistent projections fail the run
+
+    python3 generate-reference-projections.py
+    python3 generate-reference-projections.py --check
+"""
+
+import argparse
+import json
+import os
+
+from sf86_toolkit.projections import (PROJECTIONS_DIR, load_projection_schemas, project_section, projection_errors,
+                                      projection_path)
+from sf86_toolkit.references import load_all_section_references, reference_path
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate per-consumer projections of the section reference exports')
+    parser.add_argument('--output-dir', default=PROJECTIONS_DIR, help='projections directory')
+    parser.add_argument('--consumers', help='comma-separated consumer names (default: all in schema.json)')
+    parser.add_argument('--check', action='store_true', help='verify the written projections instead of writing')
+    args = parser.parse_args()
+
+    schemas = load_projection_schemas()
+    names = args.consumers.split(',') if args.consumers else list(schemas)
+    unknown = [name for name in names if name not in schemas]
+    if unknown:
+        print(f"❌ Unknown consumers: {', '.join(unknown)} (declared: {', '.join(schemas)})")
+        raise SystemExit(1)
+    references = load_all_section_references()
+
+    print('🔍 CHECKING REFERENCE PROJECTIONS' if args.check else '🔧 GENERATING REFERENCE PROJECTIONS')
+    print('=' * 60)
+    failures = 0
+    source_bytes = sum(os.path.getsize(reference_path(section_id)) for section_id in references)
+
+    for name in names:
+        schema = schemas[name]
+        total_bytes = 0
+        for section_id, data in sorted(references.items()):
+            path = projection_path(name, section_id, args.output_dir)
+            if args.check:
+                if not os.path.exists(path):
+                    errors = ['missing']
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        errors = projection_errors(json.load(f), data, schema)
+            else:
+                projection = project_section(data, schema)
+                errors = projection_errors(projection, data, schema)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(projection, f, separators=(',', ':'), ensure_ascii=False)
+            if errors:
+                failures += 1
+                print(f'❌ {name} section {section_id}: ' + '; '.join(errors[:3]) +
+                      (f' (+{len(errors) - 3} more)' if len(errors) > 3 else ''))
+            if os.path.exists(path):
+                total_bytes += os.path.getsize(path)
+        print(f"   {name:<12} {', '.join(schema['fields']):<28} {total_bytes:>10,} bytes "
+              f'({total_bytes / source_bytes:.1%} of the exports)')
+
+    if failures:
+        print(f'\n❌ {failures} projections are inconsistent with the exports'
+              + (' (run without --check to regenerate)' if args.check else ''))
+        raise SystemExit(1)
+    print(f'\n✅ {len(names)} consumer projections consistent with {len(references)} section exports')
+
+if __name__ == '__main__':
+    main()
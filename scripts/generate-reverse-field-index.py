@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Generate Reverse Field Index (PDF name / uniqueId -> logical key)
+Builds minimal perfect hashes over every PDF field name and uniqueId in the
+30 reference exports and emits them as compact integer tables with an O(1)
+TypeScript lookup
+"""
+
+import argparse
+import json
+import os
+
+from sf86_toolkit.code_split import chunk_for_field
+from sf86_toolkit.mapping_keys import FIELD_CATEGORIES, FIELD_TYPE_CATEGORIES
+from sf86_toolkit.perfect_hash import (
+    TYPESCRIPT_RUNTIME, build_minimal_perfect_hash, candidate_slot, encode_uint_array, lookup_slot,
+    slot_fingerprints
+)
+from sf86_toolkit.references import REPO_ROOT, load_all_section_references
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'api', 'interfaces', 'sections2.0', 'mappings', 'reverse-field-index.ts')
+
+# Category code 0 marks fields outside the four mapped PDF types
+CATEGORY_CODES = [''] + FIELD_CATEGORIES
+
+def collect_fields(references):
+    """One record per distinct PDF field name, in section/export order
+
+    Widgets that share a name (radio options exported as separate fields)
+    resolve to their first occurrence. The logical key is the
+    CATEGORY.MAPPING_KEY path into the generated mapping tables, rebuilt at
+    lookup time from the name, category and index in the section export.
+    """
+    records = []
+    seen_names = set()
+    for section_id, data in sorted(references.items()):
+        for index, field in enumerate(data['fields']):
+            name = field['name']
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+
+            category = FIELD_TYPE_CATEGORIES.get(field.get('type'), '')
+            parent, _, leaf = name.rpartition('.')
+            chunk_id, _, _ = chunk_for_field(section_id, name)
+            records.append({
+                'name': name,
+                'parent': parent,
+                'leaf': leaf,
+                'uniqueId': field.get('uniqueId', ''),
+                'section': section_id,
+                'chunk': chunk_id,
+                'category': category,
+                'index': index,
+            })
+    return records
+
+def build_reverse_index(records):
+    """Order records by PDF-name slot and hash uniqueIds onto the same records
+
+    Names need no fingerprints: the record at a name's slot stores the name
+    itself (as parent/leaf table indexes), so lookups compare it directly.
+    uniqueIds are not stored, so their slots carry a 64-bit fingerprint.
+    """
+    names = [record['name'] for record in records]
+    name_displacements, name_slots, _ = build_minimal_perfect_hash(names)
+
+    ordered = [None] * len(records)
+    for record, slot in zip(records, name_slots):
+        ordered[slot] = record
+
+    # uniqueIds may repeat across widgets; the first record wins, as for names
+    unique_records = {}
+    for field_index, record in enumerate(ordered):
+        if record['uniqueId'] and record['uniqueId'] not in unique_records:
+            unique_records[record['uniqueId']] = field_index
+    unique_ids = list(unique_records)
+    unique_displacements, unique_slots, unique_hashes = build_minimal_perfect_hash(unique_ids)
+    unique_base, unique_check = slot_fingerprints(unique_ids, unique_slots, unique_hashes)
+    unique_to_field = [0] * len(unique_ids)
+    for unique_id, slot in zip(unique_ids, unique_slots):
+        unique_to_field[slot] = unique_records[unique_id]
+
+    return {
+        'records': ordered,
+        'nameDisplacements': name_displacements,
+        'uniqueId': (unique_displacements, unique_base, unique_check),
+        'uniqueIdToField': unique_to_field,
+    }
+
+def lookup_pdf_name(index, name):
+    """Python mirror of lookupByPdfName: the record for name, or None"""
+    records = index['records']
+    if not records:
+        return None
+    record = records[candidate_slot(name, index['nameDisplacements'], len(records))]
+    return record if record['name'] == name else None
+
+def lookup_unique_id(index, unique_id):
+    """Python mirror of lookupByUniqueId: the record for unique_id, or None"""
+    slot = lookup_slot(unique_id, *index['uniqueId'])
+    return None if slot is None else index['records'][index['uniqueIdToField'][slot]]
+
+def verify_reverse_index(index, references):
+    """Every name and uniqueId must resolve to its record; altered keys must miss"""
+    errors = 0
+    for data in references.values():
+        for field in data['fields']:
+            by_name = lookup_pdf_name(index, field['name'])
+            by_unique_id = lookup_unique_id(index, field['uniqueId'])
+            if by_name is None or by_name['name'] != field['name']:
+                errors += 1
+            if by_unique_id is None or by_unique_id['uniqueId'] != field['uniqueId']:
+                errors += 1
+            if lookup_pdf_name(index, field['name'] + '#') or lookup_unique_id(index, field['uniqueId'] + '#'):
+                errors += 1
+    return errors
+
+def render_typescript(index):
+    """Render the reverse index module: base64 integer tables plus lookups"""
+    records = index['records']
+    parents = list(dict.fromkeys(record['parent'] for record in records))
+    leaves = list(dict.fromkeys(record['leaf'] for record in records))
+    chunk_ids = list(dict.fromkeys(record['chunk'] for record in records))
+    parent_codes = {parent: code for code, parent in enumerate(parents)}
+    leaf_codes = {leaf: code for code, leaf in enumerate(leaves)}
+    chunk_codes = {chunk_id: code for code, chunk_id in enumerate(chunk_ids)}
+    unique_displacements, unique_base, unique_check = index['uniqueId']
+
+    def column(key, codes=None):
+        return [codes[record[key]] if codes else record[key] for record in records]
+
+    return f"""// Reverse field index: PDF field name / uniqueId -> logical key
+// Generated by generate-reverse-field-index.py
+{TYPESCRIPT_RUNTIME}
+export interface ReverseFieldEntry {{
+  section: number;
+  chunk: string;
+  pdfName: string;
+  logicalKey: string;
+}}
+
+const CHUNK_IDS: readonly string[] = {json.dumps(chunk_ids)};
+const CATEGORIES: readonly string[] = {json.dumps(CATEGORY_CODES)};
+
+const ENCODED = {{
+  parents: {json.dumps(json.dumps(parents, separators=(',', ':')))},
+  leaves: {json.dumps(json.dumps(leaves, separators=(',', ':')))},
+  nameDisplacements: '{encode_uint_array(index['nameDisplacements'], 2)}',
+  uniqueIdDisplacements: '{encode_uint_array(unique_displacements, 2)}',
+  uniqueIdBaseHashes: '{encode_uint_array(unique_base, 4)}',
+  uniqueIdCheckHashes: '{encode_uint_array(unique_check, 4)}',
+  uniqueIdToField: '{encode_uint_array(index['uniqueIdToField'], 2)}',
+  parentCodes: '{encode_uint_array(column('parent', parent_codes), 2)}',
+  leafCodes: '{encode_uint_array(column('leaf', leaf_codes), 2)}',
+  sections: '{encode_uint_array(column('section'), 1)}',
+  chunks: '{encode_uint_array(column('chunk', chunk_codes), 1)}',
+  categories: '{encode_uint_array(column('category', {c: i for i, c in enumerate(CATEGORY_CODES)}), 1)}',
+  sectionIndexes: '{encode_uint_array(column('index'), 2)}',
+}};
+
+interface DecodedIndex {{
+  parents: string[];
+  leaves: string[];
+  nameDisplacements: Uint16Array;
+  uniqueIds: PerfectHashTable;
+  uniqueIdToField: Uint16Array;
+  parentCodes: Uint16Array;
+  leafCodes: Uint16Array;
+  sections: Uint8Array;
+  chunks: Uint8Array;
+  categories: Uint8Array;
+  sectionIndexes: Uint16Array;
+}}
+
+let decoded: DecodedIndex | null = null;
+
+const getIndex = (): DecodedIndex => {{
+  if (!decoded) {{
+    decoded = {{
+      parents: JSON.parse(ENCODED.parents),
+      leaves: JSON.parse(ENCODED.leaves),
+      nameDisplacements: decodeUint16(ENCODED.nameDisplacements),
+      uniqueIds: {{
+        displacements: decodeUint16(ENCODED.uniqueIdDisplacements),
+        baseHashes: decodeUint32(ENCODED.uniqueIdBaseHashes),
+        checkHashes: decodeUint32(ENCODED.uniqueIdCheckHashes),
+      }},
+      uniqueIdToField: decodeUint16(ENCODED.uniqueIdToField),
+      parentCodes: decodeUint16(ENCODED.parentCodes),
+      leafCodes: decodeUint16(ENCODED.leafCodes),
+      sections: decodeBytes(ENCODED.sections),
+      chunks: decodeBytes(ENCODED.chunks),
+      categories: decodeBytes(ENCODED.categories),
+      sectionIndexes: decodeUint16(ENCODED.sectionIndexes),
+    }};
+  }}
+  return decoded;
+}};
+
+const pdfNameAt = (index: DecodedIndex, fieldIndex: number): string => {{
+  const parent = index.parents[index.parentCodes[fieldIndex]];
+  const leaf = index.leaves[index.leafCodes[fieldIndex]];
+  return parent ? `${{parent}}.${{leaf}}` : leaf;
+}};
+
+// Same rules as generate_mapping_key in scripts/sf86_toolkit/mapping_keys.py
+const toMappingKey = (fieldName: string, index: number): string =>
+  `${{fieldName
+    .split('form1[0].').join('')
+    .replace(/\\[/g, '_')
+    .replace(/\\]/g, '')
+    .replace(/\\./g, '_')
+    .replace(/#/g, 'FIELD_')
+    .replace(/-/g, '_')
+    .toUpperCase()}}_${{index}}`;
+
+const entryAt = (index: DecodedIndex, fieldIndex: number, pdfName: string): ReverseFieldEntry => {{
+  const category = CATEGORIES[index.categories[fieldIndex]];
+  return {{
+    section: index.sections[fieldIndex],
+    chunk: CHUNK_IDS[index.chunks[fieldIndex]],
+    pdfName,
+    logicalKey: category ? `${{category}}.${{toMappingKey(pdfName, index.sectionIndexes[fieldIndex])}}` : pdfName,
+  }};
+}};
+
+/**
+ * Resolve a PDF field name (e.g. "form1[0].Sections1-6[0].TextField11[0]")
+ */
+export function lookupByPdfName(name: string): ReverseFieldEntry | null {{
+  const index = getIndex();
+  const count = index.nameDisplacements.length ? index.parentCodes.length : 0;
+  if (count === 0) return null;
+  const slot = candidateSlot(index.nameDisplacements, count, name);
+  return pdfNameAt(index, slot) === name ? entryAt(index, slot, name) : null;
+}}
+
+/**
+ * Resolve a reference uniqueId
+ */
+export function lookupByUniqueId(uniqueId: string): ReverseFieldEntry | null {{
+  const index = getIndex();
+  const slot = lookupSlot(index.uniqueIds, uniqueId);
+  if (slot < 0) return null;
+  const fieldIndex = index.uniqueIdToField[slot];
+  return entryAt(index, fieldIndex, pdfNameAt(index, fieldIndex));
+}}
+
+export const REVERSE_INDEX_FIELD_COUNT = {len(records)};
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the PDF name / uniqueId reverse lookup module')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='path of the generated TypeScript module')
+    args = parser.parse_args()
+
+    print('🔧 GENERATING REVERSE FIELD INDEX')
+    print('=' * 60)
+
+    references = load_all_section_references()
+    records = collect_fields(references)
+    index = build_reverse_index(records)
+
+    errors = verify_reverse_index(index, references)
+    if errors:
+        print(f'❌ Reverse index verification failed: {errors} lookups wrong')
+        raise SystemExit(1)
+
+    typescript_code = render_typescript(index)
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(typescript_code)
+
+    name_displacements = index['nameDisplacements']
+    unique_displacements = index['uniqueId'][0]
+    print(f'📊 REVERSE INDEX:')
+    print(f'   PDF names: {len(records)} ({len(name_displacements)} buckets, max displacement {max(name_displacements, default=0)})')
+    print(f'   uniqueIds: {len(index["uniqueIdToField"])} ({len(unique_displacements)} buckets, max displacement {max(unique_displacements, default=0)})')
+    print(f'   Module size: {len(typescript_code.encode("utf-8")):,} bytes')
+    print(f'✅ Reverse index saved to: {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Generate Code-Split Field Mapping Modules
+Writes one mapping module per section (per subsection for Section 13) plus an
+index manifest of dynamic import() loaders, so each form step only loads the
+mapping chunk it renders
+"""
+
+import argparse
+import os
+
+from sf86_toolkit.code_split import (
+    MAPPING_TABLES_TYPE, ensure_parent_dir, render_chunk_module, render_manifest, split_section_fields
+)
+from sf86_toolkit.json_modules import add_emit_argument, write_json_module
+from sf86_toolkit.mapping_keys import FIELD_CATEGORIES, build_category_tables
+from sf86_toolkit.references import REPO_ROOT, load_all_section_references
+
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'api', 'interfaces', 'sections2.0', 'mappings')
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate per-section field mapping modules with a lazy-load manifest')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='directory for the chunk modules and index.ts')
+    parser.add_argument('--sections', type=int, nargs='*', help='only regenerate these sections (manifest still lists all)')
+    add_emit_argument(parser)
+    args = parser.parse_args()
+
+    print('🔧 GENERATING CODE-SPLIT FIELD MAPPING MODULES')
+    print('=' * 60)
+
+    references = load_all_section_references()
+    manifest_entries = []
+    total_bytes = 0
+    largest_chunk = (None, 0)
+
+    for section_id, data in sorted(references.items()):
+        section_name = data['metadata'].get('sectionName', f'Section {section_id}').strip()
+        chunks = split_section_fields(section_id, enumerate(data['fields']))
+
+        for chunk_id, chunk in chunks.items():
+            label = f"{chunk_id} {chunk['label']}" if chunk['label'] else section_name
+            field_count = len(chunk['fields'])
+            manifest_entries.append({
+                'id': chunk_id,
+                'section': section_id,
+                'label': label,
+                'module': chunk['module'],
+                'fieldCount': field_count,
+            })
+
+            if args.sections and section_id not in args.sections:
+                continue
+
+            tables = build_category_tables(chunk['fields'])
+            title = f'Section {section_id} - {label} field mappings'
+            output_path = os.path.join(args.output_dir, chunk['module'] + '.ts')
+            ensure_parent_dir(output_path)
+
+            if args.emit == 'ts':
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(render_chunk_module(title, tables, field_count))
+                written = [output_path]
+            else:
+                table = {category: dict(sorted(tables[category].items())) for category in FIELD_CATEGORIES + ['STRING_VALUES']}
+                written = write_json_module(
+                    table, output_path, 'FIELD_MAPPINGS', MAPPING_TABLES_TYPE, args.emit,
+                    header_lines=[title, 'Generated by generate-split-field-mappings.py'],
+                    footer=f'\nexport const FIELD_COUNT = {field_count};\n')
+
+            chunk_bytes = sum(os.path.getsize(path) for path in written)
+            total_bytes += chunk_bytes
+            if chunk_bytes > largest_chunk[1]:
+                largest_chunk = (chunk_id, chunk_bytes)
+            print(f'   {chunk_id:<14} {field_count:>5} fields  {chunk_bytes:>9,} bytes  {chunk["module"]}')
+
+    manifest_path = os.path.join(args.output_dir, 'index.ts')
+    ensure_parent_dir(manifest_path)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        f.write(render_manifest(manifest_entries))
+
+    print(f'\n✅ CODE-SPLIT MAPPINGS GENERATED!')
+    print(f'   Chunks: {len(manifest_entries)}')
+    print(f'   Fields: {sum(entry["fieldCount"] for entry in manifest_entries)}')
+    print(f'   Written: {total_bytes:,} bytes')
+    if largest_chunk[0]:
+        print(f'   Largest chunk: {largest_chunk[0]} ({largest_chunk[1]:,} bytes)')
+    print(f'   Manifest: {manifest_path}')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,11 @@
 // Auto-generated field mappings from section-13.json
 // Generated by generate-field-mappings.py
 
+/**
+ * One mapping per field template. Keys under a collection listed in
+ * GENERATED_SECTION13_ENTRY_SUBFORMS are written for entries[0] and
+ * expand to every entry of that collection.
+ */
 export const GENERATED_SECTION13_FIELD_MAPPINGS = {
   'section13.employmentRecordIssues.additionalFromDate.value': 'form1[0].section13_5[0].From_Datefield_Name_2[6]',
   'section13.employmentRecordIssues.additionalInfo.value': 'form1[0].section13_5[0].TextField11[11]',
@@ -97,83 +102,83 @@ export const GENERATED_SECTION13_FIELD_MAPPINGS = {
   'section13.federalEmployment.entries[0].supervisorTitle.value': 'form1[0].section_13_1-2[0].TextField11[2]',
   'section13.federalEmployment.entries[0].supervisorZip.value': 'form1[0].section_13_1-2[0].TextField11[5]',
   'section13.federalEmployment.entries[0].toDate.value': 'form1[0].section_13_1-2[0].From_Datefield_Name_2[1]',
-  'section13.nonFederalEmployment.entries[0].additionalInfo.value': 'form1[0].section13_2[2].TextField11[12]',
-  'section13.nonFederalEmployment.entries[0].additionalPhone.value': 'form1[0].section13_2[2].p3-t68[4]',
-  'section13.nonFederalEmployment.entries[0].additionalState.value': 'form1[0].section13_2[2].School6_State[6]',
-  'section13.nonFederalEmployment.entries[0].countryCode.value': 'form1[0].section13_2[2].DropDownList4[1]',
-  'section13.nonFederalEmployment.entries[0].dutyCity.value': 'form1[0].section13_2[2].TextField11[10]',
-  'section13.nonFederalEmployment.entries[0].dutyCountry.value': 'form1[0].section13_2[2].DropDownList15[0]',
-  'section13.nonFederalEmployment.entries[0].dutyPhone.value': 'form1[0].section13_2[2].p3-t68[1]',
-  'section13.nonFederalEmployment.entries[0].dutyState.value': 'form1[0].section13_2[2].School6_State[1]',
-  'section13.nonFederalEmployment.entries[0].dutyStateAlt.value': 'form1[0].section13_2[2].School6_State[4]',
-  'section13.nonFederalEmployment.entries[0].dutyStreet.value': 'form1[0].section13_2[2].TextField11[9]',
-  'section13.nonFederalEmployment.entries[0].dutyZip.value': 'form1[0].section13_2[2].TextField11[11]',
-  'section13.nonFederalEmployment.entries[0].emergencyContact.value': 'form1[0].section13_2[2].p3-t68[5]',
-  'section13.nonFederalEmployment.entries[0].employerAddress2.value': 'form1[0].section13_2[2].TextField11[20]',
-  'section13.nonFederalEmployment.entries[0].employerApoFpo.value': 'form1[0].section13_2[2].TextField11[23]',
-  'section13.nonFederalEmployment.entries[0].employerCity.value': 'form1[0].section13_2[2].TextField11[5]',
-  'section13.nonFederalEmployment.entries[0].employerCity2.value': 'form1[0].section13_2[2].TextField11[21]',
-  'section13.nonFederalEmployment.entries[0].employerCountry.value': 'form1[0].section13_2[2].DropDownList13[0]',
-  'section13.nonFederalEmployment.entries[0].employerName.value': 'form1[0].section13_2[2].TextField11[0]',
-  'section13.nonFederalEmployment.entries[0].employerNameAlt.value': 'form1[0].section13_2[2].TextField11[25]',
-  'section13.nonFederalEmployment.entries[0].employerPhone.value': 'form1[0].section13_2[2].p3-t68[0]',
-  'section13.nonFederalEmployment.entries[0].employerState.value': 'form1[0].section13_2[2].School6_State[0]',
-  'section13.nonFederalEmployment.entries[0].employerStateAlt.value': 'form1[0].section13_2[2].School6_State[3]',
-  'section13.nonFederalEmployment.entries[0].employerStreet.value': 'form1[0].section13_2[2].TextField11[4]',
-  'section13.nonFederalEmployment.entries[0].employerStreet2.value': 'form1[0].section13_2[2].TextField11[22]',
-  'section13.nonFederalEmployment.entries[0].employerZip.value': 'form1[0].section13_2[2].TextField11[6]',
-  'section13.nonFederalEmployment.entries[0].employerZip2.value': 'form1[0].section13_2[2].TextField11[24]',
-  'section13.nonFederalEmployment.entries[0].employmentType.value': 'form1[0].section13_2[2].RadioButtonList[0]',
-  'section13.nonFederalEmployment.entries[0].extension.value': 'form1[0].section13_2[2].TextField11[8]',
-  'section13.nonFederalEmployment.entries[0].field16.value': 'form1[0].section13_2[2].#field[16]',
-  'section13.nonFederalEmployment.entries[0].field17.value': 'form1[0].section13_2[2].#field[17]',
-  'section13.nonFederalEmployment.entries[0].field18.value': 'form1[0].section13_2[2].#field[18]',
-  'section13.nonFederalEmployment.entries[0].field21.value': 'form1[0].section13_2[2].#field[21]',
-  'section13.nonFederalEmployment.entries[0].field27.value': 'form1[0].section13_2[2].#field[27]',
-  'section13.nonFederalEmployment.entries[0].field28.value': 'form1[0].section13_2[2].#field[28]',
-  'section13.nonFederalEmployment.entries[0].field29.value': 'form1[0].section13_2[2].#field[29]',
-  'section13.nonFederalEmployment.entries[0].field30.value': 'form1[0].section13_2[2].#field[30]',
-  'section13.nonFederalEmployment.entries[0].field33.value': 'form1[0].section13_2[2].#field[33]',
-  'section13.nonFederalEmployment.entries[0].field34.value': 'form1[0].section13_2[2].#field[34]',
-  'section13.nonFederalEmployment.entries[0].field36.value': 'form1[0].section13_2[2].#field[36]',
-  'section13.nonFederalEmployment.entries[0].field38.value': 'form1[0].section13_2[2].#field[38]',
-  'section13.nonFederalEmployment.entries[0].field4.value': 'form1[0].section13_2[2].Table1[0].Row4[0].#field[4]',
-  'section13.nonFederalEmployment.entries[0].field41.value': 'form1[0].section13_2[2].#field[41]',
-  'section13.nonFederalEmployment.entries[0].field42.value': 'form1[0].section13_2[2].#field[42]',
-  'section13.nonFederalEmployment.entries[0].field43.value': 'form1[0].section13_2[2].#field[43]',
-  'section13.nonFederalEmployment.entries[0].field45.value': 'form1[0].section13_2[2].#field[45]',
-  'section13.nonFederalEmployment.entries[0].field5.value': 'form1[0].section13_2[2].Table1[0].Row4[0].#field[5]',
-  'section13.nonFederalEmployment.entries[0].fromDate.value': 'form1[0].section13_2[2].From_Datefield_Name_2[0]',
-  'section13.nonFederalEmployment.entries[0].hasAdditionalInfo.value': 'form1[0].section13_2[2].RadioButtonList[1]',
-  'section13.nonFederalEmployment.entries[0].isCurrentEmployment.value': 'form1[0].section13_2[2].RadioButtonList[2]',
-  'section13.nonFederalEmployment.entries[0].positionTitle.value': 'form1[0].section13_2[2].TextField11[1]',
-  'section13.nonFederalEmployment.entries[0].reasonForLeaving.value': 'form1[0].section13_2[2].TextField11[13]',
-  'section13.nonFederalEmployment.entries[0].supervisorAddress.value': 'form1[0].section13_2[2].TextField11[14]',
-  'section13.nonFederalEmployment.entries[0].supervisorApoFpo.value': 'form1[0].section13_2[2].TextField11[17]',
-  'section13.nonFederalEmployment.entries[0].supervisorCity.value': 'form1[0].section13_2[2].TextField11[15]',
-  'section13.nonFederalEmployment.entries[0].supervisorCountry.value': 'form1[0].section13_2[2].DropDownList16[0]',
-  'section13.nonFederalEmployment.entries[0].supervisorEmail.value': 'form1[0].section13_2[2].p3-t68[2]',
-  'section13.nonFederalEmployment.entries[0].supervisorName.value': 'form1[0].section13_2[2].TextField11[2]',
-  'section13.nonFederalEmployment.entries[0].supervisorNameAlt.value': 'form1[0].section13_2[2].TextField11[19]',
-  'section13.nonFederalEmployment.entries[0].supervisorPhone.value': 'form1[0].section13_2[2].p3-t68[3]',
-  'section13.nonFederalEmployment.entries[0].supervisorState.value': 'form1[0].section13_2[2].School6_State[2]',
-  'section13.nonFederalEmployment.entries[0].supervisorStateAlt.value': 'form1[0].section13_2[2].School6_State[5]',
-  'section13.nonFederalEmployment.entries[0].supervisorStreet.value': 'form1[0].section13_2[2].TextField11[16]',
-  'section13.nonFederalEmployment.entries[0].supervisorTitle.value': 'form1[0].section13_2[2].TextField11[3]',
-  'section13.nonFederalEmployment.entries[0].supervisorZip.value': 'form1[0].section13_2[2].TextField11[18]',
-  'section13.nonFederalEmployment.entries[0].table0Row1Cell2.value': 'form1[0].section13_2[2].Table1[0].Row1[0].Cell2[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row1Cell3.value': 'form1[0].section13_2[2].Table1[0].Row1[0].Cell3[1]',
-  'section13.nonFederalEmployment.entries[0].table0Row1Cell4.value': 'form1[0].section13_2[2].Table1[0].Row1[0].Cell4[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row2Cell2.value': 'form1[0].section13_2[2].Table1[0].Row2[0].Cell2[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row2Cell3.value': 'form1[0].section13_2[2].Table1[0].Row2[0].Cell3[1]',
-  'section13.nonFederalEmployment.entries[0].table0Row2Cell4.value': 'form1[0].section13_2[2].Table1[0].Row2[0].Cell4[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row3Cell2.value': 'form1[0].section13_2[2].Table1[0].Row3[0].Cell2[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row3Cell3.value': 'form1[0].section13_2[2].Table1[0].Row3[0].Cell3[1]',
-  'section13.nonFederalEmployment.entries[0].table0Row3Cell4.value': 'form1[0].section13_2[2].Table1[0].Row3[0].Cell4[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row4Cell2.value': 'form1[0].section13_2[2].Table1[0].Row4[0].Cell2[0]',
-  'section13.nonFederalEmployment.entries[0].table0Row4Cell3.value': 'form1[0].section13_2[2].Table1[0].Row4[0].Cell3[1]',
-  'section13.nonFederalEmployment.entries[0].table0Row4Cell4.value': 'form1[0].section13_2[2].Table1[0].Row4[0].Cell4[0]',
-  'section13.nonFederalEmployment.entries[0].toDate.value': 'form1[0].section13_2[2].From_Datefield_Name_2[1]',
+  'section13.nonFederalEmployment.entries[0].additionalInfo.value': 'form1[0].section13_2[0].TextField11[12]',
+  'section13.nonFederalEmployment.entries[0].additionalPhone.value': 'form1[0].section13_2[0].p3-t68[4]',
+  'section13.nonFederalEmployment.entries[0].additionalState.value': 'form1[0].section13_2[0].School6_State[6]',
+  'section13.nonFederalEmployment.entries[0].countryCode.value': 'form1[0].section13_2[0].DropDownList4[1]',
+  'section13.nonFederalEmployment.entries[0].dutyCity.value': 'form1[0].section13_2[0].TextField11[10]',
+  'section13.nonFederalEmployment.entries[0].dutyCountry.value': 'form1[0].section13_2[0].DropDownList15[0]',
+  'section13.nonFederalEmployment.entries[0].dutyPhone.value': 'form1[0].section13_2[0].p3-t68[1]',
+  'section13.nonFederalEmployment.entries[0].dutyState.value': 'form1[0].section13_2[0].School6_State[1]',
+  'section13.nonFederalEmployment.entries[0].dutyStateAlt.value': 'form1[0].section13_2[0].School6_State[4]',
+  'section13.nonFederalEmployment.entries[0].dutyStreet.value': 'form1[0].section13_2[0].TextField11[9]',
+  'section13.nonFederalEmployment.entries[0].dutyZip.value': 'form1[0].section13_2[0].TextField11[11]',
+  'section13.nonFederalEmployment.entries[0].emergencyContact.value': 'form1[0].section13_2[0].p3-t68[5]',
+  'section13.nonFederalEmployment.entries[0].employerAddress2.value': 'form1[0].section13_2[0].TextField11[20]',
+  'section13.nonFederalEmployment.entries[0].employerApoFpo.value': 'form1[0].section13_2[0].TextField11[23]',
+  'section13.nonFederalEmployment.entries[0].employerCity.value': 'form1[0].section13_2[0].TextField11[5]',
+  'section13.nonFederalEmployment.entries[0].employerCity2.value': 'form1[0].section13_2[0].TextField11[21]',
+  'section13.nonFederalEmployment.entries[0].employerCountry.value': 'form1[0].section13_2[0].DropDownList13[0]',
+  'section13.nonFederalEmployment.entries[0].employerName.value': 'form1[0].section13_2[0].TextField11[0]',
+  'section13.nonFederalEmployment.entries[0].employerNameAlt.value': 'form1[0].section13_2[0].TextField11[25]',
+  'section13.nonFederalEmployment.entries[0].employerPhone.value': 'form1[0].section13_2[0].p3-t68[0]',
+  'section13.nonFederalEmployment.entries[0].employerState.value': 'form1[0].section13_2[0].School6_State[0]',
+  'section13.nonFederalEmployment.entries[0].employerStateAlt.value': 'form1[0].section13_2[0].School6_State[3]',
+  'section13.nonFederalEmployment.entries[0].employerStreet.value': 'form1[0].section13_2[0].TextField11[4]',
+  'section13.nonFederalEmployment.entries[0].employerStreet2.value': 'form1[0].section13_2[0].TextField11[22]',
+  'section13.nonFederalEmployment.entries[0].employerZip.value': 'form1[0].section13_2[0].TextField11[6]',
+  'section13.nonFederalEmployment.entries[0].employerZip2.value': 'form1[0].section13_2[0].TextField11[24]',
+  'section13.nonFederalEmployment.entries[0].employmentType.value': 'form1[0].section13_2[0].RadioButtonList[0]',
+  'section13.nonFederalEmployment.entries[0].extension.value': 'form1[0].section13_2[0].TextField11[8]',
+  'section13.nonFederalEmployment.entries[0].field16.value': 'form1[0].section13_2[0].#field[16]',
+  'section13.nonFederalEmployment.entries[0].field17.value': 'form1[0].section13_2[0].#field[17]',
+  'section13.nonFederalEmployment.entries[0].field18.value': 'form1[0].section13_2[0].#field[18]',
+  'section13.nonFederalEmployment.entries[0].field21.value': 'form1[0].section13_2[0].#field[21]',
+  'section13.nonFederalEmployment.entries[0].field27.value': 'form1[0].section13_2[0].#field[27]',
+  'section13.nonFederalEmployment.entries[0].field28.value': 'form1[0].section13_2[0].#field[28]',
+  'section13.nonFederalEmployment.entries[0].field29.value': 'form1[0].section13_2[0].#field[29]',
+  'section13.nonFederalEmployment.entries[0].field30.value': 'form1[0].section13_2[0].#field[30]',
+  'section13.nonFederalEmployment.entries[0].field33.value': 'form1[0].section13_2[0].#field[33]',
+  'section13.nonFederalEmployment.entries[0].field34.value': 'form1[0].section13_2[0].#field[34]',
+  'section13.nonFederalEmployment.entries[0].field36.value': 'form1[0].section13_2[0].#field[36]',
+  'section13.nonFederalEmployment.entries[0].field38.value': 'form1[0].section13_2[0].#field[38]',
+  'section13.nonFederalEmployment.entries[0].field4.value': 'form1[0].section13_2[0].Table1[0].Row4[0].#field[4]',
+  'section13.nonFederalEmployment.entries[0].field41.value': 'form1[0].section13_2[0].#field[41]',
+  'section13.nonFederalEmployment.entries[0].field42.value': 'form1[0].section13_2[0].#field[42]',
+  'section13.nonFederalEmployment.entries[0].field43.value': 'form1[0].section13_2[0].#field[43]',
+  'section13.nonFederalEmployment.entries[0].field45.value': 'form1[0].section13_2[0].#field[45]',
+  'section13.nonFederalEmployment.entries[0].field5.value': 'form1[0].section13_2[0].Table1[0].Row4[0].#field[5]',
+  'section13.nonFederalEmployment.entries[0].fromDate.value': 'form1[0].section13_2[0].From_Datefield_Name_2[0]',
+  'section13.nonFederalEmployment.entries[0].hasAdditionalInfo.value': 'form1[0].section13_2[0].RadioButtonList[1]',
+  'section13.nonFederalEmployment.entries[0].isCurrentEmployment.value': 'form1[0].section13_2[0].RadioButtonList[2]',
+  'section13.nonFederalEmployment.entries[0].positionTitle.value': 'form1[0].section13_2[0].TextField11[1]',
+  'section13.nonFederalEmployment.entries[0].reasonForLeaving.value': 'form1[0].section13_2[0].TextField11[13]',
+  'section13.nonFederalEmployment.entries[0].supervisorAddress.value': 'form1[0].section13_2[0].TextField11[14]',
+  'section13.nonFederalEmployment.entries[0].supervisorApoFpo.value': 'form1[0].section13_2[0].TextField11[17]',
+  'section13.nonFederalEmployment.entries[0].supervisorCity.value': 'form1[0].section13_2[0].TextField11[15]',
+  'section13.nonFederalEmployment.entries[0].supervisorCountry.value': 'form1[0].section13_2[0].DropDownList16[0]',
+  'section13.nonFederalEmployment.entries[0].supervisorEmail.value': 'form1[0].section13_2[0].p3-t68[2]',
+  'section13.nonFederalEmployment.entries[0].supervisorName.value': 'form1[0].section13_2[0].TextField11[2]',
+  'section13.nonFederalEmployment.entries[0].supervisorNameAlt.value': 'form1[0].section13_2[0].TextField11[19]',
+  'section13.nonFederalEmployment.entries[0].supervisorPhone.value': 'form1[0].section13_2[0].p3-t68[3]',
+  'section13.nonFederalEmployment.entries[0].supervisorState.value': 'form1[0].section13_2[0].School6_State[2]',
+  'section13.nonFederalEmployment.entries[0].supervisorStateAlt.value': 'form1[0].section13_2[0].School6_State[5]',
+  'section13.nonFederalEmployment.entries[0].supervisorStreet.value': 'form1[0].section13_2[0].TextField11[16]',
+  'section13.nonFederalEmployment.entries[0].supervisorTitle.value': 'form1[0].section13_2[0].TextField11[3]',
+  'section13.nonFederalEmployment.entries[0].supervisorZip.value': 'form1[0].section13_2[0].TextField11[18]',
+  'section13.nonFederalEmployment.entries[0].table0Row1Cell2.value': 'form1[0].section13_2[0].Table1[0].Row1[0].Cell2[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row1Cell3.value': 'form1[0].section13_2[0].Table1[0].Row1[0].Cell3[1]',
+  'section13.nonFederalEmployment.entries[0].table0Row1Cell4.value': 'form1[0].section13_2[0].Table1[0].Row1[0].Cell4[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row2Cell2.value': 'form1[0].section13_2[0].Table1[0].Row2[0].Cell2[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row2Cell3.value': 'form1[0].section13_2[0].Table1[0].Row2[0].Cell3[1]',
+  'section13.nonFederalEmployment.entries[0].table0Row2Cell4.value': 'form1[0].section13_2[0].Table1[0].Row2[0].Cell4[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row3Cell2.value': 'form1[0].section13_2[0].Table1[0].Row3[0].Cell2[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row3Cell3.value': 'form1[0].section13_2[0].Table1[0].Row3[0].Cell3[1]',
+  'section13.nonFederalEmployment.entries[0].table0Row3Cell4.value': 'form1[0].section13_2[0].Table1[0].Row3[0].Cell4[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row4Cell2.value': 'form1[0].section13_2[0].Table1[0].Row4[0].Cell2[0]',
+  'section13.nonFederalEmployment.entries[0].table0Row4Cell3.value': 'form1[0].section13_2[0].Table1[0].Row4[0].Cell3[1]',
+  'section13.nonFederalEmployment.entries[0].table0Row4Cell4.value': 'form1[0].section13_2[0].Table1[0].Row4[0].Cell4[0]',
+  'section13.nonFederalEmployment.entries[0].toDate.value': 'form1[0].section13_2[0].From_Datefield_Name_2[1]',
   'section13.nonFederalEmploymentAdditional.entries[0].dateField0.value': 'form1[0].section13_2-2[0].From_Datefield_Name_2[0]',
   'section13.nonFederalEmploymentAdditional.entries[0].dateField1.value': 'form1[0].section13_2-2[0].From_Datefield_Name_2[1]',
   'section13.nonFederalEmploymentAdditional.entries[0].dropdown13.value': 'form1[0].section13_2-2[0].DropDownList13[0]',
@@ -252,64 +257,64 @@ export const GENERATED_SECTION13_FIELD_MAPPINGS = {
   'section13.nonFederalEmploymentAdditional.entries[0].textField7.value': 'form1[0].section13_2-2[0].TextField11[7]',
   'section13.nonFederalEmploymentAdditional.entries[0].textField8.value': 'form1[0].section13_2-2[0].TextField11[8]',
   'section13.nonFederalEmploymentAdditional.entries[0].textField9.value': 'form1[0].section13_2-2[0].TextField11[9]',
-  'section13.selfEmployment.entries[0].additionalInfo.value': 'form1[0].section13_3[2].TextField11[12]',
-  'section13.selfEmployment.entries[0].additionalState.value': 'form1[0].section13_3[2].School6_State[6]',
-  'section13.selfEmployment.entries[0].businessAddress2.value': 'form1[0].section13_3[2].TextField11[9]',
-  'section13.selfEmployment.entries[0].businessAddress3.value': 'form1[0].section13_3[2].TextField11[20]',
-  'section13.selfEmployment.entries[0].businessApoFpo.value': 'form1[0].section13_3[2].TextField11[17]',
-  'section13.selfEmployment.entries[0].businessApoFpo2.value': 'form1[0].section13_3[2].TextField11[23]',
-  'section13.selfEmployment.entries[0].businessCity.value': 'form1[0].section13_3[2].TextField11[4]',
-  'section13.selfEmployment.entries[0].businessCity2.value': 'form1[0].section13_3[2].TextField11[10]',
-  'section13.selfEmployment.entries[0].businessCity3.value': 'form1[0].section13_3[2].TextField11[21]',
-  'section13.selfEmployment.entries[0].businessContact.value': 'form1[0].section13_3[2].TextField11[19]',
-  'section13.selfEmployment.entries[0].businessCountry.value': 'form1[0].section13_3[2].DropDownList9[0]',
-  'section13.selfEmployment.entries[0].businessCountry2.value': 'form1[0].section13_3[2].DropDownList10[0]',
-  'section13.selfEmployment.entries[0].businessCountry3.value': 'form1[0].section13_3[2].DropDownList11[0]',
-  'section13.selfEmployment.entries[0].businessDescription.value': 'form1[0].section13_3[2].TextField11[2]',
-  'section13.selfEmployment.entries[0].businessEmail.value': 'form1[0].section13_3[2].p3-t68[2]',
-  'section13.selfEmployment.entries[0].businessEmployees.value': 'form1[0].section13_3[2].TextField11[16]',
-  'section13.selfEmployment.entries[0].businessExtension.value': 'form1[0].section13_3[2].TextField11[7]',
-  'section13.selfEmployment.entries[0].businessFax.value': 'form1[0].section13_3[2].p3-t68[3]',
-  'section13.selfEmployment.entries[0].businessLicense.value': 'form1[0].section13_3[2].TextField11[13]',
-  'section13.selfEmployment.entries[0].businessName.value': 'form1[0].section13_3[2].TextField11[0]',
-  'section13.selfEmployment.entries[0].businessNameAlt.value': 'form1[0].section13_3[2].TextField11[25]',
-  'section13.selfEmployment.entries[0].businessPhone.value': 'form1[0].section13_3[2].p3-t68[0]',
-  'section13.selfEmployment.entries[0].businessPhone2.value': 'form1[0].section13_3[2].p3-t68[1]',
-  'section13.selfEmployment.entries[0].businessRevenue.value': 'form1[0].section13_3[2].TextField11[15]',
-  'section13.selfEmployment.entries[0].businessState.value': 'form1[0].section13_3[2].School6_State[0]',
-  'section13.selfEmployment.entries[0].businessState2.value': 'form1[0].section13_3[2].School6_State[1]',
-  'section13.selfEmployment.entries[0].businessState3.value': 'form1[0].section13_3[2].School6_State[2]',
-  'section13.selfEmployment.entries[0].businessStateAlt.value': 'form1[0].section13_3[2].School6_State[3]',
-  'section13.selfEmployment.entries[0].businessStateAlt2.value': 'form1[0].section13_3[2].School6_State[4]',
-  'section13.selfEmployment.entries[0].businessStateAlt3.value': 'form1[0].section13_3[2].School6_State[5]',
-  'section13.selfEmployment.entries[0].businessStreet.value': 'form1[0].section13_3[2].TextField11[3]',
-  'section13.selfEmployment.entries[0].businessStreet3.value': 'form1[0].section13_3[2].TextField11[22]',
-  'section13.selfEmployment.entries[0].businessTaxId.value': 'form1[0].section13_3[2].TextField11[14]',
-  'section13.selfEmployment.entries[0].businessType.value': 'form1[0].section13_3[2].RadioButtonList[0]',
-  'section13.selfEmployment.entries[0].businessWebsite.value': 'form1[0].section13_3[2].p3-t68[4]',
-  'section13.selfEmployment.entries[0].businessZip.value': 'form1[0].section13_3[2].TextField11[5]',
-  'section13.selfEmployment.entries[0].businessZip2.value': 'form1[0].section13_3[2].TextField11[11]',
-  'section13.selfEmployment.entries[0].businessZip3.value': 'form1[0].section13_3[2].TextField11[24]',
-  'section13.selfEmployment.entries[0].businessZipAlt.value': 'form1[0].section13_3[2].TextField11[18]',
-  'section13.selfEmployment.entries[0].countryCode.value': 'form1[0].section13_3[2].DropDownList4[1]',
-  'section13.selfEmployment.entries[0].field16.value': 'form1[0].section13_3[2].#field[16]',
-  'section13.selfEmployment.entries[0].field17.value': 'form1[0].section13_3[2].#field[17]',
-  'section13.selfEmployment.entries[0].field18.value': 'form1[0].section13_3[2].#field[18]',
-  'section13.selfEmployment.entries[0].field26.value': 'form1[0].section13_3[2].#field[26]',
-  'section13.selfEmployment.entries[0].field27.value': 'form1[0].section13_3[2].#field[27]',
-  'section13.selfEmployment.entries[0].field28.value': 'form1[0].section13_3[2].#field[28]',
-  'section13.selfEmployment.entries[0].field31.value': 'form1[0].section13_3[2].#field[31]',
-  'section13.selfEmployment.entries[0].field32.value': 'form1[0].section13_3[2].#field[32]',
-  'section13.selfEmployment.entries[0].field33.value': 'form1[0].section13_3[2].#field[33]',
-  'section13.selfEmployment.entries[0].field34.value': 'form1[0].section13_3[2].#field[34]',
-  'section13.selfEmployment.entries[0].field35.value': 'form1[0].section13_3[2].#field[35]',
-  'section13.selfEmployment.entries[0].field38.value': 'form1[0].section13_3[2].#field[38]',
-  'section13.selfEmployment.entries[0].field39.value': 'form1[0].section13_3[2].#field[39]',
-  'section13.selfEmployment.entries[0].field41.value': 'form1[0].section13_3[2].#field[41]',
-  'section13.selfEmployment.entries[0].fromDate.value': 'form1[0].section13_3[2].From_Datefield_Name_2[0]',
-  'section13.selfEmployment.entries[0].hasEmployees.value': 'form1[0].section13_3[2].RadioButtonList[1]',
-  'section13.selfEmployment.entries[0].isCurrentBusiness.value': 'form1[0].section13_3[2].RadioButtonList[2]',
-  'section13.selfEmployment.entries[0].toDate.value': 'form1[0].section13_3[2].From_Datefield_Name_2[1]',
+  'section13.selfEmployment.entries[0].additionalInfo.value': 'form1[0].section13_3[0].TextField11[12]',
+  'section13.selfEmployment.entries[0].additionalState.value': 'form1[0].section13_3[0].School6_State[6]',
+  'section13.selfEmployment.entries[0].businessAddress2.value': 'form1[0].section13_3[0].TextField11[9]',
+  'section13.selfEmployment.entries[0].businessAddress3.value': 'form1[0].section13_3[0].TextField11[20]',
+  'section13.selfEmployment.entries[0].businessApoFpo.value': 'form1[0].section13_3[0].TextField11[17]',
+  'section13.selfEmployment.entries[0].businessApoFpo2.value': 'form1[0].section13_3[0].TextField11[23]',
+  'section13.selfEmployment.entries[0].businessCity.value': 'form1[0].section13_3[0].TextField11[4]',
+  'section13.selfEmployment.entries[0].businessCity2.value': 'form1[0].section13_3[0].TextField11[10]',
+  'section13.selfEmployment.entries[0].businessCity3.value': 'form1[0].section13_3[0].TextField11[21]',
+  'section13.selfEmployment.entries[0].businessContact.value': 'form1[0].section13_3[0].TextField11[19]',
+  'section13.selfEmployment.entries[0].businessCountry.value': 'form1[0].section13_3[0].DropDownList9[0]',
+  'section13.selfEmployment.entries[0].businessCountry2.value': 'form1[0].section13_3[0].DropDownList10[0]',
+  'section13.selfEmployment.entries[0].businessCountry3.value': 'form1[0].section13_3[0].DropDownList11[0]',
+  'section13.selfEmployment.entries[0].businessDescription.value': 'form1[0].section13_3[0].TextField11[2]',
+  'section13.selfEmployment.entries[0].businessEmail.value': 'form1[0].section13_3[0].p3-t68[2]',
+  'section13.selfEmployment.entries[0].businessEmployees.value': 'form1[0].section13_3[0].TextField11[16]',
+  'section13.selfEmployment.entries[0].businessExtension.value': 'form1[0].section13_3[0].TextField11[7]',
+  'section13.selfEmployment.entries[0].businessFax.value': 'form1[0].section13_3[0].p3-t68[3]',
+  'section13.selfEmployment.entries[0].businessLicense.value': 'form1[0].section13_3[0].TextField11[13]',
+  'section13.selfEmployment.entries[0].businessName.value': 'form1[0].section13_3[0].TextField11[0]',
+  'section13.selfEmployment.entries[0].businessNameAlt.value': 'form1[0].section13_3[0].TextField11[25]',
+  'section13.selfEmployment.entries[0].businessPhone.value': 'form1[0].section13_3[0].p3-t68[0]',
+  'section13.selfEmployment.entries[0].businessPhone2.value': 'form1[0].section13_3[0].p3-t68[1]',
+  'section13.selfEmployment.entries[0].businessRevenue.value': 'form1[0].section13_3[0].TextField11[15]',
+  'section13.selfEmployment.entries[0].businessState.value': 'form1[0].section13_3[0].School6_State[0]',
+  'section13.selfEmployment.entries[0].businessState2.value': 'form1[0].section13_3[0].School6_State[1]',
+  'section13.selfEmployment.entries[0].businessState3.value': 'form1[0].section13_3[0].School6_State[2]',
+  'section13.selfEmployment.entries[0].businessStateAlt.value': 'form1[0].section13_3[0].School6_State[3]',
+  'section13.selfEmployment.entries[0].businessStateAlt2.value': 'form1[0].section13_3[0].School6_State[4]',
+  'section13.selfEmployment.entries[0].businessStateAlt3.value': 'form1[0].section13_3[0].School6_State[5]',
+  'section13.selfEmployment.entries[0].businessStreet.value': 'form1[0].section13_3[0].TextField11[3]',
+  'section13.selfEmployment.entries[0].businessStreet3.value': 'form1[0].section13_3[0].TextField11[22]',
+  'section13.selfEmployment.entries[0].businessTaxId.value': 'form1[0].section13_3[0].TextField11[14]',
+  'section13.selfEmployment.entries[0].businessType.value': 'form1[0].section13_3[0].RadioButtonList[0]',
+  'section13.selfEmployment.entries[0].businessWebsite.value': 'form1[0].section13_3[0].p3-t68[4]',
+  'section13.selfEmployment.entries[0].businessZip.value': 'form1[0].section13_3[0].TextField11[5]',
+  'section13.selfEmployment.entries[0].businessZip2.value': 'form1[0].section13_3[0].TextField11[11]',
+  'section13.selfEmployment.entries[0].businessZip3.value': 'form1[0].section13_3[0].TextField11[24]',
+  'section13.selfEmployment.entries[0].businessZipAlt.value': 'form1[0].section13_3[0].TextField11[18]',
+  'section13.selfEmployment.entries[0].countryCode.value': 'form1[0].section13_3[0].DropDownList4[1]',
+  'section13.selfEmployment.entries[0].field16.value': 'form1[0].section13_3[0].#field[16]',
+  'section13.selfEmployment.entries[0].field17.value': 'form1[0].section13_3[0].#field[17]',
+  'section13.selfEmployment.entries[0].field18.value': 'form1[0].section13_3[0].#field[18]',
+  'section13.selfEmployment.entries[0].field26.value': 'form1[0].section13_3[0].#field[26]',
+  'section13.selfEmployment.entries[0].field27.value': 'form1[0].section13_3[0].#field[27]',
+  'section13.selfEmployment.entries[0].field28.value': 'form1[0].section13_3[0].#field[28]',
+  'section13.selfEmployment.entries[0].field31.value': 'form1[0].section13_3[0].#field[31]',
+  'section13.selfEmployment.entries[0].field32.value': 'form1[0].section13_3[0].#field[32]',
+  'section13.selfEmployment.entries[0].field33.value': 'form1[0].section13_3[0].#field[33]',
+  'section13.selfEmployment.entries[0].field34.value': 'form1[0].section13_3[0].#field[34]',
+  'section13.selfEmployment.entries[0].field35.value': 'form1[0].section13_3[0].#field[35]',
+  'section13.selfEmployment.entries[0].field38.value': 'form1[0].section13_3[0].#field[38]',
+  'section13.selfEmployment.entries[0].field39.value': 'form1[0].section13_3[0].#field[39]',
+  'section13.selfEmployment.entries[0].field41.value': 'form1[0].section13_3[0].#field[41]',
+  'section13.selfEmployment.entries[0].fromDate.value': 'form1[0].section13_3[0].From_Datefield_Name_2[0]',
+  'section13.selfEmployment.entries[0].hasEmployees.value': 'form1[0].section13_3[0].RadioButtonList[1]',
+  'section13.selfEmployment.entries[0].isCurrentBusiness.value': 'form1[0].section13_3[0].RadioButtonList[2]',
+  'section13.selfEmployment.entries[0].toDate.value': 'form1[0].section13_3[0].From_Datefield_Name_2[1]',
   'section13.selfEmploymentAdditional.entries[0].dateField0.value': 'form1[0].section13_3-2[0].From_Datefield_Name_2[0]',
   'section13.selfEmploymentAdditional.entries[0].dateField1.value': 'form1[0].section13_3-2[0].From_Datefield_Name_2[1]',
   'section13.selfEmploymentAdditional.entries[0].dropdown10.value': 'form1[0].section13_3-2[0].DropDownList10[0]',
@@ -371,74 +376,152 @@ export const GENERATED_SECTION13_FIELD_MAPPINGS = {
   'section13.selfEmploymentAdditional.entries[0].textField7.value': 'form1[0].section13_3-2[0].TextField11[7]',
   'section13.selfEmploymentAdditional.entries[0].textField8.value': 'form1[0].section13_3-2[0].TextField11[8]',
   'section13.selfEmploymentAdditional.entries[0].textField9.value': 'form1[0].section13_3-2[0].TextField11[9]',
-  'section13.unemployment.entries[0].additionalFromDate.value': 'form1[0].section13_4[3].#area[2].From_Datefield_Name_2[6]',
-  'section13.unemployment.entries[0].additionalInfo.value': 'form1[0].section13_4[3].TextField11[12]',
-  'section13.unemployment.entries[0].additionalState.value': 'form1[0].section13_4[3].School6_State[2]',
-  'section13.unemployment.entries[0].additionalToDate.value': 'form1[0].section13_4[3].#area[2].From_Datefield_Name_2[7]',
-  'section13.unemployment.entries[0].benefitsEndDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[5]',
-  'section13.unemployment.entries[0].benefitsStartDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[4]',
-  'section13.unemployment.entries[0].countryCode.value': 'form1[0].section13_4[3].DropDownList4[0]',
-  'section13.unemployment.entries[0].field14.value': 'form1[0].section13_4[2].#field[14]',
-  'section13.unemployment.entries[0].field15.value': 'form1[0].section13_4[3].#field[15]',
-  'section13.unemployment.entries[0].field16.value': 'form1[0].section13_4[3].#field[16]',
-  'section13.unemployment.entries[0].field17.value': 'form1[0].section13_4[3].#field[17]',
-  'section13.unemployment.entries[0].field19.value': 'form1[0].section13_4[2].#area[0].#field[19]',
-  'section13.unemployment.entries[0].field2.value': 'form1[0].section13_4[2].#field[2]',
-  'section13.unemployment.entries[0].field20.value': 'form1[0].section13_4[3].#area[0].#field[20]',
-  'section13.unemployment.entries[0].field21.value': 'form1[0].section13_4[3].#area[0].#field[21]',
-  'section13.unemployment.entries[0].field22.value': 'form1[0].section13_4[3].#area[0].#field[22]',
-  'section13.unemployment.entries[0].field23.value': 'form1[0].section13_4[3].#area[0].#field[23]',
-  'section13.unemployment.entries[0].field24.value': 'form1[0].section13_4[3].#area[1].#field[24]',
-  'section13.unemployment.entries[0].field25.value': 'form1[0].section13_4[3].#area[1].#field[25]',
-  'section13.unemployment.entries[0].field26.value': 'form1[0].section13_4[3].#area[1].#field[26]',
-  'section13.unemployment.entries[0].field27.value': 'form1[0].section13_4[3].#area[1].#field[27]',
-  'section13.unemployment.entries[0].field28.value': 'form1[0].section13_4[3].#field[28]',
-  'section13.unemployment.entries[0].field3.value': 'form1[0].section13_4[3].#field[3]',
-  'section13.unemployment.entries[0].field30.value': 'form1[0].section13_4[2].#field[30]',
-  'section13.unemployment.entries[0].field31.value': 'form1[0].section13_4[3].#field[31]',
-  'section13.unemployment.entries[0].field32.value': 'form1[0].section13_4[2].#field[32]',
-  'section13.unemployment.entries[0].field33.value': 'form1[0].section13_4[3].#field[33]',
-  'section13.unemployment.entries[0].field34.value': 'form1[0].section13_4[2].#field[34]',
-  'section13.unemployment.entries[0].field35.value': 'form1[0].section13_4[3].#field[35]',
-  'section13.unemployment.entries[0].field36.value': 'form1[0].section13_4[3].#area[2].#field[36]',
-  'section13.unemployment.entries[0].field37.value': 'form1[0].section13_4[3].#area[2].#field[37]',
-  'section13.unemployment.entries[0].field38.value': 'form1[0].section13_4[3].#area[2].#field[38]',
-  'section13.unemployment.entries[0].field4.value': 'form1[0].section13_4[3].#field[4]',
-  'section13.unemployment.entries[0].field40.value': 'form1[0].section13_4[2].#area[2].#field[40]',
-  'section13.unemployment.entries[0].field41.value': 'form1[0].section13_4[3].#area[2].#field[41]',
-  'section13.unemployment.entries[0].field42.value': 'form1[0].section13_4[3].#field[42]',
-  'section13.unemployment.entries[0].field43.value': 'form1[0].section13_4[3].#field[43]',
-  'section13.unemployment.entries[0].field44.value': 'form1[0].section13_4[3].#field[44]',
-  'section13.unemployment.entries[0].field46.value': 'form1[0].section13_4[2].#field[46]',
-  'section13.unemployment.entries[0].field47.value': 'form1[0].section13_4[3].#field[47]',
-  'section13.unemployment.entries[0].field5.value': 'form1[0].section13_4[2].#field[5]',
-  'section13.unemployment.entries[0].field6.value': 'form1[0].section13_4[3].#field[6]',
-  'section13.unemployment.entries[0].firstName.value': 'form1[0].section13_4[3].TextField11[0]',
-  'section13.unemployment.entries[0].fromDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[0]',
-  'section13.unemployment.entries[0].hasReference.value': 'form1[0].section13_4[3].RadioButtonList[0]',
-  'section13.unemployment.entries[0].isCurrentlyUnemployed.value': 'form1[0].section13_4[3].RadioButtonList[2]',
-  'section13.unemployment.entries[0].lastName.value': 'form1[0].section13_4[3].TextField11[1]',
-  'section13.unemployment.entries[0].phone0.value': 'form1[0].section13_4[3].p3-t68[0]',
-  'section13.unemployment.entries[0].receivedBenefits.value': 'form1[0].section13_4[3].RadioButtonList[1]',
-  'section13.unemployment.entries[0].referenceAddress2.value': 'form1[0].section13_4[3].TextField11[8]',
-  'section13.unemployment.entries[0].referenceCity.value': 'form1[0].section13_4[3].TextField11[3]',
-  'section13.unemployment.entries[0].referenceCity2.value': 'form1[0].section13_4[3].TextField11[9]',
-  'section13.unemployment.entries[0].referenceCountry.value': 'form1[0].section13_4[3].DropDownList6[0]',
-  'section13.unemployment.entries[0].referenceEmail.value': 'form1[0].section13_4[3].TextField11[7]',
-  'section13.unemployment.entries[0].referenceExtension.value': 'form1[0].section13_4[3].TextField11[6]',
-  'section13.unemployment.entries[0].referenceFromDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[8]',
-  'section13.unemployment.entries[0].referencePhone.value': 'form1[0].section13_4[3].TextField11[5]',
-  'section13.unemployment.entries[0].referenceState.value': 'form1[0].section13_4[3].School6_State[0]',
-  'section13.unemployment.entries[0].referenceState2.value': 'form1[0].section13_4[3].School6_State[1]',
-  'section13.unemployment.entries[0].referenceStreet.value': 'form1[0].section13_4[3].TextField11[2]',
-  'section13.unemployment.entries[0].referenceStreet2.value': 'form1[0].section13_4[3].TextField11[10]',
-  'section13.unemployment.entries[0].referenceToDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[9]',
-  'section13.unemployment.entries[0].referenceZip.value': 'form1[0].section13_4[3].TextField11[4]',
-  'section13.unemployment.entries[0].referenceZip2.value': 'form1[0].section13_4[3].TextField11[11]',
-  'section13.unemployment.entries[0].toDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[1]',
-  'section13.unemployment.entries[0].unemploymentEndDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[3]',
-  'section13.unemployment.entries[0].unemploymentStartDate.value': 'form1[0].section13_4[3].From_Datefield_Name_2[2]',
+  'section13.unemployment.entries[0].additionalFromDate.value': 'form1[0].section13_4[0].#area[2].From_Datefield_Name_2[6]',
+  'section13.unemployment.entries[0].additionalInfo.value': 'form1[0].section13_4[0].TextField11[12]',
+  'section13.unemployment.entries[0].additionalState.value': 'form1[0].section13_4[0].School6_State[2]',
+  'section13.unemployment.entries[0].additionalToDate.value': 'form1[0].section13_4[0].#area[2].From_Datefield_Name_2[7]',
+  'section13.unemployment.entries[0].benefitsEndDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[5]',
+  'section13.unemployment.entries[0].benefitsStartDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[4]',
+  'section13.unemployment.entries[0].countryCode.value': 'form1[0].section13_4[0].DropDownList4[0]',
+  'section13.unemployment.entries[0].field15.value': 'form1[0].section13_4[0].#field[15]',
+  'section13.unemployment.entries[0].field16.value': 'form1[0].section13_4[0].#field[16]',
+  'section13.unemployment.entries[0].field20.value': 'form1[0].section13_4[0].#area[0].#field[20]',
+  'section13.unemployment.entries[0].field21.value': 'form1[0].section13_4[0].#area[0].#field[21]',
+  'section13.unemployment.entries[0].field22.value': 'form1[0].section13_4[0].#area[0].#field[22]',
+  'section13.unemployment.entries[0].field24.value': 'form1[0].section13_4[0].#area[1].#field[24]',
+  'section13.unemployment.entries[0].field25.value': 'form1[0].section13_4[0].#area[1].#field[25]',
+  'section13.unemployment.entries[0].field26.value': 'form1[0].section13_4[0].#area[1].#field[26]',
+  'section13.unemployment.entries[0].field3.value': 'form1[0].section13_4[0].#field[3]',
+  'section13.unemployment.entries[0].field36.value': 'form1[0].section13_4[0].#area[2].#field[36]',
+  'section13.unemployment.entries[0].field37.value': 'form1[0].section13_4[0].#area[2].#field[37]',
+  'section13.unemployment.entries[0].field42.value': 'form1[0].section13_4[0].#field[42]',
+  'section13.unemployment.entries[0].field43.value': 'form1[0].section13_4[0].#field[43]',
+  'section13.unemployment.entries[0].firstName.value': 'form1[0].section13_4[0].TextField11[0]',
+  'section13.unemployment.entries[0].fromDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[0]',
+  'section13.unemployment.entries[0].hasReference.value': 'form1[0].section13_4[0].RadioButtonList[0]',
+  'section13.unemployment.entries[0].isCurrentlyUnemployed.value': 'form1[0].section13_4[0].RadioButtonList[2]',
+  'section13.unemployment.entries[0].lastName.value': 'form1[0].section13_4[0].TextField11[1]',
+  'section13.unemployment.entries[0].phone0.value': 'form1[0].section13_4[0].p3-t68[0]',
+  'section13.unemployment.entries[0].receivedBenefits.value': 'form1[0].section13_4[0].RadioButtonList[1]',
+  'section13.unemployment.entries[0].referenceAddress2.value': 'form1[0].section13_4[0].TextField11[8]',
+  'section13.unemployment.entries[0].referenceCity.value': 'form1[0].section13_4[0].TextField11[3]',
+  'section13.unemployment.entries[0].referenceCity2.value': 'form1[0].section13_4[0].TextField11[9]',
+  'section13.unemployment.entries[0].referenceCountry.value': 'form1[0].section13_4[0].DropDownList6[0]',
+  'section13.unemployment.entries[0].referenceEmail.value': 'form1[0].section13_4[0].TextField11[7]',
+  'section13.unemployment.entries[0].referenceExtension.value': 'form1[0].section13_4[0].TextField11[6]',
+  'section13.unemployment.entries[0].referenceFromDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[8]',
+  'section13.unemployment.entries[0].referencePhone.value': 'form1[0].section13_4[0].TextField11[5]',
+  'section13.unemployment.entries[0].referenceState.value': 'form1[0].section13_4[0].School6_State[0]',
+  'section13.unemployment.entries[0].referenceState2.value': 'form1[0].section13_4[0].School6_State[1]',
+  'section13.unemployment.entries[0].referenceStreet.value': 'form1[0].section13_4[0].TextField11[2]',
+  'section13.unemployment.entries[0].referenceStreet2.value': 'form1[0].section13_4[0].TextField11[10]',
+  'section13.unemployment.entries[0].referenceToDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[9]',
+  'section13.unemployment.entries[0].referenceZip.value': 'form1[0].section13_4[0].TextField11[4]',
+  'section13.unemployment.entries[0].referenceZip2.value': 'form1[0].section13_4[0].TextField11[11]',
+  'section13.unemployment.entries[0].toDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[1]',
+  'section13.unemployment.entries[0].unemploymentEndDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[3]',
+  'section13.unemployment.entries[0].unemploymentStartDate.value': 'form1[0].section13_4[0].From_Datefield_Name_2[2]',
 } as const;
 
-// Total mappings: 436
-// Coverage: 40.1%
+/**
+ * Subform instance backing each entry of a multi-entry collection, by entry index
+ */
+export const GENERATED_SECTION13_ENTRY_SUBFORMS: Record<string, readonly string[]> = {
+  'section13.federalEmployment': ['form1[0].section_13_1-2[0]'],
+  'section13.nonFederalEmployment': ['form1[0].section13_2[0]', 'form1[0].section13_2[1]', 'form1[0].section13_2[2]'],
+  'section13.nonFederalEmploymentAdditional': ['form1[0].section13_2-2[0]'],
+  'section13.selfEmployment': ['form1[0].section13_3[0]', 'form1[0].section13_3[1]', 'form1[0].section13_3[2]'],
+  'section13.selfEmploymentAdditional': ['form1[0].section13_3-2[0]'],
+  'section13.unemployment': ['form1[0].section13_4[0]', 'form1[0].section13_4[1]', 'form1[0].section13_4[2]', 'form1[0].section13_4[3]'],
+};
+
+/**
+ * Mappings that exist only for some entries of their collection
+ */
+export const GENERATED_SECTION13_ENTRY_SPECIFIC_MAPPINGS: Record<string, string> = {
+  'section13.unemployment.entries[0].field17.value': 'form1[0].section13_4[0].#field[17]',
+  'section13.unemployment.entries[0].field23.value': 'form1[0].section13_4[0].#area[0].#field[23]',
+  'section13.unemployment.entries[0].field27.value': 'form1[0].section13_4[0].#area[1].#field[27]',
+  'section13.unemployment.entries[0].field28.value': 'form1[0].section13_4[0].#field[28]',
+  'section13.unemployment.entries[0].field31.value': 'form1[0].section13_4[0].#field[31]',
+  'section13.unemployment.entries[0].field33.value': 'form1[0].section13_4[0].#field[33]',
+  'section13.unemployment.entries[0].field35.value': 'form1[0].section13_4[0].#field[35]',
+  'section13.unemployment.entries[0].field38.value': 'form1[0].section13_4[0].#area[2].#field[38]',
+  'section13.unemployment.entries[0].field4.value': 'form1[0].section13_4[0].#field[4]',
+  'section13.unemployment.entries[0].field41.value': 'form1[0].section13_4[0].#area[2].#field[41]',
+  'section13.unemployment.entries[0].field44.value': 'form1[0].section13_4[0].#field[44]',
+  'section13.unemployment.entries[0].field47.value': 'form1[0].section13_4[0].#field[47]',
+  'section13.unemployment.entries[0].field6.value': 'form1[0].section13_4[0].#field[6]',
+  'section13.unemployment.entries[1].field17.value': 'form1[0].section13_4[1].#field[17]',
+  'section13.unemployment.entries[1].field23.value': 'form1[0].section13_4[1].#area[0].#field[23]',
+  'section13.unemployment.entries[1].field27.value': 'form1[0].section13_4[1].#area[1].#field[27]',
+  'section13.unemployment.entries[1].field28.value': 'form1[0].section13_4[1].#field[28]',
+  'section13.unemployment.entries[1].field31.value': 'form1[0].section13_4[1].#field[31]',
+  'section13.unemployment.entries[1].field33.value': 'form1[0].section13_4[1].#field[33]',
+  'section13.unemployment.entries[1].field35.value': 'form1[0].section13_4[1].#field[35]',
+  'section13.unemployment.entries[1].field38.value': 'form1[0].section13_4[1].#area[2].#field[38]',
+  'section13.unemployment.entries[1].field4.value': 'form1[0].section13_4[1].#field[4]',
+  'section13.unemployment.entries[1].field41.value': 'form1[0].section13_4[1].#area[2].#field[41]',
+  'section13.unemployment.entries[1].field44.value': 'form1[0].section13_4[1].#field[44]',
+  'section13.unemployment.entries[1].field47.value': 'form1[0].section13_4[1].#field[47]',
+  'section13.unemployment.entries[1].field6.value': 'form1[0].section13_4[1].#field[6]',
+  'section13.unemployment.entries[2].field14.value': 'form1[0].section13_4[2].#field[14]',
+  'section13.unemployment.entries[2].field19.value': 'form1[0].section13_4[2].#area[0].#field[19]',
+  'section13.unemployment.entries[2].field2.value': 'form1[0].section13_4[2].#field[2]',
+  'section13.unemployment.entries[2].field23.value': 'form1[0].section13_4[2].#area[1].#field[23]',
+  'section13.unemployment.entries[2].field27.value': 'form1[0].section13_4[2].#field[27]',
+  'section13.unemployment.entries[2].field30.value': 'form1[0].section13_4[2].#field[30]',
+  'section13.unemployment.entries[2].field32.value': 'form1[0].section13_4[2].#field[32]',
+  'section13.unemployment.entries[2].field34.value': 'form1[0].section13_4[2].#field[34]',
+  'section13.unemployment.entries[2].field35.value': 'form1[0].section13_4[2].#area[2].#field[35]',
+  'section13.unemployment.entries[2].field40.value': 'form1[0].section13_4[2].#area[2].#field[40]',
+  'section13.unemployment.entries[2].field41.value': 'form1[0].section13_4[2].#field[41]',
+  'section13.unemployment.entries[2].field46.value': 'form1[0].section13_4[2].#field[46]',
+  'section13.unemployment.entries[2].field5.value': 'form1[0].section13_4[2].#field[5]',
+  'section13.unemployment.entries[3].field17.value': 'form1[0].section13_4[3].#field[17]',
+  'section13.unemployment.entries[3].field23.value': 'form1[0].section13_4[3].#area[0].#field[23]',
+  'section13.unemployment.entries[3].field27.value': 'form1[0].section13_4[3].#area[1].#field[27]',
+  'section13.unemployment.entries[3].field28.value': 'form1[0].section13_4[3].#field[28]',
+  'section13.unemployment.entries[3].field31.value': 'form1[0].section13_4[3].#field[31]',
+  'section13.unemployment.entries[3].field33.value': 'form1[0].section13_4[3].#field[33]',
+  'section13.unemployment.entries[3].field35.value': 'form1[0].section13_4[3].#field[35]',
+  'section13.unemployment.entries[3].field38.value': 'form1[0].section13_4[3].#area[2].#field[38]',
+  'section13.unemployment.entries[3].field4.value': 'form1[0].section13_4[3].#field[4]',
+  'section13.unemployment.entries[3].field41.value': 'form1[0].section13_4[3].#area[2].#field[41]',
+  'section13.unemployment.entries[3].field44.value': 'form1[0].section13_4[3].#field[44]',
+  'section13.unemployment.entries[3].field47.value': 'form1[0].section13_4[3].#field[47]',
+  'section13.unemployment.entries[3].field6.value': 'form1[0].section13_4[3].#field[6]',
+};
+
+let expandedSection13FieldMappings: Record<string, string> | null = null;
+
+/**
+ * Full logical path -> PDF field lookup, expanded on first access
+ */
+export function getExpandedSection13FieldMappings(): Record<string, string> {
+  if (expandedSection13FieldMappings) {
+    return expandedSection13FieldMappings;
+  }
+
+  const expanded: Record<string, string> = {};
+  for (const [logicalPath, pdfField] of Object.entries(GENERATED_SECTION13_FIELD_MAPPINGS)) {
+    const marker = logicalPath.indexOf('.entries[0].');
+    const subforms = marker >= 0 ? GENERATED_SECTION13_ENTRY_SUBFORMS[logicalPath.slice(0, marker)] : undefined;
+    if (!subforms) {
+      expanded[logicalPath] = pdfField;
+      continue;
+    }
+
+    const relative = pdfField.slice(subforms[0].length);
+    subforms.forEach((subform, entryIndex) => {
+      expanded[logicalPath.replace('.entries[0].', `.entries[${entryIndex}].`)] = subform + relative;
+    });
+  }
+
+  expandedSection13FieldMappings = Object.assign(expanded, GENERATED_SECTION13_ENTRY_SPECIFIC_MAPPINGS);
+  return expandedSection13FieldMappings;
+}
+
+// Total mappings: 871
+// Templates: 414
+// Coverage: 80.2%
@@ -4,11 +4,20 @@ Phase 4: Integrate Non-Federal Employment (13A.2) Field Mappings
 Extract 13A.2 mappings from generated mappings and integrate into SECTION13_FIELD_MAPPINGS
 """
 
+import argparse
 import json
 import os
 import re
 
+from sf86_toolkit.json_modules import (
+    MAPPING_TABLE_TYPE, add_emit_argument, parse_mapping_lines, report_json_module, write_json_module
+)
+
 def main():
+    parser = argparse.ArgumentParser(description='Integrate Non-Federal Employment (13A.2) field mappings')
+    add_emit_argument(parser)
+    args = parser.parse_args()
+    
     # Load the generated mappings
     script_dir = os.path.dirname(os.path.abspath(__file__))
     generated_mappings_path = os.path.join(script_dir, 'generated-field-mappings.ts')
@@ -82,19 +91,28 @@ def main():
     
     # Save the integration code
     output_path = os.path.join(script_dir, 'non-federal-employment-mappings-integration.ts')
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('// Non-Federal Employment (13A.2) field mappings for integration\n')
-            f.write('// Add these to SECTION13_FIELD_MAPPINGS in section13-field-mapping.ts\n\n')
-            f.write('\n'.join(integration_code))
-            f.write('\n\n')
-            f.write(f'// Total Non-Federal Employment mappings: {len(non_federal_mappings) + len(non_federal_additional_mappings)}\n')
-            f.write(f'// Main section mappings: {len(non_federal_mappings)}\n')
-            f.write(f'// Additional section mappings: {len(non_federal_additional_mappings)}\n')
+    if args.emit != 'ts':
+        # Emit a standalone JSON module instead of the integration snippet
+        table = parse_mapping_lines(non_federal_mappings + non_federal_additional_mappings)
+        written = write_json_module(
+            table, output_path, 'NON_FEDERAL_EMPLOYMENT_FIELD_MAPPINGS', MAPPING_TABLE_TYPE, args.emit,
+            header_lines=['Non-Federal Employment (13A.2) field mappings', 'Generated by integrate-non-federal-employment-mappings.py'])
+        print(f'✅ JSON module saved to: {output_path}')
+        report_json_module(table, written)
+    else:
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('// Non-Federal Employment (13A.2) field mappings for integration\n')
+                f.write('// Add these to SECTION13_FIELD_MAPPINGS in section13-field-mapping.ts\n\n')
+                f.write('\n'.join(integration_code))
+                f.write('\n\n')
+                f.write(f'// Total Non-Federal Employment mappings: {len(non_federal_mappings) + len(non_federal_additional_mappings)}\n')
+                f.write(f'// Main section mappings: {len(non_federal_mappings)}\n')
+                f.write(f'// Additional section mappings: {len(non_federal_additional_mappings)}\n')
         
-        print(f'✅ Integration code saved to: {output_path}')
-    except Exception as e:
-        print(f'⚠️  Could not save integration code: {e}')
+            print(f'✅ Integration code saved to: {output_path}')
+        except Exception as e:
+            print(f'⚠️  Could not save integration code: {e}')
     
     # Analyze the field coverage
     print(f'\n📊 NON-FEDERAL EMPLOYMENT FIELD ANALYSIS:')
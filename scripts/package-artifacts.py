@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Package Precompressed Artifacts
+Writes gzip and brotli/xz variants of every reference bundle and generated
+mapping module to reports/precompressed/, prints raw, compressed and parse
+size per artifact, and fails when any size exceeds its budget in
+scripts/artifact-budgets.json
+
+    python3 package-artifacts.py
+    python3 package-artifacts.py --update-budgets --headroom 0.05
+"""
+
+import argparse
+import json
+import os
+
+from sf86_toolkit.artifacts import (DEFAULT_BUDGETS_PATH, DEFAULT_HEADROOM, DEFAULT_OUTPUT_DIR, budgets_from_sizes,
+                                    check_budgets, compressors, find_artifacts, load_budgets, measure_artifact,
+                                    save_budgets)
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompress shipped artifacts and check them against size budgets')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='directory for the compressed variants')
+    parser.add_argument('--no-write', action='store_true', help='only measure, do not write compressed files')
+    parser.add_argument('--budgets', default=DEFAULT_BUDGETS_PATH, help='budgets JSON path')
+    parser.add_argument('--update-budgets', action='store_true', help='rewrite the budgets from the current sizes')
+    parser.add_argument('--headroom', type=float, default=DEFAULT_HEADROOM,
+                        help='share added to current sizes by --update-budgets')
+    parser.add_argument('--report', help='write the measurements as JSON to this path')
+    args = parser.parse_args()
+
+    metrics = ['raw'] + [metric for metric, _, _ in compressors()] + ['parse']
+    budgets = load_budgets(args.budgets)
+
+    print('📦 PACKAGING PRECOMPRESSED ARTIFACTS')
+    print('=' * 60)
+    measurements = {}
+    for path in find_artifacts():
+        sizes = measure_artifact(path, None if args.no_write else args.output_dir)
+        measurements[path] = sizes
+        flag = '' if path in budgets else '  (no budget)'
+        print(f"   {path:<58} " + '  '.join(f'{metric} {sizes[metric]:>9,}' for metric in metrics) + flag)
+
+    totals = {metric: sum(sizes[metric] for sizes in measurements.values()) for metric in metrics}
+    print(f'\n📊 {len(measurements)} artifacts: ' + ', '.join(f'{metric} {size:,}' for metric, size in totals.items()))
+    if not args.no_write:
+        print(f'💾 Compressed variants written to {args.output_dir}')
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'totals': totals, 'artifacts': measurements}, f, indent=2)
+
+    if args.update_budgets:
+        save_budgets(budgets_from_sizes(measurements, args.headroom), args.budgets, args.headroom)
+        print(f'💾 Budgets updated ({args.headroom:.0%} headroom) -> {args.budgets}')
+        return
+
+    regressions = check_budgets(measurements, budgets)
+    if regressions:
+        print(f'\n❌ {len(regressions)} sizes over budget:')
+        for path, metric, size, budget in regressions:
+            print(f'   {path} {metric}: {size:,} > {budget:,} bytes (+{(size / budget - 1) * 100:.1f}%)')
+        raise SystemExit(1)
+    print('✅ All artifacts within budget')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Applicant Completeness Scoring
+Scores how complete each applicant's form is, per section and per subsection,
+against the reference fields. Applicants are turned into boolean masks over
+the reference field ids (from applicant dumps, or straight from a columnar
+store built by applicant-columns.py) and scored a batch at a time with NumPy
+reductions. Writes one NDJSON report per applicant plus a batch summary
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+import numpy as np
+
+from sf86_toolkit.completeness import BATCH_SIZE, CompletenessIndex
+from sf86_toolkit.constraints import ConstraintTables
+from sf86_toolkit.records import iter_records, record_data
+
+def iter_record_batches(inputs, index, batch_size):
+    """Yield (applicant ids, masks) from applicant dumps"""
+    records = enumerate(iter_records(inputs))
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            return
+        ids = []
+        masks = np.zeros((len(batch), index.field_count), dtype=bool)
+        for position, (number, text) in enumerate(batch):
+            record = json.loads(text)
+            ids.append(record.get('applicantId', number) if isinstance(record, dict) else number)
+            index.mask(record_data(record), masks[position])
+        yield ids, masks
+
+def iter_store_batches(store_dir, index, batch_size):
+    """Yield (applicant ids, masks) from a columnar store"""
+    from sf86_toolkit.columnar import ColumnarStore
+
+    store = ColumnarStore(store_dir)
+    applicant_ids = store.manifest['applicantIds']
+    for start in range(0, store.applicant_count, batch_size):
+        yield applicant_ids[start:start + batch_size], index.masks_from_store(store, start, start + batch_size)
+
+def main():
+    parser = argparse.ArgumentParser(description='Score per-section and per-subsection completeness of applicant forms')
+    parser.add_argument('inputs', nargs='*', default=['-'], help='NDJSON or JSON-array applicant files (- for stdin)')
+    parser.add_argument('--store', help='score a columnar store (applicant-columns.py export) instead of dumps')
+    parser.add_argument('--output', help='NDJSON report path (default: stdout)')
+    parser.add_argument('--summary-only', action='store_true', help='only print the batch summary')
+    parser.add_argument('--no-subsections', action='store_true', help='leave subsection scores out of the reports')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='applicants scored per batch')
+    args = parser.parse_args()
+
+    index = CompletenessIndex(ConstraintTables.from_references())
+    print(f'📋 {index.field_count} reference fields in {len(index.section_ids)} sections, '
+          f'{len(index.subsection_labels)} subsections', file=sys.stderr)
+
+    if args.store:
+        batches = iter_store_batches(args.store, index, args.batch_size)
+    else:
+        batches = iter_record_batches(args.inputs, index, args.batch_size)
+
+    output = None if args.summary_only else (open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout)
+    applicants = 0
+    section_totals = np.zeros(len(index.section_ids))
+    overall_total = 0.0
+    scoring_time = 0.0
+    start = time.perf_counter()
+
+    try:
+        for ids, masks in batches:
+            scoring_start = time.perf_counter()
+            section_scores, subsection_scores = index.score(masks)
+            overall = index.overall(masks)
+            scoring_time += time.perf_counter() - scoring_start
+
+            applicants += len(ids)
+            section_totals += section_scores.sum(axis=0)
+            overall_total += float(overall.sum())
+            if output is None:
+                continue
+            for position, applicant_id in enumerate(ids):
+                report = {
+                    'applicant': applicant_id,
+                    'overall': round(float(overall[position]), 4),
+                    'sections': dict(zip(map(str, index.section_ids), np.round(section_scores[position], 4).tolist())),
+                }
+                if not args.no_subsections:
+                    report['subsections'] = dict(zip(index.subsection_labels,
+                                                     np.round(subsection_scores[position], 4).tolist()))
+                output.write(json.dumps(report) + '\n')
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f'✅ Scored {applicants} applicants in {elapsed:.2f}s '
+          f'({scoring_time * 1000:.1f} ms in the NumPy reductions)', file=sys.stderr)
+    if applicants:
+        print(f'📊 Mean completeness: {overall_total / applicants * 100:.1f}% overall', file=sys.stderr)
+        for section, total in zip(index.section_ids, section_totals):
+            print(f'   Section {section:>2}: {total / applicants * 100:5.1f}%', file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
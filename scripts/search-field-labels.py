@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Search Field Labels
+Full-text search over the labels of every reference field, backed by an
+SQLite FTS5 index (reports/field-label-index.sqlite) that is rebuilt
+automatically when the section exports change. Prints each match with its
+section, subform, page and type
+
+    python3 search-field-labels.py supervisor name
+    python3 search-field-labels.py "phone number" --section 13 --type PDFTextField
+    python3 search-field-labels.py --raw 'estimate NOT row'
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+
+from sf86_toolkit.label_search import DEFAULT_INDEX_PATH, build_label_index, index_is_current, search_labels
+
+def main():
+    parser = argparse.ArgumentParser(description='Full-text search over reference field labels')
+    parser.add_argument('query', nargs='*', help='words to find (all required, the last one as a prefix)')
+    parser.add_argument('--section', type=int, help='only fields of this section')
+    parser.add_argument('--type', help='only fields of this PDF type (PDFTextField, PDFCheckBox, ...)')
+    parser.add_argument('--limit', type=int, default=20, help='maximum matches')
+    parser.add_argument('--raw', action='store_true', help='pass the query to FTS5 MATCH unchanged')
+    parser.add_argument('--json', action='store_true', help='print matches as JSON')
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='index database path')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the index even if it is current')
+    args = parser.parse_args()
+
+    if args.rebuild or not index_is_current(args.index):
+        start = time.perf_counter()
+        count = build_label_index(args.index)
+        print(f'🔧 Indexed {count} field labels in {time.perf_counter() - start:.2f}s -> {args.index}')
+    if not args.query:
+        return
+
+    start = time.perf_counter()
+    with sqlite3.connect(args.index) as connection:
+        matches = search_labels(connection, ' '.join(args.query), args.section, args.type, args.limit, args.raw)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(matches, indent=2, ensure_ascii=False))
+        return
+    for match in matches:
+        print(f"S{match['section']:<3} p{match['page'] or '?':<4} {match['type']:<14} {match['name']}")
+        print(f"     {match['snippet']}")
+    print(f'📊 {len(matches)} matches ({elapsed_ms:.1f} ms)')
+
+if __name__ == '__main__':
+    main()
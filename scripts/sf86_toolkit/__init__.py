@@ -0,0 +1,4 @@
+"""
+SF-86 Python toolkit
+Shared helpers for the generators and analysis scripts in scripts/
+"""
@@ -0,0 +1,110 @@
+"""
+Precompressed build artifacts and size budgets
+Finds the reference bundles and generated mapping modules the app ships,
+writes gzip and brotli (xz when the brotli module is not installed) variants
+of each, and measures raw, compressed and parse size against per-artifact
+budgets
+"""
+
+import glob
+import gzip
+import json
+import lzma
+import os
+
+from .references import REPO_ROOT
+from .ts_interfaces import strip_comments
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Repo-relative glob patterns of shipped artifacts (generators that have not
+# been run simply match nothing)
+ARTIFACT_PATTERNS = [
+    'api/sections-references/bundles/section-*.json',
+    'api/sections-references/projections/*/section-*.json',
+    'api/interfaces/sections2.0/mappings/*.ts',
+    'api/interfaces/sections2.0/mappings/*.json',
+    'api/interfaces/sections2.0/section13-complete-mappings.*',
+    'scripts/generated-field-mappings.ts',
+    'scripts/*-mappings-integration.ts',
+    'scripts/*-mappings-integration.json',
+]
+
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'reports', 'precompressed')
+DEFAULT_BUDGETS_PATH = os.path.join(REPO_ROOT, 'scripts', 'artifact-budgets.json')
+
+# Budget headroom when budgets are (re)written from the current sizes
+DEFAULT_HEADROOM = 0.05
+
+def compressors():
+    """[(metric, file suffix, compress function)] for the available encodings"""
+    encodings = [('gzip', '.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encodings.append(('brotli', '.br', lambda data: brotli.compress(data, quality=11)))
+    else:
+        encodings.append(('xz', '.xz', lambda data: lzma.compress(data, preset=9 | lzma.PRESET_EXTREME)))
+    return encodings
+
+def find_artifacts(patterns=ARTIFACT_PATTERNS):
+    """Sorted repo-relative paths of every artifact matching the patterns"""
+    paths = set()
+    for pattern in patterns:
+        paths.update(os.path.relpath(path, REPO_ROOT) for path in glob.glob(os.path.join(REPO_ROOT, pattern)))
+    return sorted(paths)
+
+def parse_size(path, data):
+    """Bytes the JS engine parses: minified JSON, or a module without comments and indentation"""
+    text = data.decode('utf-8')
+    if path.endswith('.json'):
+        return len(json.dumps(json.loads(text), separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    lines = (line.strip() for line in strip_comments(text).splitlines())
+    return len('\n'.join(line for line in lines if line).encode('utf-8'))
+
+def measure_artifact(path, output_dir=None):
+    """{'raw', 'parse', <metric>...} byte sizes for one artifact, writing the
+    compressed variants under output_dir when it is given"""
+    with open(os.path.join(REPO_ROOT, path), 'rb') as f:
+        data = f.read()
+    sizes = {'raw': len(data), 'parse': parse_size(path, data)}
+    for metric, suffix, compress in compressors():
+        compressed = compress(data)
+        sizes[metric] = len(compressed)
+        if output_dir:
+            output_path = os.path.join(output_dir, path + suffix)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(compressed)
+    return sizes
+
+def load_budgets(path=DEFAULT_BUDGETS_PATH):
+    """{artifact path: {metric: byte budget}}; empty when there is no budgets file"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['artifacts']
+
+def budgets_from_sizes(measurements, headroom=DEFAULT_HEADROOM):
+    """Budgets of the current sizes plus headroom, for every metric measured"""
+    return {path: {metric: int(size * (1 + headroom)) + 1 for metric, size in sizes.items()}
+            for path, sizes in sorted(measurements.items())}
+
+def save_budgets(budgets, path=DEFAULT_BUDGETS_PATH, headroom=DEFAULT_HEADROOM):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'headroom': headroom, 'artifacts': budgets}, f, indent=2)
+        f.write('\n')
+
+def check_budgets(measurements, budgets):
+    """[(path, metric, size, budget)] for every size over its budget
+
+    Metrics without a budget (e.g. brotli sizes against budgets written with
+    xz) are not checked.
+    """
+    regressions = []
+    for path, sizes in sorted(measurements.items()):
+        for metric, budget in budgets.get(path, {}).items():
+            if metric in sizes and sizes[metric] > budget:
+                regressions.append((path, metric, sizes[metric], budget))
+    return regressions
@@ -0,0 +1,207 @@
+"""
+SQLite field catalog
+Loads the section reference exports and the section TypeScript sources into
+normalized tables (sections, pages, subforms, fields, field_options,
+mappings) for ad-hoc SQL. Every ingested file is recorded with its mtime and
+size, and an update only reloads the files that changed
+"""
+
+import json
+import os
+import re
+import sqlite3
+
+from .references import REFERENCES_DIR, REPO_ROOT
+from .section_checks import CONTEXTS_DIR, INTERFACES_DIR, js_literal
+from .ts_interfaces import default_reference_paths
+
+DEFAULT_CATALOG_PATH = os.path.join(REPO_ROOT, 'reports', 'field-catalog.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    section_id INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    section_id INTEGER PRIMARY KEY,
+    name TEXT,
+    export_date TEXT,
+    field_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    page INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS subforms (
+    subform_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS fields (
+    field_row INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES sections ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    pdf_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    unique_id TEXT,
+    subform_id INTEGER NOT NULL REFERENCES subforms,
+    page INTEGER REFERENCES pages,
+    type TEXT NOT NULL,
+    label TEXT,
+    max_length INTEGER,
+    x REAL, y REAL, width REAL, height REAL,
+    confidence REAL,
+    entry INTEGER,
+    subsection TEXT,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS fields_section ON fields (section_id, position);
+CREATE INDEX IF NOT EXISTS fields_name ON fields (name);
+CREATE INDEX IF NOT EXISTS fields_pdf_id ON fields (pdf_id);
+CREATE INDEX IF NOT EXISTS fields_page_type ON fields (page, type);
+CREATE INDEX IF NOT EXISTS fields_type_section ON fields (type, section_id);
+CREATE INDEX IF NOT EXISTS fields_subform ON fields (subform_id);
+CREATE TABLE IF NOT EXISTS field_options (
+    field_row INTEGER NOT NULL REFERENCES fields ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (field_row, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS field_options_value ON field_options (value);
+CREATE TABLE IF NOT EXISTS mappings (
+    source_path TEXT NOT NULL REFERENCES source_files ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    section_id INTEGER NOT NULL,
+    identifier TEXT NOT NULL,
+    field_path TEXT,
+    PRIMARY KEY (source_path, line, identifier)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS mappings_identifier ON mappings (section_id, identifier);
+CREATE VIEW IF NOT EXISTS field_mappings AS
+    SELECT fields.field_row, mappings.source_path, mappings.line, mappings.field_path
+    FROM mappings
+    JOIN fields ON fields.section_id = mappings.section_id
+               AND (fields.name = mappings.identifier OR fields.pdf_id = mappings.identifier);
+"""
+
+# Field identifiers written as string literals in section sources: PDF names,
+# "9434 0 R" ids and bare "9434" ids (stored as "9434 0 R")
+IDENTIFIER_LITERAL = re.compile(r'([\'"`])(form1\[0\][^\'"`\n]*|\d{3,5}(?: 0 R)?)\1')
+
+# Section TypeScript sources that can map fields: (directory, file pattern)
+MAPPING_SOURCES = [
+    (INTERFACES_DIR, re.compile(r'section(\d+)(?:-[\w-]+)?\.ts')),
+    (CONTEXTS_DIR, re.compile(r'section(\d+)(?:-[\w-]+)?\.tsx?')),
+]
+
+def connect(path=DEFAULT_CATALOG_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA foreign_keys = ON')
+    connection.executescript(SCHEMA)
+    return connection
+
+def catalog_sources(references_dir=REFERENCES_DIR):
+    """{repo-relative path: (kind, section id)} for every file the catalog is built from"""
+    sources = {}
+    for file_name in os.listdir(references_dir):
+        match = re.fullmatch(r'section-(\d+)\.json', file_name)
+        if match:
+            sources[os.path.relpath(os.path.join(references_dir, file_name), REPO_ROOT)] = ('reference', int(match.group(1)))
+    for directory, pattern in MAPPING_SOURCES:
+        if not os.path.isdir(directory):
+            continue
+        for file_name in os.listdir(directory):
+            match = pattern.fullmatch(file_name)
+            if match:
+                sources[os.path.relpath(os.path.join(directory, file_name), REPO_ROOT)] = ('source', int(match.group(1)))
+    return sources
+
+def subform_id(connection, path):
+    connection.execute('INSERT OR IGNORE INTO subforms (path) VALUES (?)', (path,))
+    return connection.execute('SELECT subform_id FROM subforms WHERE path = ?', (path,)).fetchone()[0]
+
+def load_reference(connection, section_id, path):
+    """Replace one section's rows with the contents of its export"""
+    with open(os.path.join(REPO_ROOT, path), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    metadata = data.get('metadata', {})
+    fields = data.get('fields', [])
+    connection.execute('DELETE FROM sections WHERE section_id = ?', (section_id,))
+    connection.execute('INSERT INTO sections VALUES (?, ?, ?, ?)',
+                       (section_id, metadata.get('sectionName'), metadata.get('exportDate'), len(fields)))
+
+    subform_ids = {}
+    options = []
+    for position, field in enumerate(fields):
+        subform = field['name'].rpartition('.')[0]
+        if subform not in subform_ids:
+            subform_ids[subform] = subform_id(connection, subform)
+        if field.get('page') is not None:
+            connection.execute('INSERT OR IGNORE INTO pages VALUES (?)', (field['page'],))
+        rect = field.get('rect') or {}
+        value = field.get('value')
+        cursor = connection.execute(
+            'INSERT INTO fields (section_id, position, pdf_id, name, unique_id, subform_id, page, type, label, '
+            'max_length, x, y, width, height, confidence, entry, subsection, value) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (section_id, position, field['id'], field['name'], field.get('uniqueId'), subform_ids[subform],
+             field.get('page'), field['type'], field.get('label'), field.get('maxLength'), rect.get('x'),
+             rect.get('y'), rect.get('width'), rect.get('height'), field.get('confidence'), field.get('entry'),
+             field.get('subsection'), None if value is None else json.dumps(value) if not isinstance(value, str) else value))
+        options.extend((cursor.lastrowid, index, str(option)) for index, option in enumerate(field.get('options') or ()))
+    connection.executemany('INSERT INTO field_options VALUES (?, ?, ?)', options)
+    return len(fields)
+
+def load_source(connection, section_id, path):
+    """Record the field identifiers a section source mentions (with the object path when known)"""
+    with open(os.path.join(REPO_ROOT, path), 'r', encoding='utf-8') as f:
+        source = f.read()
+    paths = {}
+    for field_path, identifier in default_reference_paths(source, section_id):
+        paths.setdefault(identifier, field_path)
+    rows = set()
+    for match in IDENTIFIER_LITERAL.finditer(source):
+        identifier = js_literal(match.group(2))
+        if identifier.isdigit():
+            identifier += ' 0 R'
+        line = source.count('\n', 0, match.start()) + 1
+        field_path = paths.get(identifier, paths.get(identifier.replace(' 0 R', '')))
+        rows.add((path, line, section_id, identifier, field_path))
+    connection.executemany('INSERT OR IGNORE INTO mappings VALUES (?, ?, ?, ?, ?)', sorted(rows))
+    return len(rows)
+
+def update_catalog(connection, references_dir=REFERENCES_DIR, force=False):
+    """Reload changed, new and deleted source files; returns {path: 'loaded' | 'removed'}"""
+    sources = catalog_sources(references_dir)
+    recorded = {path: (mtime, size) for path, mtime, size in connection.execute('SELECT path, mtime, size FROM source_files')}
+    changes = {}
+
+    with connection:
+        for path in sorted(set(recorded) - set(sources)):
+            kind, section_id = connection.execute('SELECT kind, section_id FROM source_files WHERE path = ?', (path,)).fetchone()
+            if kind == 'reference':
+                connection.execute('DELETE FROM sections WHERE section_id = ?', (section_id,))
+            connection.execute('DELETE FROM source_files WHERE path = ?', (path,))
+            changes[path] = 'removed'
+
+        for path, (kind, section_id) in sorted(sources.items()):
+            stat = os.stat(os.path.join(REPO_ROOT, path))
+            if not force and recorded.get(path) == (stat.st_mtime, stat.st_size):
+                continue
+            connection.execute('DELETE FROM source_files WHERE path = ?', (path,))
+            connection.execute('INSERT INTO source_files VALUES (?, ?, ?, ?, ?)',
+                               (path, kind, section_id, stat.st_mtime, stat.st_size))
+            if kind == 'reference':
+                load_reference(connection, section_id, path)
+            else:
+                load_source(connection, section_id, path)
+            changes[path] = 'loaded'
+
+        if changes:
+            connection.execute('DELETE FROM subforms WHERE subform_id NOT IN (SELECT DISTINCT subform_id FROM fields)')
+            connection.execute('DELETE FROM pages WHERE page NOT IN (SELECT DISTINCT page FROM fields WHERE page IS NOT NULL)')
+    if changes:
+        connection.execute('ANALYZE')
+    return changes
@@ -0,0 +1,143 @@
+"""
+Code-split mapping modules
+Splits generated mapping tables into one module per section (per subsection
+for Section 13) and writes a manifest of dynamic import() loaders
+"""
+
+import json
+import os
+import re
+
+from .mapping_keys import FIELD_CATEGORIES
+
+# Section 13 subsections, in form order: (chunk id, label, module name, subform pattern)
+SECTION13_SUBSECTIONS = [
+    ('13A.1', 'Federal Employment', 'federal-employment', re.compile(r'^form1\[0\]\.section_13_1')),
+    ('13A.2', 'Non-Federal Employment', 'non-federal-employment', re.compile(r'^form1\[0\]\.section13_2')),
+    ('13A.3', 'Self-Employment', 'self-employment', re.compile(r'^form1\[0\]\.section13_3')),
+    ('13A.4', 'Unemployment', 'unemployment', re.compile(r'^form1\[0\]\.section13_4')),
+    ('13A.5-13A.6', 'Employment Record Issues', 'employment-issues', re.compile(r'^form1\[0\]\.section13_5')),
+]
+
+MAPPING_TABLES_TYPE = (
+    "Readonly<Record<'TEXT_FIELDS' | 'CHECKBOX_FIELDS' | 'RADIO_FIELDS' | 'DROPDOWN_FIELDS' | 'STRING_VALUES', "
+    "Readonly<Record<string, string>>>>"
+)
+
+def chunk_for_field(section_id, field_name):
+    """Return (chunk id, label suffix, module path) for a field"""
+    if section_id == 13:
+        for chunk_id, label, module_name, pattern in SECTION13_SUBSECTIONS:
+            if pattern.match(field_name):
+                return chunk_id, label, f'section13/{module_name}'
+    return f'section{section_id}', None, f'section{section_id}'
+
+def split_section_fields(section_id, fields):
+    """Group a section's (index, field) pairs by chunk, preserving form order
+
+    Returns an ordered dict: chunk id -> {'label', 'module', 'fields'}.
+    """
+    chunks = {}
+    for index, field in fields:
+        chunk_id, label, module_path = chunk_for_field(section_id, field.get('name', ''))
+        chunk = chunks.setdefault(chunk_id, {'label': label, 'module': module_path, 'fields': []})
+        chunk['fields'].append((index, field))
+
+    if section_id == 13:
+        order = [chunk_id for chunk_id, _, _, _ in SECTION13_SUBSECTIONS]
+        chunks = dict(sorted(chunks.items(), key=lambda item: order.index(item[0]) if item[0] in order else len(order)))
+    return chunks
+
+def render_chunk_module(title, tables, field_count):
+    """Render one chunk as a literal TypeScript module"""
+    lines = [
+        f'// {title}',
+        '// Generated by generate-split-field-mappings.py',
+        '',
+        'export const FIELD_MAPPINGS = {',
+    ]
+    for category in FIELD_CATEGORIES + ['STRING_VALUES']:
+        lines.append(f'  {category}: {{')
+        for key, value in sorted(tables[category].items()):
+            lines.append(f'    {json.dumps(key)}: {json.dumps(value)},')
+        lines.append('  },')
+    lines.append('} as const;')
+    lines.append('')
+    lines.append(f'export const FIELD_COUNT = {field_count};')
+    lines.append('')
+    return '\n'.join(lines)
+
+def render_manifest(manifest_entries):
+    """Render index.ts: chunk metadata plus cached dynamic import() loaders
+
+    manifest_entries is a list of dicts with id, section, label, module and
+    fieldCount, in form order.
+    """
+    lines = [
+        '// Field mapping chunk manifest',
+        '// Generated by generate-split-field-mappings.py',
+        '',
+        f'export type FieldMappingTables = {MAPPING_TABLES_TYPE};',
+        '',
+        'export interface FieldMappingChunk {',
+        '  section: number;',
+        '  label: string;',
+        '  fieldCount: number;',
+        '  load: () => Promise<FieldMappingTables>;',
+        '}',
+        '',
+        '/**',
+        ' * Every mapping chunk, loaded on demand through dynamic import()',
+        ' */',
+        'export const FIELD_MAPPING_CHUNKS = {',
+    ]
+    for entry in manifest_entries:
+        lines.append(
+            f"  {json.dumps(entry['id'])}: {{ section: {entry['section']}, label: {json.dumps(entry['label'])}, "
+            f"fieldCount: {entry['fieldCount']}, load: () => import('./{entry['module']}').then((m) => m.FIELD_MAPPINGS) }},"
+        )
+    lines.append('} satisfies Record<string, FieldMappingChunk>;')
+    lines.append('')
+    lines.append('export type FieldMappingChunkId = keyof typeof FIELD_MAPPING_CHUNKS;')
+    lines.append('')
+
+    section_chunks = {}
+    for entry in manifest_entries:
+        section_chunks.setdefault(entry['section'], []).append(entry['id'])
+    lines.append('/**')
+    lines.append(' * Chunk ids backing each section, in form order')
+    lines.append(' */')
+    lines.append('export const SECTION_CHUNK_IDS: Readonly<Record<number, readonly FieldMappingChunkId[]>> = {')
+    for section_id, chunk_ids in section_chunks.items():
+        lines.append(f"  {section_id}: [{', '.join(json.dumps(chunk_id) for chunk_id in chunk_ids)}],")
+    lines.append('};')
+    lines.append('')
+
+    lines.extend([
+        'const loadedChunks = new Map<FieldMappingChunkId, Promise<FieldMappingTables>>();',
+        '',
+        '/**',
+        ' * Load one chunk; repeated calls share the same import',
+        ' */',
+        'export function loadFieldMappingChunk(id: FieldMappingChunkId): Promise<FieldMappingTables> {',
+        '  let chunk = loadedChunks.get(id);',
+        '  if (!chunk) {',
+        '    chunk = FIELD_MAPPING_CHUNKS[id].load();',
+        '    loadedChunks.set(id, chunk);',
+        '  }',
+        '  return chunk;',
+        '}',
+        '',
+        '/**',
+        ' * Load every chunk of a section',
+        ' */',
+        'export function loadSectionFieldMappings(section: number): Promise<FieldMappingTables[]> {',
+        '  return Promise.all((SECTION_CHUNK_IDS[section] ?? []).map(loadFieldMappingChunk));',
+        '}',
+        '',
+    ])
+    return '\n'.join(lines)
+
+def ensure_parent_dir(path):
+    """Create the directory holding path if needed"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -0,0 +1,271 @@
+"""
+Columnar applicant store
+One column per reference field, keyed by uniqueId, for many applicants:
+dropdowns and radios as int16 dictionary codes and checkboxes as int8 flags
+(dense, field-major, so each column is one contiguous row), and text as
+sparse (column, applicant) cells pointing into a UTF-8 heap. Per-field
+aggregates are single vectorized NumPy reductions
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .constraints import FIELD_TYPES, OPTION_FIELD_TYPES, iter_form_fields
+from .flatten_plan import coerce_checkbox, js_string
+
+MANIFEST_NAME = 'columns.json'
+ARRAY_FILES = {
+    'categorical': 'categorical.npy',
+    'checkbox': 'checkbox.npy',
+    'textColumnStarts': 'text-column-starts.npy',
+    'textApplicants': 'text-applicants.npy',
+    'textOffsets': 'text-offsets.npy',
+    'textLengths': 'text-lengths.npy',
+}
+# Sparse text cells, stored sorted by (column, applicant)
+TEXT_CELL_ARRAYS = ['textColumns', 'textApplicants', 'textOffsets', 'textLengths']
+TEXT_CELL_DTYPES = [np.int32, np.int32, np.int64, np.int32]
+TEXT_HEAP_NAME = 'text-heap.bin'
+
+# Applicants buffered before a chunk of rows is appended to the store
+CHUNK_SIZE = 4096
+
+MISSING = -1
+
+def column_kind(field_type):
+    if field_type in OPTION_FIELD_TYPES:
+        return 'categorical'
+    if field_type == 'PDFCheckBox':
+        return 'checkbox'
+    return 'text'
+
+def filled_cells(kind, codes):
+    """Mask of filled cells in categorical or checkbox codes: any option
+    counts, but a checkbox is only filled when checked (code 1), as in
+    completeness.py"""
+    codes = np.asarray(codes)
+    return codes == 1 if kind == 'checkbox' else codes >= 0
+
+class ColumnarWriter:
+    """Streams applicant trees into column arrays; call add() per applicant, then close()"""
+
+    def __init__(self, output_dir, constraints):
+        self.output_dir = output_dir
+        self.constraints = constraints
+        os.makedirs(output_dir, exist_ok=True)
+
+        # One column per distinct uniqueId, in reference order
+        self.columns = {kind: [] for kind in ('categorical', 'checkbox', 'text')}
+        self.column_of_row = {}
+        column_of_unique_id = {}
+        for row, unique_id in enumerate(constraints.unique_ids):
+            if not unique_id:
+                continue
+            if unique_id not in column_of_unique_id:
+                kind = column_kind(FIELD_TYPES[constraints.types[row]])
+                column_of_unique_id[unique_id] = (kind, len(self.columns[kind]))
+                self.columns[kind].append(row)
+            self.column_of_row[row] = column_of_unique_id[unique_id]
+
+        # Dictionaries start from the field options so codes are stable across exports
+        self.dictionaries = []
+        self.codes = []
+        for row in self.columns['categorical']:
+            option_set = constraints.option_set_of[row]
+            values = list(constraints.option_lists[option_set]) if option_set >= 0 else []
+            self.dictionaries.append(values)
+            self.codes.append({value: code for code, value in reversed(list(enumerate(values)))})
+
+        self.applicant_ids = []
+        self.chunks = {name: [] for name in ['categorical', 'checkbox'] + TEXT_CELL_ARRAYS}
+        self.pending = []
+        self.heap = open(os.path.join(output_dir, TEXT_HEAP_NAME), 'wb')
+        self.heap_size = 0
+
+    def add(self, applicant_id, data):
+        self.applicant_ids.append(applicant_id)
+        self.pending.append(data)
+        if len(self.pending) >= CHUNK_SIZE:
+            self._flush()
+
+    def _encode(self, kind, column, value):
+        if kind == 'checkbox':
+            return int(coerce_checkbox(value, self.constraints, None))
+        text = js_string(value)
+        if kind == 'categorical':
+            codes = self.codes[column]
+            if text not in codes:
+                if len(codes) > np.iinfo(np.int16).max:
+                    raise ValueError(f'Too many distinct values for {self.constraints.names[self.columns[kind][column]]}')
+                codes[text] = len(self.dictionaries[column])
+                self.dictionaries[column].append(text)
+            return codes[text]
+        encoded = text.encode('utf-8')
+        self.heap.write(encoded)
+        self.heap_size += len(encoded)
+        return len(encoded)
+
+    def _flush(self):
+        if not self.pending:
+            return
+        first_applicant = len(self.applicant_ids) - len(self.pending)
+        categorical = np.full((len(self.columns['categorical']), len(self.pending)), MISSING, dtype=np.int16)
+        checkbox = np.full((len(self.columns['checkbox']), len(self.pending)), MISSING, dtype=np.int8)
+        dense = {'categorical': categorical, 'checkbox': checkbox}
+        text_cells = []
+
+        for applicant, data in enumerate(self.pending):
+            for _, field in iter_form_fields(data):
+                value = field.get('value')
+                if not field.get('id') or value is None or value == '':
+                    continue
+                row = self.constraints.find_row(field['id'], field.get('name'))
+                if row not in self.column_of_row:
+                    continue
+                kind, column = self.column_of_row[row]
+                if kind == 'text':
+                    offset = self.heap_size
+                    text_cells.append((column, first_applicant + applicant, offset, self._encode(kind, column, value)))
+                else:
+                    dense[kind][column, applicant] = self._encode(kind, column, value)
+
+        self.chunks['categorical'].append(categorical)
+        self.chunks['checkbox'].append(checkbox)
+        cells = list(zip(*text_cells)) or [()] * len(TEXT_CELL_ARRAYS)
+        for name, values, dtype in zip(TEXT_CELL_ARRAYS, cells, TEXT_CELL_DTYPES):
+            self.chunks[name].append(np.array(values, dtype=dtype))
+        self.pending = []
+
+    def close(self):
+        """Write the arrays and manifest; returns the manifest"""
+        self._flush()
+        self.heap.close()
+        arrays = {}
+        for kind, dtype in (('categorical', np.int16), ('checkbox', np.int8)):
+            chunks = self.chunks[kind]
+            arrays[kind] = (np.concatenate(chunks, axis=1) if chunks
+                            else np.zeros((len(self.columns[kind]), 0), dtype=dtype))
+
+        # Cells arrive in applicant order; a stable sort by column gives (column, applicant) order
+        text = {name: np.concatenate(self.chunks[name]) if self.chunks[name] else np.zeros(0, dtype=dtype)
+                for name, dtype in zip(TEXT_CELL_ARRAYS, TEXT_CELL_DTYPES)}
+        order = np.argsort(text['textColumns'], kind='stable')
+        for name in TEXT_CELL_ARRAYS[1:]:
+            arrays[name] = text[name][order]
+        arrays['textColumnStarts'] = np.searchsorted(
+            text['textColumns'][order], np.arange(len(self.columns['text']) + 1)).astype(np.int64)
+
+        for name, file_name in ARRAY_FILES.items():
+            np.save(os.path.join(self.output_dir, file_name), np.ascontiguousarray(arrays[name]))
+
+        constraints = self.constraints
+        manifest = {
+            'applicantCount': len(self.applicant_ids),
+            'applicantIds': self.applicant_ids,
+            'columns': {
+                kind: [{'uniqueId': constraints.unique_ids[row], 'name': constraints.names[row],
+                        'section': constraints.sections[row], 'type': FIELD_TYPES[constraints.types[row]]}
+                       for row in rows]
+                for kind, rows in self.columns.items()
+            },
+            'dictionaries': self.dictionaries,
+        }
+        with open(os.path.join(self.output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'), ensure_ascii=False)
+        return manifest
+
+class ColumnarStore:
+    """Read side: memory-mapped arrays plus vectorized aggregates"""
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.arrays = {name: np.load(os.path.join(store_dir, file_name), mmap_mode='r')
+                       for name, file_name in ARRAY_FILES.items()}
+        self.column_index = {}
+        for kind, columns in self.manifest['columns'].items():
+            for position, column in enumerate(columns):
+                self.column_index[column['uniqueId']] = (kind, position)
+
+    @property
+    def applicant_count(self):
+        return self.manifest['applicantCount']
+
+    def text_fill_counts(self):
+        """Applicants with a value, per text column"""
+        return np.diff(np.asarray(self.arrays['textColumnStarts']))
+
+    def section_filled(self):
+        """(sections, applicant mask) pairs: which applicants filled anything in each section"""
+        columns = self.manifest['columns']
+        sections = sorted({column['section'] for kind in columns.values() for column in kind})
+        section_row = {section: index for index, section in enumerate(sections)}
+        filled = np.zeros((len(sections), self.applicant_count), dtype=bool)
+
+        for kind in ('categorical', 'checkbox'):
+            if not columns[kind]:
+                continue
+            rows = np.array([section_row[column['section']] for column in columns[kind]])
+            order = np.argsort(rows, kind='stable')
+            starts = np.flatnonzero(np.r_[True, rows[order][1:] != rows[order][:-1]])
+            any_filled = np.logical_or.reduceat(filled_cells(kind, self.arrays[kind])[order], starts, axis=0)
+            filled[rows[order][starts]] |= any_filled
+
+        if columns['text']:
+            text_rows = np.array([section_row[column['section']] for column in columns['text']])
+            cell_columns = np.repeat(np.arange(len(columns['text'])), self.text_fill_counts())
+            filled[text_rows[cell_columns], np.asarray(self.arrays['textApplicants'])] = True
+        return sections, filled
+
+    def completion_rates(self):
+        """[(uniqueId, name, section, share of applicants who filled it)]"""
+        if not self.applicant_count:
+            return []
+        rates = []
+        for kind, columns in self.manifest['columns'].items():
+            if not columns:
+                continue
+            if kind == 'text':
+                shares = self.text_fill_counts() / self.applicant_count
+            else:
+                shares = filled_cells(kind, self.arrays[kind]).mean(axis=1)
+            rates.extend((column['uniqueId'], column['name'], column['section'], float(share))
+                         for column, share in zip(columns, shares))
+        return rates
+
+    def value_counts(self, unique_id, top=10):
+        """Most common values of a dropdown/radio or checkbox column"""
+        kind, position = self.column_index[unique_id]
+        if kind == 'text':
+            raise ValueError('value_counts works on categorical and checkbox columns')
+        codes = np.asarray(self.arrays[kind][position]).astype(np.int64)
+        counts = np.bincount(codes[codes >= 0])
+        order = np.argsort(counts, kind='stable')[::-1][:top]
+        labels = ['unchecked', 'checked'] if kind == 'checkbox' else self.manifest['dictionaries'][position]
+        return [(labels[code], int(counts[code])) for code in order if counts[code]]
+
+    def text_values(self, unique_id):
+        """{applicant index: text} for a text column"""
+        kind, position = self.column_index[unique_id]
+        if kind != 'text':
+            raise ValueError(f'{unique_id} is a {kind} column')
+        starts = self.arrays['textColumnStarts']
+        cells = slice(int(starts[position]), int(starts[position + 1]))
+        values = {}
+        with open(os.path.join(self.store_dir, TEXT_HEAP_NAME), 'rb') as f:
+            for applicant, offset, length in zip(self.arrays['textApplicants'][cells].tolist(),
+                                                 self.arrays['textOffsets'][cells].tolist(),
+                                                 self.arrays['textLengths'][cells].tolist()):
+                f.seek(offset)
+                values[applicant] = f.read(length).decode('utf-8')
+        return values
+
+    def empty_sections(self):
+        """{section: share of applicants with no filled field in that section}"""
+        if not self.applicant_count:
+            return {}
+        sections, filled = self.section_filled()
+        return {section: float(1 - share) for section, share in zip(sections, filled.mean(axis=1))}
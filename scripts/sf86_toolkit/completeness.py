@@ -0,0 +1,160 @@
+"""
+Completeness scoring
+Represents each applicant as a boolean mask over the reference fields and
+scores per-section and per-subsection completeness with NumPy reductions:
+mask columns are permuted once so every subsection is a contiguous run, and
+np.add.reduceat sums each run for a whole batch of applicants at a time
+"""
+
+import re
+
+import numpy as np
+
+from .code_split import chunk_for_field
+from .constraints import FIELD_TYPES, iter_form_fields
+from .flatten_plan import coerce_checkbox
+
+# Applicants scored per batch; masks are (batch, fields) bytes
+BATCH_SIZE = 4096
+
+def subsection_of(section, field_name, subsection=''):
+    """Subsection label for a reference field
+
+    Uses the reference 'subsection' key when present, the Section 13 chunk
+    (13A.1 ...) for Section 13, and otherwise the top-level subform of the
+    PDF field name; anonymous subforms (#subform) fall back to the section.
+    """
+    if subsection:
+        return f'{section}{subsection}'
+    if section == 13:
+        chunk_id, _, _ = chunk_for_field(section, field_name)
+        if chunk_id != 'section13':
+            return chunk_id
+    parts = field_name.split('.')
+    subform = re.sub(r'\[\d+\]$', '', parts[1]) if len(parts) > 2 else ''
+    if not subform or subform.startswith('#'):
+        return str(section)
+    return f'{section}:{subform}'
+
+CHECKBOX_TYPE = FIELD_TYPES.index('PDFCheckBox')
+
+def is_filled(value, checkbox=False):
+    """Whether a Field<T> value counts as answered
+
+    Checkboxes count only when checked (True, "true", "Yes", "1" ...), by the
+    same coercion the columnar export stores, so dump and store scores agree.
+    """
+    if value is None or value == '':
+        return False
+    return coerce_checkbox(value, None, None) if checkbox else True
+
+def run_starts(values):
+    """Start positions of the runs of equal values in a 1-D array"""
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+
+class CompletenessIndex:
+    """Reference fields grouped into contiguous (section, subsection) runs
+
+    Mask column c is reference row rows[c]. Only the row a Field<T> id
+    resolves to (the first row per id) gets a column, so duplicate reference
+    rows cannot drag a score down.
+    """
+
+    def __init__(self, constraints):
+        self.constraints = constraints
+        keyed = []
+        for row, field_id in enumerate(constraints.ids):
+            if constraints.by_id.get(field_id) != row:
+                continue
+            section = constraints.sections[row]
+            label = subsection_of(section, constraints.names[row], constraints.subsections[row])
+            keyed.append((section, label, row))
+        keyed.sort()
+
+        self.rows = np.array([row for _, _, row in keyed], dtype=np.int64)
+        self.column_of_row = {row: column for column, (_, _, row) in enumerate(keyed)}
+        labels = np.array([label for _, label, _ in keyed], dtype=object)
+        sections = np.array([section for section, _, _ in keyed], dtype=np.int64)
+
+        # Runs start where the label changes; sections are runs of subsections
+        self.subsection_starts = run_starts(labels)
+        self.subsection_labels = labels[self.subsection_starts].tolist()
+        self.subsection_sizes = np.diff(np.r_[self.subsection_starts, len(keyed)])
+        self.subsection_sections = sections[self.subsection_starts]
+        self.section_subsection_starts = run_starts(self.subsection_sections)
+        self.section_ids = self.subsection_sections[self.section_subsection_starts].tolist()
+        self.section_sizes = (np.add.reduceat(self.subsection_sizes, self.section_subsection_starts)
+                              if keyed else self.subsection_sizes)
+
+    @property
+    def field_count(self):
+        return len(self.rows)
+
+    def mask(self, data, out=None):
+        """Filled-field mask of one applicant tree (a bool row of field_count)"""
+        if out is None:
+            out = np.zeros(self.field_count, dtype=bool)
+        constraints = self.constraints
+        for _, field in iter_form_fields(data):
+            if not field.get('id'):
+                continue
+            row = constraints.find_row(field['id'], field.get('name'))
+            column = self.column_of_row.get(row)
+            if column is not None and is_filled(field.get('value'), constraints.types[row] == CHECKBOX_TYPE):
+                out[column] = True
+        return out
+
+    def masks(self, datas):
+        """(applicants, field_count) bool matrix for a list of applicant trees"""
+        masks = np.zeros((len(datas), self.field_count), dtype=bool)
+        for applicant, data in enumerate(datas):
+            self.mask(data, masks[applicant])
+        return masks
+
+    def score(self, masks):
+        """(section scores, subsection scores) as float arrays of (applicants, groups)
+
+        Each score is the filled share of the group's reference fields.
+        """
+        masks = np.asarray(masks, dtype=bool)
+        if not self.field_count:
+            empty = np.zeros((len(masks), 0))
+            return empty, empty
+        # uint16 counts keep the reduction cheap; no subsection has 65k fields
+        filled = np.add.reduceat(masks.view(np.uint8), self.subsection_starts, axis=1, dtype=np.uint16)
+        section_filled = np.add.reduceat(filled, self.section_subsection_starts, axis=1, dtype=np.uint32)
+        return section_filled / self.section_sizes, filled / self.subsection_sizes
+
+    def overall(self, masks):
+        """Filled share of all reference fields, per applicant"""
+        return np.count_nonzero(masks, axis=1) / max(self.field_count, 1)
+
+    def masks_from_store(self, store, start=0, stop=None):
+        """Masks for applicants [start, stop) of a ColumnarStore (see columnar.py)"""
+        constraints = self.constraints
+        column_of_unique_id = {}
+        for row, unique_id in enumerate(constraints.unique_ids):
+            if unique_id and row in self.column_of_row:
+                column_of_unique_id.setdefault(unique_id, self.column_of_row[row])
+
+        stop = store.applicant_count if stop is None else min(stop, store.applicant_count)
+        masks = np.zeros((max(stop - start, 0), self.field_count), dtype=bool)
+        columns = store.manifest['columns']
+        for kind in ('categorical', 'checkbox'):
+            targets = [column_of_unique_id.get(column['uniqueId'], -1) for column in columns[kind]]
+            sources = np.flatnonzero(np.array(targets) >= 0) if targets else np.zeros(0, dtype=np.int64)
+            if not len(sources):
+                continue
+            values = np.asarray(store.arrays[kind][:, start:stop])[sources]
+            filled = values == 1 if kind == 'checkbox' else values >= 0
+            masks[:, np.array(targets)[sources]] = filled.T
+
+        if columns['text']:
+            targets = np.array([column_of_unique_id.get(column['uniqueId'], -1) for column in columns['text']])
+            cell_targets = np.repeat(targets, store.text_fill_counts())
+            applicants = np.asarray(store.arrays['textApplicants'])
+            known = (cell_targets >= 0) & (applicants >= start) & (applicants < stop)
+            masks[applicants[known] - start, cell_targets[known]] = True
+        return masks
@@ -0,0 +1,162 @@
+"""
+Reference field constraints
+Loads type, maxLength and option constraints for every reference field once
+into compact lookup tables, and checks Field<T> values against them the way
+the PDF service applies values (option matching, checkbox parsing)
+"""
+
+from array import array
+
+from .references import load_all_section_references
+
+FIELD_TYPES = ['PDFTextField', 'PDFCheckBox', 'PDFRadioGroup', 'PDFDropdown']
+OPTION_FIELD_TYPES = {'PDFRadioGroup', 'PDFDropdown'}
+
+# Strings parseCheckboxValue reads as checked / that plainly mean unchecked
+CHECKBOX_TRUE_VALUES = {'yes', 'true', '1', 'checked', 'on'}
+CHECKBOX_FALSE_VALUES = {'no', 'false', '0', 'unchecked', 'off', ''}
+
+YES_ALIASES = {'yes', 'true', '1'}
+NO_ALIASES = {'no', 'false', '0'}
+
+def normalize_field_id(field_id):
+    """Field<T> ids drop the ' 0 R' suffix the reference exports carry"""
+    return str(field_id).replace(' 0 R', '', 1)
+
+class ConstraintTables:
+    """Per-field constraints in parallel arrays, addressed by row number
+
+    Rows are found through by_id (normalized id) or by_name. Identical option
+    lists are stored once in option_sets; option_set_of holds -1 for fields
+    without options. A maxLength of 0 means unlimited.
+    """
+
+    def __init__(self, fields):
+        self.by_id = {}
+        self.by_name = {}
+        self.ids = []
+        self.names = []
+        self.unique_ids = []
+        self.sections = array('B')
+        self.subsections = []
+        self.types = bytearray()
+        self.max_lengths = array('I')
+        self.option_set_of = array('i')
+        self.option_sets = []
+        self.option_lists = []
+        option_set_ids = {}
+
+        for field in fields:
+            row = len(self.names)
+            self.by_id.setdefault(normalize_field_id(field['id']), row)
+            self.by_name.setdefault(field['name'], row)
+            self.ids.append(normalize_field_id(field['id']))
+            self.names.append(field['name'])
+            self.unique_ids.append(field.get('uniqueId', ''))
+            self.sections.append(field.get('section') or 0)
+            self.subsections.append(field.get('subsection') or '')
+            self.types.append(FIELD_TYPES.index(field['type']) if field['type'] in FIELD_TYPES else 0)
+            self.max_lengths.append(field.get('maxLength') or 0)
+
+            options = tuple(field.get('options') or ())
+            if options:
+                if options not in option_set_ids:
+                    option_set_ids[options] = len(self.option_sets)
+                    self.option_sets.append((frozenset(options), tuple(option.lower() for option in options)))
+                    self.option_lists.append(options)
+                self.option_set_of.append(option_set_ids[options])
+            else:
+                self.option_set_of.append(-1)
+
+    @classmethod
+    def from_references(cls):
+        references = load_all_section_references()
+        return cls(field for _, data in sorted(references.items()) for field in data['fields'])
+
+    def find_row(self, field_id, field_name):
+        row = self.by_id.get(normalize_field_id(field_id)) if field_id else None
+        if row is None and field_name:
+            row = self.by_name.get(field_name)
+        return row
+
+    def stable_id(self, field_id):
+        """Reference id for a Field<T> id given as id or PDF field name
+
+        Unknown ids are returned cleaned but otherwise unchanged.
+        """
+        clean_id = str(field_id).removesuffix(' 0 R').strip()
+        row = self.by_name.get(clean_id) if 'form1[0]' in clean_id else self.by_id.get(clean_id)
+        return clean_id if row is None else self.ids[row]
+
+    def find_best_option(self, row, value):
+        """Option findBestOptionMatch would select for value, or None"""
+        options, lowered = self.option_sets[self.option_set_of[row]]
+        if value in options:
+            return value
+        ordered = self.option_lists[self.option_set_of[row]]
+        lower_value = value.lower()
+        for option, lower_option in zip(ordered, lowered):
+            if lower_option == lower_value:
+                return option
+        for aliases in (YES_ALIASES, NO_ALIASES):
+            if lower_value in aliases:
+                for option, lower_option in zip(ordered, lowered):
+                    if lower_option in aliases:
+                        return option
+        for option, lower_option in zip(ordered, lowered):
+            if lower_value in lower_option or lower_option in lower_value:
+                return option
+        return None
+
+    def match_option(self, row, value):
+        """'exact', 'coerced' (findBestOptionMatch would rewrite it) or None"""
+        option = self.find_best_option(row, value)
+        if option is None:
+            return None
+        return 'exact' if option == value else 'coerced'
+
+    def check_value(self, row, declared_type, value):
+        """Issues for one Field<T> value as (code, severity, message) tuples"""
+        issues = []
+        field_type = FIELD_TYPES[self.types[row]]
+        if declared_type and declared_type != field_type:
+            issues.append(('type-mismatch', 'error', f'declared {declared_type}, reference field is {field_type}'))
+
+        if value is None or value == '' or value is False:
+            return issues
+        if isinstance(value, (dict, list)):
+            issues.append(('invalid-value', 'error', f'{type(value).__name__} value for {field_type}'))
+            return issues
+
+        if field_type == 'PDFCheckBox':
+            if not isinstance(value, bool) and str(value).lower() not in CHECKBOX_TRUE_VALUES | CHECKBOX_FALSE_VALUES:
+                issues.append(('checkbox-value', 'warning', f'"{value}" is applied as unchecked'))
+            return issues
+
+        text = str(value)
+        max_length = self.max_lengths[row]
+        if max_length and len(text) > max_length:
+            issues.append(('max-length', 'error', f'{len(text)} characters exceeds maxLength {max_length}'))
+
+        if field_type in OPTION_FIELD_TYPES and self.option_set_of[row] >= 0:
+            match = self.match_option(row, text)
+            if match is None:
+                issues.append(('invalid-option', 'error', f'"{text}" is not one of the field options'))
+            elif match == 'coerced':
+                issues.append(('option-coerced', 'warning', f'"{text}" only matches an option approximately'))
+        return issues
+
+def iter_form_fields(data, path=''):
+    """Yield (path, field) for every Field<T>-shaped node ('id' and 'value' keys)"""
+    stack = [(path, data)]
+    while stack:
+        node_path, node = stack.pop()
+        if isinstance(node, dict):
+            if 'id' in node and 'value' in node:
+                yield node_path, node
+                continue
+            for key in reversed(list(node)):
+                stack.append((f'{node_path}.{key}' if node_path else key, node[key]))
+        elif isinstance(node, list):
+            for index in range(len(node) - 1, -1, -1):
+                stack.append((f'{node_path}[{index}]', node[index]))
@@ -0,0 +1,77 @@
+"""
+Field-level deltas between applicant saves
+Reduces a section's Field<T> tree to {stable field id: value}, diffs two
+versions into a compact patch and applies patches to flat maps or trees
+"""
+
+import hashlib
+import json
+
+from .constraints import iter_form_fields
+
+PATCH_FORMAT = 'sf86-delta/1'
+
+def field_values(data, constraints):
+    """{reference field id: value} for every Field<T> node of a tree
+
+    Ids given as PDF field names are resolved to the reference id, so the
+    same field compares equal whichever form a save used.
+    """
+    values = {}
+    for _, field in iter_form_fields(data):
+        if field.get('id'):
+            values[constraints.stable_id(field['id'])] = field.get('value')
+    return values
+
+def canonical_json(value):
+    """JSON encoding used for fingerprints and value comparison: True, 1 and
+    1.0 encode differently, key order does not matter"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+def fingerprint(values):
+    """Order-independent digest of a flat field map"""
+    return hashlib.sha1(canonical_json(values).encode('utf-8')).hexdigest()[:16]
+
+def diff_values(before, after):
+    """Minimal patch turning the flat map before into after
+
+    set holds changed and added fields, unset the ids that disappeared
+    (e.g. a removed entry). base/result fingerprints let apply_patch refuse
+    a patch for the wrong starting point.
+    """
+    changed = {field_id: value for field_id, value in after.items()
+               if field_id not in before or canonical_json(before[field_id]) != canonical_json(value)}
+    removed = sorted(field_id for field_id in before if field_id not in after)
+    patch = {'format': PATCH_FORMAT, 'base': fingerprint(before), 'result': fingerprint(after)}
+    if changed:
+        patch['set'] = changed
+    if removed:
+        patch['unset'] = removed
+    return patch
+
+def apply_patch(values, patch, check_base=True):
+    """Apply a patch to a flat field map, returning the new map"""
+    if patch.get('format') != PATCH_FORMAT:
+        raise ValueError(f"Unsupported patch format: {patch.get('format')}")
+    if check_base and fingerprint(values) != patch['base']:
+        raise ValueError('Patch base does not match these field values')
+    removed = set(patch.get('unset', ()))
+    result = {field_id: value for field_id, value in values.items() if field_id not in removed}
+    result.update(patch.get('set', {}))
+    return result
+
+def apply_patch_to_tree(data, patch, constraints):
+    """Write a patch's set values into the matching Field<T> nodes of a tree in place
+
+    Unset fields are cleared to ''. Returns the ids the tree has no node for
+    (fields whose entry does not exist in this tree).
+    """
+    pending = dict(patch.get('set', {}))
+    pending.update((field_id, '') for field_id in patch.get('unset', ()))
+    written = set()
+    for _, field in iter_form_fields(data):
+        field_id = constraints.stable_id(field['id']) if field.get('id') else None
+        if field_id in pending:
+            field['value'] = pending[field_id]
+            written.add(field_id)
+    return sorted(set(pending) - written)
@@ -0,0 +1,108 @@
+"""
+Compact reference field records
+A slotted record per reference field in place of the 14+ key JSON dict:
+names, types, labels and reasons are interned, rects become 4-tuples and
+identical option lists are shared as one tuple. Grouping helpers return lists
+of the same record objects rather than per-category copies
+"""
+
+import sys
+from collections import defaultdict
+
+from .references import load_all_section_references, load_section_reference
+
+class FieldRecord:
+    """One reference field; attribute names follow the export keys in snake_case"""
+
+    __slots__ = (
+        'id', 'name', 'page', 'label', 'type', 'max_length', 'rect', 'section', 'confidence', 'unique_id',
+        'options', 'value', 'entry', 'subsection', 'was_moved_by_healing', 'is_explicitly_detected', 'reason',
+    )
+
+    # (slot, export key) for every slot, in export key order
+    KEYS = (
+        ('id', 'id'), ('name', 'name'), ('page', 'page'), ('label', 'label'), ('type', 'type'),
+        ('max_length', 'maxLength'), ('rect', 'rect'), ('section', 'section'), ('confidence', 'confidence'),
+        ('was_moved_by_healing', 'wasMovedByHealing'), ('is_explicitly_detected', 'isExplicitlyDetected'),
+        ('unique_id', 'uniqueId'), ('options', 'options'), ('value', 'value'), ('entry', 'entry'),
+        ('reason', 'reason'), ('subsection', 'subsection'),
+    )
+    SLOT_OF_KEY = {key: slot for slot, key in KEYS}
+    RECT_KEYS = ('x', 'y', 'width', 'height')
+
+    def __init__(self, field, shared_options=None):
+        """Build from an export dict; shared_options deduplicates option tuples across records"""
+        self.id = field['id']
+        self.name = sys.intern(field['name'])
+        self.page = field.get('page')
+        self.label = sys.intern(field['label']) if field.get('label') is not None else None
+        self.type = sys.intern(field['type'])
+        self.max_length = field.get('maxLength')
+        rect = field.get('rect')
+        self.rect = tuple(rect[key] for key in self.RECT_KEYS) if rect else None
+        self.section = field.get('section')
+        self.confidence = field.get('confidence')
+        self.unique_id = field.get('uniqueId')
+        options = field.get('options')
+        if options is not None:
+            options = tuple(options)
+            if shared_options is not None:
+                options = shared_options.setdefault(options, options)
+        self.options = options
+        self.value = field.get('value')
+        self.entry = field.get('entry')
+        self.subsection = field.get('subsection')
+        self.was_moved_by_healing = field.get('wasMovedByHealing')
+        self.is_explicitly_detected = field.get('isExplicitlyDetected')
+        self.reason = sys.intern(field['reason']) if isinstance(field.get('reason'), str) else field.get('reason')
+
+    @property
+    def subform(self):
+        return self.name.rpartition('.')[0]
+
+    def get(self, key, default=None):
+        """Dict-style read by export key, for code written against the JSON dicts"""
+        slot = self.SLOT_OF_KEY.get(key)
+        value = getattr(self, slot) if slot else None
+        if value is None:
+            return default
+        if slot == 'rect':
+            return dict(zip(self.RECT_KEYS, value))
+        return list(value) if slot == 'options' else value
+
+    def to_dict(self):
+        """The export dict this record was built from (keys that were absent stay absent)"""
+        field = {}
+        for slot, key in self.KEYS:
+            value = getattr(self, slot)
+            if value is None and key not in ('page', 'label'):
+                continue
+            if slot == 'rect':
+                value = dict(zip(self.RECT_KEYS, value))
+            elif slot == 'options':
+                value = list(value)
+            field[key] = value
+        return field
+
+    def __repr__(self):
+        return f'FieldRecord({self.id!r}, {self.name!r}, {self.type!r})'
+
+def records_from_fields(fields):
+    """FieldRecords for export dicts, sharing identical option lists"""
+    shared_options = {}
+    return [FieldRecord(field, shared_options) for field in fields]
+
+def load_section_records(section_id):
+    return records_from_fields(load_section_reference(section_id)['fields'])
+
+def load_all_records():
+    """Every reference field as a FieldRecord, in section order"""
+    references = load_all_section_references()
+    return records_from_fields(field for _, data in sorted(references.items()) for field in data['fields'])
+
+def group_records(records, key):
+    """{key(record): [records]}: the lists hold the same record objects, not copies"""
+    groups = defaultdict(list)
+    for record in records:
+        groups[key(record)].append(record)
+    return groups
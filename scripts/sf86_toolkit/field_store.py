@@ -0,0 +1,270 @@
+"""
+Memory-mapped reference field store
+Writes every reference field once into a directory of flat files: a
+fixed-width record array (section, type code, page, maxLength, object id,
+confidence, rect) and offset-indexed UTF-8 heaps for names, labels and
+uniqueIds. Readers map the files read-only, so any number of worker processes
+share the same page-cache copy instead of each materializing the field dicts.
+The store path is a symlink to a complete build directory; a rebuild writes a
+new directory and swaps the link in one rename, so readers never mix files of
+two builds
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+
+from .constraints import FIELD_TYPES
+from .label_search import source_mtimes
+from .references import REFERENCES_DIR, REPO_ROOT, load_all_section_references
+
+FORMAT = 'sf86-field-store/1'
+DEFAULT_STORE_DIR = os.path.join(REPO_ROOT, 'reports', 'field-store')
+MANIFEST_NAME = 'manifest.json'
+RECORDS_NAME = 'fields.npy'
+NAME_ORDER_NAME = 'name-order.npy'
+
+RECORD_DTYPE = np.dtype([
+    ('section', 'u1'),
+    ('type', 'u1'),
+    ('page', 'i2'),
+    ('max_length', 'u4'),
+    ('object_id', 'i4'),
+    ('confidence', 'f8'),
+    ('x', 'f8'),
+    ('y', 'f8'),
+    ('width', 'f8'),
+    ('height', 'f8'),
+])
+# String heap name -> reference field key
+HEAPS = {'names': 'name', 'labels': 'label', 'unique-ids': 'uniqueId'}
+
+NO_PAGE = -1
+
+def heap_paths(store_dir, heap):
+    return os.path.join(store_dir, f'{heap}.bin'), os.path.join(store_dir, f'{heap}-offsets.npy')
+
+@contextmanager
+def store_lock(store_dir=DEFAULT_STORE_DIR):
+    """Exclusive lock serializing builds of the store at store_dir across processes"""
+    os.makedirs(os.path.dirname(os.path.abspath(store_dir)), exist_ok=True)
+    with open(f'{store_dir}.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def write_store(build_dir, references_dir=REFERENCES_DIR):
+    """Write every store file into build_dir; returns the manifest"""
+    references = load_all_section_references(references_dir)
+    fields = [field for _, data in sorted(references.items()) for field in data['fields']]
+
+    records = np.zeros(len(fields), dtype=RECORD_DTYPE)
+    for row, field in enumerate(fields):
+        rect = field.get('rect') or {}
+        page = field.get('page')
+        confidence = field.get('confidence')
+        records[row] = (
+            field.get('section') or 0,
+            FIELD_TYPES.index(field['type']) if field['type'] in FIELD_TYPES else 0,
+            NO_PAGE if page is None else page,
+            field.get('maxLength') or 0,
+            int(field['id'].split()[0]),
+            np.nan if confidence is None else confidence,
+            rect.get('x', np.nan), rect.get('y', np.nan), rect.get('width', np.nan), rect.get('height', np.nan),
+        )
+    np.save(os.path.join(build_dir, RECORDS_NAME), records)
+
+    heap_sizes = {}
+    for heap, key in HEAPS.items():
+        encoded = [(field.get(key) or '').encode('utf-8') for field in fields]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data_path, offsets_path = heap_paths(build_dir, heap)
+        with open(data_path, 'wb') as f:
+            f.write(b''.join(encoded))
+        np.save(offsets_path, offsets)
+        heap_sizes[heap] = int(offsets[-1])
+        if heap == 'names':
+            # Rows in name byte order, for binary search without a per-worker dict
+            order = np.array(sorted(range(len(encoded)), key=encoded.__getitem__), dtype=np.int32)
+            np.save(os.path.join(build_dir, NAME_ORDER_NAME), order)
+
+    manifest = {
+        'format': FORMAT,
+        'fieldCount': len(fields),
+        'types': FIELD_TYPES,
+        'heapSizes': heap_sizes,
+        'sources': source_mtimes(references_dir),
+    }
+    with open(os.path.join(build_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def publish_build(store_dir, build_dir):
+    """Point the store_dir symlink at build_dir in one rename and delete all
+    builds but this and the previous one (which readers may still be opening)"""
+    previous = os.path.realpath(store_dir) if os.path.islink(store_dir) else None
+    link = f'{build_dir}.link'
+    os.symlink(os.path.relpath(build_dir, os.path.dirname(os.path.abspath(store_dir))), link)
+    if os.path.isdir(store_dir) and not os.path.islink(store_dir):
+        # A store written in place by an earlier version of this module
+        shutil.rmtree(store_dir)
+    os.replace(link, store_dir)
+
+    builds_dir = os.path.dirname(build_dir)
+    keep = {os.path.realpath(build_dir), previous}
+    for name in os.listdir(builds_dir):
+        path = os.path.join(builds_dir, name)
+        if os.path.islink(path):
+            # Link left by a build that failed before publishing
+            os.remove(path)
+        elif os.path.isdir(path) and os.path.realpath(path) not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+def build_field_store(store_dir=DEFAULT_STORE_DIR, references_dir=REFERENCES_DIR):
+    """Build the store for the current reference exports in a new directory
+    next to store_dir and swap it in; returns the manifest
+
+    Concurrent builders should hold store_lock(store_dir) and re-check
+    store_is_current, as FieldStore.open_current does.
+    """
+    builds_dir = f'{store_dir}.builds'
+    os.makedirs(builds_dir, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix='build-', dir=builds_dir)
+    try:
+        os.chmod(build_dir, 0o755)
+        manifest = write_store(build_dir, references_dir)
+        publish_build(store_dir, build_dir)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+    return manifest
+
+def store_is_current(store_dir=DEFAULT_STORE_DIR, references_dir=REFERENCES_DIR):
+    """Whether the store at store_dir was built from the current reference exports"""
+    try:
+        with open(os.path.join(store_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return manifest.get('format') == FORMAT and manifest.get('sources') == source_mtimes(references_dir)
+
+class StringHeap:
+    """Read-only sequence of strings stored back to back in a mapped file"""
+
+    def __init__(self, data_path, offsets_path):
+        with open(data_path, 'rb') as f:
+            # mmap refuses empty files
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b''
+        self.offsets = np.load(offsets_path, mmap_mode='r')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def raw(self, row):
+        return self.data[int(self.offsets[row]):int(self.offsets[row + 1])]
+
+    def __getitem__(self, row):
+        return self.raw(row).decode('utf-8')
+
+class FieldStore:
+    """Read side: the record array and string heaps, mapped read-only
+
+    records is a NumPy memmap, so columns such as records['page'] are
+    zero-copy views; strings are decoded only for the rows asked for.
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        # Resolve the symlink once so every file comes from the same build
+        store_dir = os.path.realpath(store_dir)
+        with open(os.path.join(store_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != FORMAT:
+            raise ValueError(f"{store_dir} is not a {FORMAT} store")
+        self.types = self.manifest['types']
+        self.records = np.load(os.path.join(store_dir, RECORDS_NAME), mmap_mode='r')
+        self.heaps = {heap: StringHeap(*heap_paths(store_dir, heap)) for heap in HEAPS}
+        self.name_order = np.load(os.path.join(store_dir, NAME_ORDER_NAME), mmap_mode='r')
+
+    @classmethod
+    def open_current(cls, store_dir=DEFAULT_STORE_DIR, references_dir=REFERENCES_DIR):
+        """Open the store, building it first if the reference exports changed"""
+        if not store_is_current(store_dir, references_dir):
+            with store_lock(store_dir):
+                # Another process may have built it while this one waited
+                if not store_is_current(store_dir, references_dir):
+                    build_field_store(store_dir, references_dir)
+        return cls(store_dir)
+
+    def __len__(self):
+        return len(self.records)
+
+    def name(self, row):
+        return self.heaps['names'][row]
+
+    def label(self, row):
+        return self.heaps['labels'][row]
+
+    def unique_id(self, row):
+        return self.heaps['unique-ids'][row]
+
+    def field_type(self, row):
+        return self.types[self.records['type'][row]]
+
+    def find_name(self, name):
+        """Row of the field with this PDF name, or None (binary search over name_order)"""
+        target = name.encode('utf-8')
+        names = self.heaps['names']
+        low, high = 0, len(self.name_order)
+        while low < high:
+            middle = (low + high) // 2
+            if names.raw(int(self.name_order[middle])) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.name_order) and names.raw(int(self.name_order[low])) == target:
+            return int(self.name_order[low])
+        return None
+
+    def find_id(self, field_id):
+        """Row of the field with this id ("9434 0 R" or "9434"), or None"""
+        rows = np.flatnonzero(self.records['object_id'] == int(str(field_id).split()[0]))
+        return int(rows[0]) if len(rows) else None
+
+    def select(self, section=None, field_type=None, page=None):
+        """Rows matching every given filter, as an int array"""
+        mask = np.ones(len(self.records), dtype=bool)
+        if section is not None:
+            mask &= self.records['section'] == section
+        if field_type is not None:
+            mask &= self.records['type'] == self.types.index(field_type)
+        if page is not None:
+            mask &= self.records['page'] == page
+        return np.flatnonzero(mask)
+
+    def field(self, row):
+        """One field as a reference-export dict (without options)"""
+        record = self.records[row]
+        field = {
+            'id': f"{int(record['object_id'])} 0 R",
+            'name': self.name(row),
+            'page': None if record['page'] == NO_PAGE else int(record['page']),
+            'label': self.label(row),
+            'type': self.types[record['type']],
+            'maxLength': int(record['max_length']),
+            'section': int(record['section']),
+            'uniqueId': self.unique_id(row),
+        }
+        if not np.isnan(record['x']):
+            field['rect'] = {key: float(record[key]) for key in ('x', 'y', 'width', 'height')}
+        if not np.isnan(record['confidence']):
+            field['confidence'] = float(record['confidence'])
+        return field
@@ -0,0 +1,203 @@
+"""
+Flattening plans for Field<T> trees
+A plan is a trie of the object paths that hold Field<T> nodes, with list
+indexes generalized to [*]. Applying it visits only those paths, resolves
+each node's id to its PDF field in O(1) and coerces the value by the
+reference field type, the way applyValuesToPdf sets PDF values. Subtrees the
+plan does not cover are walked in full and their paths learnt, so no Field<T>
+node is dropped
+"""
+
+import json
+import re
+
+from .constraints import CHECKBOX_TRUE_VALUES, FIELD_TYPES, iter_form_fields
+from .ts_interfaces import InterfaceModel
+
+SECTION_COUNT = 30
+
+# Field<T> values a PDF field can take; objects and arrays have no String() form
+SCALAR_TYPES = (str, int, float, bool)
+
+def js_string(value):
+    """String(value) as JavaScript renders JSON scalars"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def coerce_checkbox(value, constraints, row):
+    if isinstance(value, bool):
+        return value
+    return js_string(value).lower() in CHECKBOX_TRUE_VALUES
+
+def coerce_text(value, constraints, row):
+    return js_string(value)
+
+def coerce_option(value, constraints, row):
+    text = js_string(value)
+    if constraints.option_set_of[row] < 0:
+        return text
+    return constraints.find_best_option(row, text) or text
+
+COERCIONS = {
+    'PDFTextField': coerce_text,
+    'PDFCheckBox': coerce_checkbox,
+    'PDFRadioGroup': coerce_option,
+    'PDFDropdown': coerce_option,
+}
+
+def generalize_path(path):
+    """Split a Field<T> path into steps, with every list index as '*'"""
+    steps = []
+    for part in path.replace('[', '.[').split('.'):
+        if not part:
+            continue
+        steps.append('*' if part.startswith('[') else part)
+    return steps
+
+class FlatteningPlan:
+    """Trie of Field<T> paths, built from the section interfaces, learnt from sample records or loaded from JSON"""
+
+    def __init__(self, constraints, trie=None):
+        self.constraints = constraints
+        self.trie = trie if trie is not None else {}
+        self.coercions = [COERCIONS[field_type] for field_type in FIELD_TYPES]
+        # Field<T> paths found outside the plan by apply()
+        self.unplanned = set()
+        self._compiled = None
+
+    @classmethod
+    def load(cls, constraints, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(constraints, json.load(f))
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.trie, f, separators=(',', ':'))
+
+    @classmethod
+    def from_interfaces(cls, constraints, section_ids=range(1, SECTION_COUNT + 1)):
+        """Plan of every Field<T> path declared by the section interfaces,
+        rooted at ApplicantFormValues.section<N>"""
+        plan = cls(constraints)
+        for section_id in section_ids:
+            model = InterfaceModel.for_section(section_id)
+            for path, _, _ in model.field_paths(f'Section{section_id}'):
+                plan.add_path(f'section{section_id}.{path}')
+        return plan
+
+    def add_path(self, path, node=None):
+        """Add one Field<T> path, relative to a trie node (default: the root)"""
+        node = self.trie if node is None else node
+        for step in generalize_path(path):
+            if step == '*':
+                node = node.setdefault('items', {})
+            else:
+                node = node.setdefault('keys', {}).setdefault(step, {})
+        node['field'] = True
+        self._compiled = None
+
+    def learn(self, data):
+        """Add every Field<T> path of one record to the plan"""
+        for path, _ in iter_form_fields(data):
+            self.add_path(path)
+
+    def path_count(self):
+        count = 0
+        stack = [self.trie]
+        while stack:
+            node = stack.pop()
+            count += bool(node.get('field'))
+            stack.extend(node.get('keys', {}).values())
+            if 'items' in node:
+                stack.append(node['items'])
+        return count
+
+    def _compile(self, node, path=''):
+        """Trie node -> (is field, {key: child}, items child or None, trie node, path)
+
+        path is the node's generalized object path, e.g. section5.entries[*].
+        """
+        children = {key: self._compile(child, f'{path}.{key}' if path else key)
+                    for key, child in node.get('keys', {}).items()}
+        items = self._compile(node['items'], f'{path}[*]') if 'items' in node else None
+        return bool(node.get('field')), children, items, node, path
+
+    def _resolve(self, field, payload, unresolved, invalid):
+        """Set the PDF value of one Field<T> node"""
+        constraints = self.constraints
+        field_id, field_value = field.get('id'), field.get('value')
+        if not field_id or field_value is None or field_value == '':
+            return
+        clean_id = str(field_id).removesuffix(' 0 R').strip()
+        if 'form1[0]' in clean_id:
+            row = constraints.by_name.get(clean_id)
+        else:
+            row = constraints.by_id.get(clean_id)
+        if row is None:
+            unresolved.append(clean_id)
+            return
+        if not isinstance(field_value, SCALAR_TYPES):
+            invalid.append(clean_id)
+            return
+        payload[constraints.names[row]] = self.coercions[constraints.types[row]](field_value, constraints, row)
+
+    def _walk_unplanned(self, path, value, compiled, payload, unresolved, invalid):
+        """Full walk of a subtree the plan lacks, learning its Field<T> paths;
+        returns the number of Field<T> nodes found"""
+        _, _, _, trie_node, prefix = compiled
+        found = 0
+        for field_path, field in iter_form_fields(value, path):
+            found += 1
+            self.add_path(field_path, trie_node)
+            full_path = '.'.join(filter(None, [prefix, field_path])).replace('.[', '[')
+            self.unplanned.add(re.sub(r'\[\d+\]', '[*]', full_path))
+            self._resolve(field, payload, unresolved, invalid)
+        return found
+
+    def apply(self, data):
+        """Flatten one tree: ({pdfFieldName: value}, [unresolved ids], [invalid ids], Field nodes visited)
+
+        Invalid ids are fields whose value is an object or array; they have no
+        PDF value and are left out of the payload. Field<T> nodes outside the
+        plan are still flattened; their paths are added to the plan and to
+        self.unplanned.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile(self.trie)
+        payload = {}
+        unresolved = []
+        invalid = []
+        visited = 0
+
+        # Keys are pushed in reverse so the stack pops them in object order and
+        # payload keys follow the tree; unplanned subtrees are pushed as
+        # (None, (key, subtree, planned parent))
+        stack = [(self._compiled, data)]
+        while stack:
+            compiled, value = stack.pop()
+            if compiled is None:
+                visited += self._walk_unplanned(*value, payload, unresolved, invalid)
+                continue
+            is_field, children, items = compiled[:3]
+            if is_field:
+                if isinstance(value, dict):
+                    visited += 1
+                    self._resolve(value, payload, unresolved, invalid)
+                continue
+            if isinstance(value, dict):
+                for key in reversed(value):
+                    child_value = value[key]
+                    if child_value is None:
+                        continue
+                    child = children.get(key)
+                    stack.append((child, child_value) if child else (None, (key, child_value, compiled)))
+            elif isinstance(value, list):
+                if items is not None:
+                    for item in reversed(value):
+                        stack.append((items, item))
+                else:
+                    stack.append((None, ('', value, compiled)))
+        return payload, unresolved, invalid, visited
@@ -0,0 +1,168 @@
+"""
+Fuzzy field path index
+Trigram posting lists over every reference field name, uniqueId and
+generated mapping key. A lookup counts shared trigrams for all keys at once
+(one np.bincount over the query's posting lists), keeps the keys that pass
+the q-gram bound for the allowed edit distance, and only runs Levenshtein on
+those, instead of comparing the query with every field of a section
+"""
+
+import json
+
+import numpy as np
+
+from .mapping_keys import generate_mapping_key
+
+Q = 3
+PAD = '\x00' * (Q - 1)
+
+# Same cut-off as findFuzzyFieldMatches: 1 - distance / longer length > 0.7
+DEFAULT_MIN_SIMILARITY = 0.7
+
+INDEX_FORMAT = 'sf86-fuzzy-index/1'
+KEY_KINDS = ['name', 'uniqueId', 'mappingKey']
+
+def key_trigrams(key):
+    """Distinct padded trigrams of a lower-cased key"""
+    padded = PAD + key + PAD
+    return {padded[i:i + Q] for i in range(len(padded) - Q + 1)}
+
+def levenshtein(a, b, limit=None):
+    """Edit distance between a and b; returns limit + 1 once it must exceed limit
+
+    With a limit only the diagonal band |i - j| <= limit is filled in.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+    beyond = limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        current = [beyond] * (len(b) + 1)
+        if low == 1:
+            current[0] = i
+        row_min = current[0]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char_a != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return beyond
+        previous = current
+    return min(previous[-1], beyond)
+
+class FuzzyFieldIndex:
+    """Trigram index over field keys; fields are (section, name) rows"""
+
+    def __init__(self, fields, keys, key_fields, key_kinds):
+        self.fields = fields
+        self.keys = keys
+        self.key_fields = np.asarray(key_fields, dtype=np.int32)
+        self.key_kinds = np.asarray(key_kinds, dtype=np.int8)
+        self.key_lengths = np.array([len(key) for key in keys], dtype=np.int32)
+        self.key_trigram_counts = np.zeros(len(keys), dtype=np.int32)
+        self.field_sections = np.array([section for section, _ in fields], dtype=np.int16)
+
+        postings = {}
+        for position, key in enumerate(keys):
+            trigrams = key_trigrams(key)
+            self.key_trigram_counts[position] = len(trigrams)
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(position)
+        self.postings = {trigram: np.array(positions, dtype=np.int32) for trigram, positions in postings.items()}
+
+    @classmethod
+    def from_references(cls, references):
+        """Index names, uniqueIds and mapping keys of {section id: export} references"""
+        fields = []
+        keys = []
+        key_fields = []
+        key_kinds = []
+        for section_id, data in sorted(references.items()):
+            for position, field in enumerate(data['fields']):
+                row = len(fields)
+                fields.append((section_id, field['name']))
+                values = (field['name'], field.get('uniqueId'), generate_mapping_key(field['name'], position))
+                for kind, value in enumerate(values):
+                    if value:
+                        keys.append(value.lower())
+                        key_fields.append(row)
+                        key_kinds.append(kind)
+        return cls(fields, keys, key_fields, key_kinds)
+
+    def export(self):
+        """JSON-ready index for runtime lookups (posting lists as sorted key positions)"""
+        return {
+            'format': INDEX_FORMAT,
+            'q': Q,
+            'kindNames': KEY_KINDS,
+            'fields': [[section, name] for section, name in self.fields],
+            'keys': self.keys,
+            'keyFields': self.key_fields.tolist(),
+            'keyKinds': self.key_kinds.tolist(),
+            'trigrams': {trigram: positions.tolist() for trigram, positions in sorted(self.postings.items())},
+        }
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.export(), f, separators=(',', ':'), ensure_ascii=False)
+
+    def suggest(self, query, section=None, limit=3, min_similarity=DEFAULT_MIN_SIMILARITY):
+        """Nearest fields to query: [(section, name, similarity, matched key kind)]
+
+        Similarity is 1 - distance / longer length, as in findFuzzyFieldMatches;
+        each field is reported once, under its closest key.
+        """
+        query = query.lower()
+        trigrams = key_trigrams(query)
+        lists = [self.postings[trigram] for trigram in trigrams if trigram in self.postings]
+        if not lists:
+            return []
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+
+        # Each edit removes at most Q distinct trigrams, so a key within distance d
+        # shares at least max(trigram counts) - Q * d of them with the query
+        longer = np.maximum(self.key_lengths, len(query))
+        max_distance = np.floor(longer * (1 - min_similarity) - 1e-9).astype(np.int32)
+        most = np.maximum(self.key_trigram_counts, len(trigrams))
+        candidates = np.flatnonzero((shared >= most - Q * max_distance) & (shared > 0))
+        if section is not None:
+            candidates = candidates[self.field_sections[self.key_fields[candidates]] == section]
+        if not len(candidates):
+            return []
+
+        # Verify in order of the best similarity the trigram overlap still allows,
+        # and stop once that bound cannot beat the limit-th field found so far
+        fewest_edits = -((shared[candidates] - most[candidates]) // Q)
+        bounds = 1 - fewest_edits / longer[candidates]
+        order = np.argsort(-bounds, kind='stable')
+        best = {}
+        cutoff = min_similarity
+        for key_position, bound in zip(candidates[order].tolist(), bounds[order].tolist()):
+            if len(best) >= limit and bound < cutoff:
+                break
+            key_longer = int(longer[key_position])
+            allowed = min(int(max_distance[key_position]), int(key_longer * (1 - cutoff) + 1e-9))
+            distance = levenshtein(query, self.keys[key_position], allowed)
+            if distance > allowed:
+                continue
+            similarity = 1 - distance / key_longer
+            row = int(self.key_fields[key_position])
+            if row not in best or similarity > best[row][0]:
+                best[row] = (similarity, KEY_KINDS[self.key_kinds[key_position]])
+                if len(best) >= limit:
+                    cutoff = max(cutoff, sorted(value[0] for value in best.values())[-limit])
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+        return [(self.fields[row][0], self.fields[row][1], round(similarity, 4), kind)
+                for row, (similarity, kind) in ranked]
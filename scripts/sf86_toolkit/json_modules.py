@@ -0,0 +1,145 @@
+"""
+JSON module emission for large generated tables
+Writes mapping tables as .json assets or JSON.parse string modules with a
+typed TypeScript wrapper, and reports size/parse time against the literal form
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+EMIT_MODES = ['ts', 'json', 'json-parse']
+
+# "'logical.path': 'form1[0]...'" lines as written by the integration scripts
+MAPPING_LINE_PATTERN = re.compile(r"^'([^']+)':\s*'([^']+)'$")
+
+PARSE_TIMING_RUNS = 20
+
+# Type of a flat logical path -> PDF field name table
+MAPPING_TABLE_TYPE = 'Readonly<Record<string, string>>'
+
+def add_emit_argument(parser):
+    """Register the shared --emit option on a generator's argument parser"""
+    parser.add_argument('--emit', choices=EMIT_MODES, default='ts',
+                        help='ts: object literal (default); json: .json asset plus typed wrapper; '
+                             'json-parse: JSON.parse string module')
+
+def parse_mapping_lines(lines):
+    """Turn "'key': 'value'" mapping lines back into an ordered dict"""
+    table = {}
+    for line in lines:
+        match = MAPPING_LINE_PATTERN.match(line.strip().rstrip(','))
+        if match:
+            table[match.group(1)] = match.group(2)
+    return table
+
+def to_object_literal(table):
+    """Render a table the way the literal TS generators do"""
+    return json.dumps(table, indent=2, ensure_ascii=False)
+
+def write_json_module(table, output_path, export_name, type_annotation, mode, header_lines=(), footer=''):
+    """Write a table as a JSON asset or JSON.parse module
+
+    output_path is the .ts module path. In 'json' mode the data goes to the
+    sibling .json file and the .ts file only re-exports it with a type; in
+    'json-parse' mode the .ts file embeds the data as a JSON string.
+
+    footer is appended verbatim to the .ts module (e.g. count constants).
+    Returns the list of files written.
+    """
+    json_text = json.dumps(table, separators=(',', ':'), ensure_ascii=False)
+    header = ''.join(f'// {line}\n' for line in header_lines)
+    written = []
+
+    if mode == 'json':
+        json_path = os.path.splitext(output_path)[0] + '.json'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(json_text)
+        written.append(json_path)
+        module_code = (
+            f"{header}\n"
+            f"import data from './{os.path.basename(json_path)}';\n\n"
+            f"export const {export_name}: {type_annotation} = data;\n"
+        )
+    elif mode == 'json-parse':
+        module_code = (
+            f"{header}\n"
+            f"export const {export_name}: {type_annotation} = JSON.parse({json.dumps(json_text)});\n"
+        )
+    else:
+        raise ValueError(f'Unsupported JSON emission mode: {mode}')
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(module_code + footer)
+    written.insert(0, output_path)
+    return written
+
+def measure_parse_times(table):
+    """Time V8 parse+evaluate of the literal and JSON.parse forms, in ms per run
+
+    Returns None when node is not available.
+    """
+    node = shutil.which('node')
+    if not node:
+        return None
+
+    literal_source = f'globalThis.table = {to_object_literal(table)};'
+    json_text = json.dumps(table, separators=(',', ':'), ensure_ascii=False)
+    json_source = f'globalThis.table = JSON.parse({json.dumps(json_text)});'
+
+    # Each run gets a unique trailing comment so V8's compilation cache cannot be reused
+    timing_script = """
+const fs = require('fs');
+const vm = require('vm');
+const time = (file) => {
+  const source = fs.readFileSync(file, 'utf8');
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < RUNS; i++) {
+    new vm.Script(source + '\\n//' + i).runInNewContext({});
+  }
+  return Number(process.hrtime.bigint() - start) / 1e6 / RUNS;
+};
+console.log(JSON.stringify({ literal: time(process.argv[1]), jsonParse: time(process.argv[2]) }));
+""".replace('RUNS', str(PARSE_TIMING_RUNS))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        literal_path = os.path.join(tmp_dir, 'literal.js')
+        json_path = os.path.join(tmp_dir, 'json-parse.js')
+        with open(literal_path, 'w', encoding='utf-8') as f:
+            f.write(literal_source)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(json_source)
+        try:
+            result = subprocess.run([node, '-e', timing_script, literal_path, json_path],
+                                    capture_output=True, text=True, timeout=120, check=True)
+        except (subprocess.SubprocessError, OSError):
+            return None
+    return json.loads(result.stdout)
+
+def report_json_module(table, written_files, literal_size=None):
+    """Print the size/parse-time comparison for one emitted module
+
+    literal_size is the byte size of the object-literal module the generator
+    would have written; the plain JSON rendering is used when it is omitted.
+    """
+    if literal_size is None:
+        literal_size = len(to_object_literal(table).encode('utf-8'))
+    emitted_size = sum(os.path.getsize(path) for path in written_files)
+
+    print(f'📦 JSON MODULE REPORT: {os.path.basename(written_files[0])}')
+    print(f'   Entries: {len(table)}')
+    print(f'   Literal module size: {literal_size:,} bytes')
+    print(f'   Emitted size: {emitted_size:,} bytes ({", ".join(os.path.basename(p) for p in written_files)})')
+
+    timings = measure_parse_times(table)
+    if timings is None:
+        print('   Parse time: not measured (node not available)')
+        return {'literal_size': literal_size, 'emitted_size': emitted_size}
+
+    speedup = timings['literal'] / timings['jsonParse'] if timings['jsonParse'] else 0
+    print(f"   Parse time (object literal): {timings['literal']:.2f} ms")
+    print(f"   Parse time (JSON.parse): {timings['jsonParse']:.2f} ms ({speedup:.1f}x)")
+    return {'literal_size': literal_size, 'emitted_size': emitted_size, **timings}
@@ -0,0 +1,131 @@
+"""
+Field label search
+Builds an SQLite FTS5 index over the normalized label of every reference
+field (porter-stemmed, with spelled-out abbreviations such as "D S N" joined
+into one token) plus the words of its PDF field name, next to a plain table
+of section / subform / page / type for the results
+"""
+
+import os
+import re
+import sqlite3
+
+from .references import REFERENCES_DIR, REPO_ROOT, load_all_section_references
+
+DEFAULT_INDEX_PATH = os.path.join(REPO_ROOT, 'reports', 'field-label-index.sqlite')
+
+# Stored as PRAGMA user_version; bump when normalize_label or the schema changes
+INDEX_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE fields (
+    row INTEGER PRIMARY KEY,
+    section INTEGER NOT NULL,
+    subform TEXT NOT NULL,
+    page INTEGER,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    label TEXT NOT NULL,
+    search_label TEXT NOT NULL,
+    name_terms TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE labels USING fts5(
+    search_label, name_terms,
+    content='fields', content_rowid='row',
+    tokenize='porter unicode61'
+);
+CREATE TABLE source (file TEXT PRIMARY KEY, mtime REAL NOT NULL);
+"""
+
+# Spelled-out capitals (D S N, U S C I S), not after a word or apostrophe
+SPELLED_ABBREVIATION = re.compile(r"(?<![\w'])[A-Z](?: [A-Z]\b)+")
+# Spelled-out date format letters (m m/d d/y y y y)
+SPELLED_DATE_PART = re.compile(r'\b([a-z])(?: \1\b)+')
+
+def join_letters(match):
+    return match.group(0).replace(' ', '')
+
+def normalize_label(label):
+    """Label text for indexing: letter-by-letter abbreviations joined (D S N -> DSN, m m/d d -> mm/dd)"""
+    return SPELLED_DATE_PART.sub(join_letters, SPELLED_ABBREVIATION.sub(join_letters, label or ''))
+
+def name_terms(name):
+    """Words of a PDF field name (form1[0].Section13_1[0].TextField11[3] -> section13 1 textfield11 3)"""
+    return ' '.join(re.findall(r'[A-Za-z]+\d*|\d+', name.replace('form1[0].', '')))
+
+def to_match_query(text):
+    """FTS5 MATCH expression for free text: every word required, the last as a prefix"""
+    terms = re.findall(r'\w+', normalize_label(text))
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+def source_mtimes(references_dir=REFERENCES_DIR):
+    return {file_name: os.path.getmtime(os.path.join(references_dir, file_name))
+            for file_name in sorted(os.listdir(references_dir))
+            if re.fullmatch(r'section-\d+\.json|index\.json', file_name)}
+
+def index_is_current(path, references_dir=REFERENCES_DIR):
+    """Whether the index at path was built by this version from the current reference exports"""
+    if not os.path.exists(path):
+        return False
+    try:
+        with sqlite3.connect(path) as connection:
+            version = connection.execute('PRAGMA user_version').fetchone()[0]
+            recorded = dict(connection.execute('SELECT file, mtime FROM source'))
+    except sqlite3.DatabaseError:
+        return False
+    return version == INDEX_VERSION and recorded == source_mtimes(references_dir)
+
+def build_label_index(path=DEFAULT_INDEX_PATH, references_dir=REFERENCES_DIR):
+    """(Re)build the index; returns the number of fields indexed"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    references = load_all_section_references(references_dir)
+    rows = []
+    for section_id, data in sorted(references.items()):
+        for field in data['fields']:
+            rows.append((len(rows), section_id, field['name'].rpartition('.')[0], field.get('page'), field['type'],
+                         field['id'], field['name'], field.get('label') or '',
+                         normalize_label(field.get('label')), name_terms(field['name'])))
+
+    with sqlite3.connect(path) as connection:
+        connection.executescript(SCHEMA)
+        connection.executemany('INSERT INTO fields VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        connection.execute("INSERT INTO labels(labels) VALUES ('rebuild')")
+        connection.execute("INSERT INTO labels(labels) VALUES ('optimize')")
+        connection.executemany('INSERT INTO source VALUES (?, ?)', source_mtimes(references_dir).items())
+        connection.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+    with sqlite3.connect(path) as connection:
+        connection.execute('VACUUM')
+    return len(rows)
+
+def search_labels(connection, text, section=None, field_type=None, limit=20, raw=False):
+    """Matching fields, best first: dicts with section, subform, page, type, id, name, label, snippet"""
+    query = text if raw else to_match_query(text)
+    if not query:
+        return []
+    conditions = ['labels MATCH ?']
+    parameters = [query]
+    if section is not None:
+        conditions.append('fields.section = ?')
+        parameters.append(section)
+    if field_type:
+        conditions.append('fields.type = ?')
+        parameters.append(field_type)
+    parameters.append(limit)
+    # Label hits outweigh name-term hits
+    cursor = connection.execute(f"""
+        SELECT fields.section, fields.subform, fields.page, fields.type, fields.id, fields.name, fields.label,
+               snippet(labels, 0, '[', ']', '…', 12)
+        FROM labels JOIN fields ON fields.row = labels.rowid
+        WHERE {' AND '.join(conditions)}
+        ORDER BY bm25(labels, 4.0, 1.0), fields.row
+        LIMIT ?
+    """, parameters)
+    keys = ('section', 'subform', 'page', 'type', 'id', 'name', 'label', 'snippet')
+    return [dict(zip(keys, row)) for row in cursor]
@@ -0,0 +1,61 @@
+"""
+Mapping key rules for generated field mapping tables
+Shared by the complete Section 13 generator and the split mapping generator
+"""
+
+import re
+
+# PDF field type -> mapping table category
+FIELD_TYPE_CATEGORIES = {
+    'PDFTextField': 'TEXT_FIELDS',
+    'PDFCheckBox': 'CHECKBOX_FIELDS',
+    'PDFRadioGroup': 'RADIO_FIELDS',
+    'PDFDropdown': 'DROPDOWN_FIELDS',
+}
+
+# Categories emitted as field name mappings (STRING_VALUES is handled separately)
+FIELD_CATEGORIES = list(FIELD_TYPE_CATEGORIES.values())
+
+def generate_mapping_key(field_name, index):
+    """Generate a clean TypeScript-compatible mapping key"""
+    # Replace special characters and make it TypeScript-friendly
+    key = field_name.replace('form1[0].', '').replace('[', '_').replace(']', '').replace('.', '_').replace('#', 'FIELD_').replace('-', '_')
+    
+    # Make it uppercase and add index for uniqueness
+    key = key.upper()
+    
+    # Ensure uniqueness
+    return f"{key}_{index}"
+
+def generate_value_key(value):
+    """Generate a clean key for string values"""
+    # Handle special characters in values
+    key = value.replace('.', '_').replace(' ', '_').replace('(', '').replace(')', '').replace(',', '').replace('#', 'NUM')
+    
+    # Remove non-alphanumeric characters except underscores
+    key = re.sub(r'[^a-zA-Z0-9_]', '', key)
+    
+    # Make it uppercase
+    return key.upper()
+
+def build_category_tables(indexed_fields):
+    """Build the TEXT/CHECKBOX/RADIO/DROPDOWN/STRING_VALUES tables
+
+    indexed_fields yields (index, field) pairs; the index is the field's
+    position in its section export and becomes the key suffix.
+    """
+    mappings = {category: {} for category in FIELD_CATEGORIES}
+    mappings['STRING_VALUES'] = {}
+    
+    for i, field in indexed_fields:
+        field_name = field.get('name', f'field_{i}')
+        field_value = field.get('value')
+        category = FIELD_TYPE_CATEGORIES.get(field.get('type', 'unknown'))
+        
+        if category:
+            mappings[category][generate_mapping_key(field_name, i)] = field_name
+        
+        if isinstance(field_value, str):
+            mappings['STRING_VALUES'][generate_value_key(field_value)] = field_value
+    
+    return mappings
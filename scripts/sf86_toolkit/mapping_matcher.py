@@ -0,0 +1,194 @@
+"""
+Interface path to PDF field matching
+Proposes a PDF field for every Field<T> path of a section interface. Each
+path is scored only against the fields that share a token with it, found
+through an inverted index over label and field-name tokens (idf weighted),
+then adjusted for widget kind, field names hinted in trailing comments, and
+the subform, page and rect area its sibling paths agree on. Paths and fields
+are finally paired one-to-one, best score first
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'did', 'do', 'for', 'from', 'has', 'have', 'if', 'in', 'is',
+    'it', 'of', 'on', 'or', 'the', 'this', 'to', 'was', 'were', 'with', 'you', 'your', 'provide', 'complete',
+    'section', 'entry', 'info', 'information', 'data', 'value', 'id',
+}
+# Widget and subform naming noise in PDF field names
+NAME_NOISE = {
+    'text', 'field', 'textfield', 'drop', 'down', 'dropdown', 'list', 'radio', 'button', 'check', 'box', 'checkbox',
+    'name', 'datefield', 'area', 'subform', 'form', 'sections', 'p',
+}
+SYNONYMS = {
+    'zipcode': 'zip', 'postal': 'zip', 'telephone': 'phone', 'tel': 'phone', 'cell': 'mobile', 'dob': 'birth',
+    'estimate': 'estimated', 'est': 'estimated', 'apartment': 'apt', 'nbr': 'number', 'num': 'number',
+    'no': 'number', 'st': 'street', 'addr': 'address', 'explain': 'explanation', 'dates': 'date',
+}
+
+KIND_FIELD_TYPES = {
+    'checkbox': {'PDFCheckBox'},
+    'choice': {'PDFRadioGroup', 'PDFDropdown', 'PDFCheckBox'},
+    'dropdown': {'PDFDropdown'},
+    'text': {'PDFTextField', 'PDFDropdown'},
+}
+
+ANCESTOR_WEIGHT = 0.5
+KIND_BONUS = 1.5
+KIND_PENALTY = 2.0
+HINT_BONUS = 4.0
+SUBFORM_BONUS = 1.5
+PAGE_BONUS = 0.75
+PROXIMITY_BONUS = 1.0
+PROXIMITY_SCALE = 150.0
+CANDIDATES_PER_PATH = 16
+MIN_SCORE = 1.0
+
+def words(text):
+    """Normalized word tokens of a label, path segment or field name"""
+    text = re.sub(r'([a-z0-9])([A-Z])', r'\1 \2', text)
+    tokens = []
+    for word in re.findall(r'[a-z]+', text.lower()):
+        word = SYNONYMS.get(word, word)
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        if len(word) > 1 and word not in STOP_WORDS:
+            tokens.append(word)
+    return tokens
+
+def segment_token(segment):
+    """Whole path segment without its index (row1, cell2, ...), matched against PDF name segments"""
+    return '@' + re.sub(r'\[\d+\]$', '', segment).lower()
+
+def path_tokens(path):
+    """{token: weight}: leaf segment words weigh 1, ancestor segment words less"""
+    segments = [re.sub(r'\[\d+\]', '', segment) for segment in path.split('.')]
+    weights = {}
+    for position, segment in enumerate(segments):
+        if re.fullmatch(r'section\d+', segment):
+            continue
+        weight = 1.0 if position == len(segments) - 1 else ANCESTOR_WEIGHT
+        for token in words(segment) + [segment_token(segment)]:
+            weights[token] = max(weights.get(token, 0), weight)
+    return weights
+
+def field_tokens(field):
+    tokens = set(words(field.get('label') or ''))
+    segments = field['name'].split('.')[1:]
+    tokens.update(token for token in words(segments[-1].replace('_', ' ')) if token not in NAME_NOISE)
+    tokens.update(segment_token(segment) for segment in segments)
+    return tokens
+
+def comment_hints(comment):
+    """PDF field leaf names mentioned in a trailing comment (TextField11[3], #field[50], ...)"""
+    hints = []
+    for base, indexes in re.findall(r'(#?[A-Za-z][\w-]*)\[(\d+(?:\s*,\s*\d+)*)\]', comment):
+        hints.extend(f'{base}[{index.strip()}]' for index in indexes.split(','))
+    return hints
+
+def rect_center(field):
+    rect = field.get('rect')
+    if not rect:
+        return None
+    return rect['x'] + rect['width'] / 2, rect['y'] + rect['height'] / 2
+
+class SectionMatcher:
+    """Inverted indexes over one section's reference fields"""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.postings = defaultdict(list)
+        for row, field in enumerate(fields):
+            for token in field_tokens(field):
+                self.postings[token].append(row)
+        self.idf = {token: math.log(1 + len(fields) / len(rows)) for token, rows in self.postings.items()}
+        self.by_leaf = defaultdict(list)
+        for row, field in enumerate(fields):
+            self.by_leaf[field['name'].rpartition('.')[2]].append(row)
+        self.subforms = [field['name'].rpartition('.')[0] for field in fields]
+        self.centers = [rect_center(field) for field in fields]
+
+    def candidates(self, path, kind, comment):
+        """{row: score} from token overlap, comment hints and widget kind"""
+        scores = defaultdict(float)
+        for token, weight in path_tokens(path).items():
+            for row in self.postings.get(token, ()):
+                scores[row] += weight * self.idf[token]
+        for hint in comment_hints(comment):
+            for row in self.by_leaf.get(hint, ()):
+                scores[row] += HINT_BONUS
+        allowed = KIND_FIELD_TYPES.get(kind, set())
+        for row in scores:
+            scores[row] += KIND_BONUS if self.fields[row]['type'] in allowed else -KIND_PENALTY
+        return dict(sorted(scores.items(), key=lambda item: -item[1])[:CANDIDATES_PER_PATH])
+
+    def apply_context(self, scored):
+        """Boost candidates in the subform / page / area that sibling paths agree on
+
+        scored maps path -> {row: score} and is updated in place; each path's
+        best candidate votes for its parent object's subform, page and area.
+        """
+        best = {}
+        for path, rows in scored.items():
+            if rows:
+                row, score = max(rows.items(), key=lambda item: item[1])
+                if score >= MIN_SCORE:
+                    best[path] = (row, score)
+
+        groups = defaultdict(list)
+        for path in scored:
+            groups[path.rpartition('.')[0]].append(path)
+
+        for paths in groups.values():
+            subform_votes = Counter()
+            page_votes = Counter()
+            centers = []
+            for path in paths:
+                if path not in best:
+                    continue
+                row, score = best[path]
+                subform_votes[self.subforms[row]] += score
+                page_votes[self.fields[row].get('page')] += score
+                if self.centers[row]:
+                    centers.append(self.centers[row])
+            if not subform_votes:
+                continue
+            subform = subform_votes.most_common(1)[0][0]
+            page = page_votes.most_common(1)[0][0]
+            centroid = (sum(x for x, _ in centers) / len(centers),
+                        sum(y for _, y in centers) / len(centers)) if centers else None
+
+            for path in paths:
+                for row in scored[path]:
+                    bonus = 0.0
+                    if self.subforms[row] == subform:
+                        bonus += SUBFORM_BONUS
+                    if self.fields[row].get('page') == page:
+                        bonus += PAGE_BONUS
+                    if centroid and self.centers[row]:
+                        distance = math.hypot(self.centers[row][0] - centroid[0], self.centers[row][1] - centroid[1])
+                        bonus += PROXIMITY_BONUS * math.exp(-distance / PROXIMITY_SCALE)
+                    scored[path][row] += bonus
+
+    def propose(self, field_paths):
+        """{path: (assigned row or None, [(row, score)] ranked)} for [(path, kind, comment)]"""
+        scored = {path: self.candidates(path, kind, comment) for path, kind, comment in field_paths}
+        self.apply_context(scored)
+
+        # One-to-one: best remaining (score, path, field) first
+        ranked_pairs = sorted(((score, path, row) for path, rows in scored.items() for row, score in rows.items()),
+                              key=lambda item: (-item[0], item[1], item[2]))
+        assigned = {}
+        taken = set()
+        for score, path, row in ranked_pairs:
+            if score < MIN_SCORE:
+                break
+            if path in assigned or row in taken:
+                continue
+            assigned[path] = row
+            taken.add(row)
+
+        return {path: (assigned.get(path), sorted(rows.items(), key=lambda item: -item[1]))
+                for path, rows in scored.items()}
@@ -0,0 +1,92 @@
+"""
+Field membership filter
+A Bloom filter over every valid field key (PDF field names and ids without
+the ' 0 R' suffix) for answering "does this field exist at all?" with a few
+hash probes, emitted next to the exact key -> section index that confirms
+positives. Probes use FNV-1a double hashing over the UTF-8 key (32-bit
+multiply, as Math.imul) so a JavaScript reader can compute the same bit
+positions
+"""
+
+import base64
+import math
+
+from .constraints import normalize_field_id
+
+FORMAT = 'sf86-bloom/1'
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+FNV_OFFSET = 0x811c9dc5
+FNV_PRIME = 0x01000193
+# Seed of the second hash; the step between probes is that hash forced odd
+SECOND_HASH_SEED = 0x5bd1e995
+
+def fnv1a(data, seed=0):
+    value = FNV_OFFSET ^ seed
+    for byte in data:
+        value = ((value ^ byte) * FNV_PRIME) & 0xffffffff
+    return value
+
+def field_key(identifier):
+    """Key probed for a field name or id ("9434 0 R" and "9434" are the same key)"""
+    return normalize_field_id(identifier)
+
+def probe_positions(key, bit_count, hash_count):
+    data = key.encode('utf-8')
+    first = fnv1a(data)
+    step = fnv1a(data, SECOND_HASH_SEED) | 1
+    return [(first + i * step) % bit_count for i in range(hash_count)]
+
+def filter_size(key_count, false_positive_rate):
+    """(bit count rounded up to whole bytes, hash count) for the target rate"""
+    bit_count = max(8, math.ceil(-key_count * math.log(false_positive_rate) / math.log(2) ** 2))
+    bit_count = (bit_count + 7) // 8 * 8
+    hash_count = max(1, round(bit_count / max(1, key_count) * math.log(2)))
+    return bit_count, hash_count
+
+class BloomFilter:
+    def __init__(self, bit_count, hash_count, bits=None):
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.bits = bytearray(bits) if bits is not None else bytearray(bit_count // 8)
+
+    @classmethod
+    def from_keys(cls, keys, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+        keys = set(keys)
+        bloom = cls(*filter_size(len(keys), false_positive_rate))
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def add(self, key):
+        for position in probe_positions(key, self.bit_count, self.hash_count):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in probe_positions(key, self.bit_count, self.hash_count))
+
+    def export(self, key_count, false_positive_rate):
+        return {
+            'format': FORMAT,
+            'bitCount': self.bit_count,
+            'hashCount': self.hash_count,
+            'keyCount': key_count,
+            'falsePositiveRate': false_positive_rate,
+            'bits': base64.b64encode(bytes(self.bits)).decode('ascii'),
+        }
+
+    @classmethod
+    def from_export(cls, data):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"Not a {FORMAT} filter")
+        return cls(data['bitCount'], data['hashCount'], base64.b64decode(data['bits']))
+
+def exact_field_index(references):
+    """{field key: section id} over all sections; a key in several sections keeps the first"""
+    index = {}
+    for section_id, data in sorted(references.items()):
+        for field in data['fields']:
+            index.setdefault(field_key(field['name']), section_id)
+            index.setdefault(field_key(field['id']), section_id)
+    return dict(sorted(index.items()))
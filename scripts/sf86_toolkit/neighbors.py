@@ -0,0 +1,112 @@
+"""
+Field neighbour adjacency table
+Precomputes, for every reference field, its k nearest widgets on the same page
+(by rect centre) and its sibling widgets in the same subform, stored as flat
+integer arrays that consumers load once
+"""
+
+import heapq
+import json
+import math
+
+DEFAULT_NEIGHBOR_COUNT = 8
+
+def rect_center(rect):
+    return rect['x'] + rect['width'] / 2, rect['y'] + rect['height'] / 2
+
+def subform_of(field_name):
+    """Parent path of a widget: everything before its last '.' segment"""
+    return field_name.rpartition('.')[0]
+
+def nearest_on_page(centers, k):
+    """k nearest other widgets for each widget of one page
+
+    centers is a list of (field index, (x, y)); returns {field index: [indexes]}
+    ordered by distance, ties broken by field index.
+    """
+    nearest = {}
+    for field_index, (x, y) in centers:
+        candidates = ((math.hypot(x - other_x, y - other_y), other_index)
+                      for other_index, (other_x, other_y) in centers if other_index != field_index)
+        nearest[field_index] = [other_index for _, other_index in heapq.nsmallest(k, candidates)]
+    return nearest
+
+def build_neighbor_table(fields, k=DEFAULT_NEIGHBOR_COUNT):
+    """Adjacency table over fields (in order; the position is the field index)
+
+    neighbors holds k entries per field, padded with -1 where a page has fewer
+    than k + 1 widgets. Subforms are stored once: subformOf maps a field to
+    its subform, whose members are subformMembers[subformOffsets[s]:subformOffsets[s + 1]].
+    """
+    by_page = {}
+    for field_index, field in enumerate(fields):
+        if field.get('rect'):
+            by_page.setdefault(field.get('page', 0), []).append((field_index, rect_center(field['rect'])))
+
+    neighbors = [-1] * (len(fields) * k)
+    for centers in by_page.values():
+        for field_index, nearest in nearest_on_page(centers, k).items():
+            neighbors[field_index * k:field_index * k + len(nearest)] = nearest
+
+    subform_ids = {}
+    subform_of_field = []
+    members = []
+    for field_index, field in enumerate(fields):
+        subform = subform_of(field['name'])
+        subform_id = subform_ids.setdefault(subform, len(subform_ids))
+        if subform_id == len(members):
+            members.append([])
+        members[subform_id].append(field_index)
+        subform_of_field.append(subform_id)
+
+    offsets = [0]
+    for group in members:
+        offsets.append(offsets[-1] + len(group))
+
+    return {
+        'k': k,
+        'names': [field['name'] for field in fields],
+        'pages': [field.get('page', 0) for field in fields],
+        'sections': [field.get('section', 0) for field in fields],
+        'neighbors': neighbors,
+        'subforms': list(subform_ids),
+        'subformOf': subform_of_field,
+        'subformOffsets': offsets,
+        'subformMembers': [field_index for group in members for field_index in group],
+    }
+
+def save_neighbor_table(table, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(table, f, separators=(',', ':'))
+
+class NeighborTable:
+    """Loaded adjacency table with name-keyed accessors"""
+
+    def __init__(self, table):
+        self.table = table
+        self.k = table['k']
+        self.index_by_name = {}
+        for field_index, name in enumerate(table['names']):
+            self.index_by_name.setdefault(name, field_index)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def nearest(self, field_name):
+        """Names of the k nearest widgets on the field's page"""
+        field_index = self.index_by_name.get(field_name)
+        if field_index is None:
+            return []
+        row = self.table['neighbors'][field_index * self.k:(field_index + 1) * self.k]
+        return [self.table['names'][other] for other in row if other >= 0]
+
+    def siblings(self, field_name):
+        """Names of the other widgets in the field's subform"""
+        field_index = self.index_by_name.get(field_name)
+        if field_index is None:
+            return []
+        subform_id = self.table['subformOf'][field_index]
+        start, end = self.table['subformOffsets'][subform_id], self.table['subformOffsets'][subform_id + 1]
+        return [self.table['names'][other] for other in self.table['subformMembers'][start:end] if other != field_index]
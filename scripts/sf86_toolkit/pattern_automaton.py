@@ -0,0 +1,177 @@
+"""
+Combined pattern automaton
+Compiles many tagged regular expressions into one Aho-Corasick automaton over
+their literal expansions, so every pattern matching a string is found in a
+single scan; patterns that cannot be expanded are guarded by a required
+literal and only run when that literal was seen
+"""
+
+import re
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+# Patterns whose literal expansion grows past this are run as guarded regexes
+MAX_LITERALS_PER_PATTERN = 64
+
+class AhoCorasick:
+    """Multi-literal matcher: add() literals with payloads, build(), then scan()"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+    def add(self, literal, payload):
+        state = 0
+        for char in literal:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        self.output[state].append((len(literal), payload))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def scan(self, text):
+        """Yield (start, payload) for every literal occurrence in text"""
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for length, payload in self.output[state]:
+                yield end - length + 1, payload
+
+def _is_unbounded_any(item):
+    op, av = item
+    return op == sre_constants.MAX_REPEAT and av[0] == 0 and av[2] and av[2][0][0] == sre_constants.ANY
+
+def _expand(items, limit):
+    """Literal strings matched by a parsed sequence, or None if not finite/small"""
+    results = ['']
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            options = [chr(av)]
+        elif op == sre_constants.IN:
+            options = []
+            for member_op, member_av in av:
+                if member_op == sre_constants.LITERAL:
+                    options.append(chr(member_av))
+                elif member_op == sre_constants.RANGE:
+                    options.extend(chr(code) for code in range(member_av[0], member_av[1] + 1))
+                else:
+                    return None
+        elif op == sre_constants.SUBPATTERN:
+            options = _expand(av[3], limit)
+        elif op == sre_constants.BRANCH:
+            options = []
+            for branch in av[1]:
+                expanded = _expand(branch, limit)
+                if expanded is None:
+                    return None
+                options.extend(expanded)
+        elif op == sre_constants.MAX_REPEAT and av[0] == av[1]:
+            options = _expand(list(av[2]) * av[0], limit)
+        else:
+            return None
+        if options is None or len(results) * len(options) > limit:
+            return None
+        results = [prefix + option for prefix in results for option in options]
+    return results
+
+def _required_literal(items):
+    """Longest run of plain literals in a top-level sequence (the prefilter)"""
+    best, run = '', ''
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            run += chr(av)
+            continue
+        best, run = max(best, run, key=len), ''
+    return max(best, run, key=len)
+
+def compile_pattern(source, ignore_case=False, limit=MAX_LITERALS_PER_PATTERN):
+    """Analyse a regex for the automaton
+
+    Returns (literals, anchored, required): literals is the finite set of
+    strings the pattern matches as a substring search (None when it cannot be
+    expanded), anchored says a literal must start at position 0, and required
+    is a literal every match contains (the guard for unexpanded patterns).
+    Literals are lowercased for case-insensitive patterns.
+    """
+    items = list(sre_parse.parse(source))
+    anchored = bool(items) and items[0] == (sre_constants.AT, sre_constants.AT_BEGINNING)
+    if anchored:
+        items = items[1:]
+    # Leading/trailing ".*" do not change what a substring search matches
+    while items and _is_unbounded_any(items[0]) and not anchored:
+        items = items[1:]
+    while items and _is_unbounded_any(items[-1]):
+        items = items[:-1]
+
+    literals = _expand(items, limit) if items else None
+    required = _required_literal(items)
+    if ignore_case:
+        literals = None if literals is None else [literal.lower() for literal in literals]
+        required = required.lower()
+    return literals, anchored, required
+
+class PatternAutomaton:
+    """All tagged patterns, matched against a string in one pass per case mode"""
+
+    def __init__(self, patterns):
+        """patterns: iterable of (tag, regex source, ignore_case)"""
+        self.automata = {False: AhoCorasick(), True: AhoCorasick()}
+        self.guarded = []
+        self.literal_count = 0
+        for tag, source, ignore_case in patterns:
+            literals, anchored, required = compile_pattern(source, ignore_case)
+            automaton = self.automata[ignore_case]
+            if literals is not None:
+                for literal in literals:
+                    automaton.add(literal, ('literal', tag, anchored))
+                self.literal_count += len(literals)
+                continue
+            guard_id = len(self.guarded)
+            self.guarded.append((tag, re.compile(source, re.IGNORECASE if ignore_case else 0)))
+            if required:
+                automaton.add(required, ('guard', guard_id, False))
+            else:
+                self.guarded[guard_id] += (True,)
+        for automaton in self.automata.values():
+            automaton.build()
+
+    def matches(self, text):
+        """Set of tags whose pattern matches somewhere in text"""
+        tags = set()
+        triggered = set()
+        for ignore_case, automaton in self.automata.items():
+            for start, (kind, value, anchored) in automaton.scan(text.lower() if ignore_case else text):
+                if kind == 'literal':
+                    if not anchored or start == 0:
+                        tags.add(value)
+                else:
+                    triggered.add(value)
+        for guard_id, (tag, regex, *always) in enumerate(self.guarded):
+            if tag not in tags and (always or guard_id in triggered) and regex.search(text):
+                tags.add(tag)
+        return tags
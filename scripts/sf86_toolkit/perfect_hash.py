@@ -0,0 +1,187 @@
+"""
+Minimal perfect hashing for PDF field names and uniqueIds
+CHD-style (hash, displace) construction over 32-bit FNV-1a + murmur finalizer,
+mirrored exactly by the TypeScript lookup emitted alongside the tables
+"""
+
+import base64
+import math
+import struct
+
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME = 0x01000193
+SEED_MULTIPLIER = 0x9E3779B1
+MASK32 = 0xFFFFFFFF
+
+# Average keys per bucket; 4 keeps displacements well inside 16 bits
+BUCKET_LOAD = 4
+MAX_DISPLACEMENT = 0xFFFF
+
+def fnv1a32(key):
+    """32-bit FNV-1a over UTF-16 code units (what JS charCodeAt yields)"""
+    h = FNV_OFFSET
+    encoded = key.encode('utf-16-le')
+    for (unit,) in struct.iter_unpack('<H', encoded):
+        h = ((h ^ unit) * FNV_PRIME) & MASK32
+    return h
+
+def check_hash32(key):
+    """Second, independent 32-bit hash; paired with fnv1a32 it confirms membership"""
+    h = 0x9747B28C
+    encoded = key.encode('utf-16-le')
+    for (unit,) in struct.iter_unpack('<H', encoded):
+        h = ((h ^ unit) * 0x5BD1E995) & MASK32
+        h ^= h >> 15
+    return fmix32(h)
+
+def fmix32(h):
+    """murmur3 finalizer"""
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & MASK32
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & MASK32
+    h ^= h >> 16
+    return h
+
+def bucket_of(base_hash, bucket_count):
+    return fmix32(base_hash) % bucket_count
+
+def slot_of(base_hash, displacement, key_count):
+    return fmix32(base_hash ^ ((displacement * SEED_MULTIPLIER) & MASK32)) % key_count
+
+def build_minimal_perfect_hash(keys):
+    """Build a minimal perfect hash over distinct keys
+
+    Returns (displacements, slots, base_hashes): one displacement per
+    bucket, the slot assigned to each key (a permutation of 0..n-1), and
+    each key's base hash. The base hash and check_hash32 together form the
+    64-bit fingerprint stored per slot to reject non-members.
+    """
+    key_count = len(keys)
+    if key_count == 0:
+        return [], [], []
+
+    base_hashes = [fnv1a32(key) for key in keys]
+    if len(set(base_hashes)) != key_count:
+        raise ValueError('Base hash collision between distinct keys; cannot build a perfect hash')
+
+    bucket_count = max(1, math.ceil(key_count / BUCKET_LOAD))
+    buckets = [[] for _ in range(bucket_count)]
+    for key_index, base_hash in enumerate(base_hashes):
+        buckets[bucket_of(base_hash, bucket_count)].append(key_index)
+
+    displacements = [0] * bucket_count
+    slots = [None] * key_count
+    taken = bytearray(key_count)
+
+    for bucket_index in sorted(range(bucket_count), key=lambda b: len(buckets[b]), reverse=True):
+        members = buckets[bucket_index]
+        if not members:
+            break
+        for displacement in range(MAX_DISPLACEMENT + 1):
+            candidate = [slot_of(base_hashes[k], displacement, key_count) for k in members]
+            if len(set(candidate)) == len(candidate) and not any(taken[s] for s in candidate):
+                break
+        else:
+            raise ValueError(f'No displacement found for bucket {bucket_index}')
+        displacements[bucket_index] = displacement
+        for key_index, slot in zip(members, candidate):
+            slots[key_index] = slot
+            taken[slot] = 1
+
+    return displacements, slots, base_hashes
+
+def slot_fingerprints(keys, slots, base_hashes):
+    """Per-slot (base hash, check hash) arrays in slot order"""
+    base_by_slot = [0] * len(keys)
+    check_by_slot = [0] * len(keys)
+    for key, slot, base_hash in zip(keys, slots, base_hashes):
+        base_by_slot[slot] = base_hash
+        check_by_slot[slot] = check_hash32(key)
+    return base_by_slot, check_by_slot
+
+def candidate_slot(key, displacements, key_count):
+    """Slot key would occupy; only meaningful once membership is confirmed"""
+    base_hash = fnv1a32(key)
+    return slot_of(base_hash, displacements[bucket_of(base_hash, len(displacements))], key_count)
+
+def lookup_slot(key, displacements, base_by_slot, check_by_slot):
+    """Slot of key, or None when its fingerprint does not match (not a member)"""
+    key_count = len(base_by_slot)
+    if key_count == 0:
+        return None
+    slot = candidate_slot(key, displacements, key_count)
+    if base_by_slot[slot] != fnv1a32(key) or check_by_slot[slot] != check_hash32(key):
+        return None
+    return slot
+
+def encode_uint_array(values, width):
+    """Base64 of a little-endian unsigned array (width 1, 2 or 4 bytes)"""
+    code = {1: 'B', 2: 'H', 4: 'I'}[width]
+    return base64.b64encode(struct.pack(f'<{len(values)}{code}', *values)).decode('ascii')
+
+# TypeScript mirror of fnv1a32/fmix32/slot_of plus base64 typed-array decoding
+TYPESCRIPT_RUNTIME = """
+const fnv1a32 = (key: string): number => {
+  let h = 0x811c9dc5;
+  for (let i = 0; i < key.length; i++) {
+    h = Math.imul(h ^ key.charCodeAt(i), 0x01000193);
+  }
+  return h >>> 0;
+};
+
+const checkHash32 = (key: string): number => {
+  let h = 0x9747b28c;
+  for (let i = 0; i < key.length; i++) {
+    h = Math.imul(h ^ key.charCodeAt(i), 0x5bd1e995);
+    h ^= h >>> 15;
+  }
+  return fmix32(h);
+};
+
+const fmix32 = (value: number): number => {
+  let h = value >>> 0;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+};
+
+const decodeBytes = (encoded: string): Uint8Array => Uint8Array.from(atob(encoded), (c) => c.charCodeAt(0));
+const decodeUint16 = (encoded: string): Uint16Array => {
+  const bytes = decodeBytes(encoded);
+  return new Uint16Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 2);
+};
+const decodeUint32 = (encoded: string): Uint32Array => {
+  const bytes = decodeBytes(encoded);
+  return new Uint32Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 4);
+};
+
+interface PerfectHashTable {
+  displacements: Uint16Array;
+  baseHashes: Uint32Array;
+  checkHashes: Uint32Array;
+}
+
+/**
+ * Slot key would occupy in a minimal perfect hash of count keys; the caller
+ * must confirm membership (by fingerprint or by comparing the stored key)
+ */
+const candidateSlot = (displacements: Uint16Array, count: number, key: string): number => {
+  const baseHash = fnv1a32(key);
+  const displacement = displacements[fmix32(baseHash) % displacements.length];
+  return fmix32(baseHash ^ Math.imul(displacement, 0x9e3779b1)) % count;
+};
+
+/**
+ * Slot of key in a fingerprinted minimal perfect hash table, or -1 if key is not a member
+ */
+const lookupSlot = (table: PerfectHashTable, key: string): number => {
+  const count = table.baseHashes.length;
+  if (count === 0) return -1;
+  const slot = candidateSlot(table.displacements, count, key);
+  return table.baseHashes[slot] === fnv1a32(key) && table.checkHashes[slot] === checkHash32(key) ? slot : -1;
+};
+"""
@@ -0,0 +1,56 @@
+"""
+Consumer projections of the reference exports
+Each consumer declared in api/sections-references/projections/schema.json
+lists the metadata and field keys it reads; a projection of a section export
+keeps only those keys, in the export's field order, so each code path parses
+only what it uses
+"""
+
+import json
+import os
+
+from .references import REFERENCES_DIR
+
+PROJECTIONS_DIR = os.path.join(REFERENCES_DIR, 'projections')
+SCHEMA_PATH = os.path.join(PROJECTIONS_DIR, 'schema.json')
+
+def load_projection_schemas(path=SCHEMA_PATH):
+    """{consumer name: {'consumers': [...], 'metadata': [keys], 'fields': [keys]}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def projection_path(name, section_id, projections_dir=PROJECTIONS_DIR):
+    return os.path.join(projections_dir, name, f'section-{section_id}.json')
+
+def project_section(data, schema):
+    """The projection of one section export (absent keys stay absent)"""
+    metadata = data['metadata']
+    return {
+        'metadata': {key: metadata[key] for key in schema['metadata'] if key in metadata},
+        'fields': [{key: field[key] for key in schema['fields'] if key in field} for field in data['fields']],
+    }
+
+def projection_errors(projection, data, schema):
+    """Differences between a projection and the export it should be projected from
+
+    Checks the metadata keys, the field count and order (by name) and every
+    projected value; returns messages, empty when consistent.
+    """
+    errors = []
+    if set(projection) != {'metadata', 'fields'}:
+        errors.append(f"unexpected top-level keys {sorted(set(projection) - {'metadata', 'fields'})}")
+    expected = project_section(data, schema)
+    if projection.get('metadata') != expected['metadata']:
+        errors.append('metadata differs from the export')
+    fields = projection.get('fields', [])
+    if len(fields) != len(expected['fields']):
+        errors.append(f"{len(fields)} fields, export has {len(expected['fields'])}")
+    allowed = set(schema['fields'])
+    for position, (field, expected_field) in enumerate(zip(fields, expected['fields'])):
+        extra = set(field) - allowed
+        if extra:
+            errors.append(f'field {position}: keys outside the schema {sorted(extra)}')
+        elif field != expected_field:
+            differing = sorted(key for key in allowed if field.get(key) != expected_field.get(key))
+            errors.append(f"field {position} ({data['fields'][position]['name']}): {', '.join(differing)} differ")
+    return errors
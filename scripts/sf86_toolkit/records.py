@@ -0,0 +1,35 @@
+"""
+Exported applicant records
+Streams {section, data} records from NDJSON files, JSON-array files or stdin
+"""
+
+import json
+import sys
+
+def iter_records(paths):
+    """Yield raw record text: NDJSON lines, or elements of a JSON array file"""
+    for path in paths:
+        stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        try:
+            first = stream.read(1)
+            while first.isspace():
+                first = stream.read(1)
+            if first == '[':
+                for record in json.loads(first + stream.read()):
+                    yield json.dumps(record)
+                continue
+            pending = first
+            for line in stream:
+                line = pending + line
+                pending = ''
+                if line.strip():
+                    yield line
+            if pending.strip():
+                yield pending
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+def record_data(record):
+    """The ApplicantFormValues tree of a record (bare trees are accepted too)"""
+    return record.get('data', record) if isinstance(record, dict) else record
@@ -0,0 +1,127 @@
+"""
+Reference export diffs
+Compares two sets of section-N.json exports (two directories, or a git
+revision and the working tree) with hash joins: fields are paired on
+uniqueId, then on PDF field name, then on PDF object id, so every field is
+looked at a constant number of times. Paired fields are checked for name,
+type, page, section and rect changes
+"""
+
+import json
+import os
+import re
+import subprocess
+from collections import defaultdict, deque
+
+from .references import REFERENCES_DIR, REPO_ROOT, SECTION_IDS
+
+CHANGE_KINDS = ['added', 'removed', 'renamed', 'retyped', 'repaged', 'resectioned', 'moved']
+
+# Rect edges may drift by this many points before a field counts as moved
+DEFAULT_RECT_TOLERANCE = 0.5
+
+GIT_PREFIX = 'git:'
+
+def load_export_set(spec, references_dir=REFERENCES_DIR):
+    """Load an export set: {section id: export dict}
+
+    spec is a directory of section-N.json files, a single export file, or
+    git:<rev> for the exports in references_dir at that revision.
+    """
+    if spec.startswith(GIT_PREFIX):
+        return load_git_export_set(spec[len(GIT_PREFIX):], references_dir)
+    if os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            export = json.load(f)
+        return {export.get('metadata', {}).get('sectionId', 0): export}
+
+    exports = {}
+    for file_name in os.listdir(spec):
+        match = re.fullmatch(r'section-(\d+)\.json', file_name)
+        if match:
+            with open(os.path.join(spec, file_name), 'r', encoding='utf-8') as f:
+                exports[int(match.group(1))] = json.load(f)
+    return exports
+
+def load_git_export_set(revision, references_dir=REFERENCES_DIR):
+    relative_dir = os.path.relpath(references_dir, REPO_ROOT).replace(os.sep, '/')
+    exports = {}
+    for section_id in SECTION_IDS:
+        result = subprocess.run(['git', 'show', f'{revision}:{relative_dir}/section-{section_id}.json'],
+                                cwd=REPO_ROOT, capture_output=True)
+        if result.returncode == 0:
+            exports[section_id] = json.loads(result.stdout)
+    if not exports:
+        raise ValueError(f'No section exports found at {revision}:{relative_dir}')
+    return exports
+
+def export_fields(exports):
+    """All fields of an export set, in section order"""
+    return [field for _, export in sorted(exports.items()) for field in export.get('fields', [])]
+
+def rect_delta(old_rect, new_rect):
+    """Largest edge movement between two rects (0 when either is missing)"""
+    if not old_rect or not new_rect:
+        return 0.0
+    return max(abs(old_rect[key] - new_rect[key]) for key in ('x', 'y', 'width', 'height'))
+
+def join(old_fields, new_fields, key):
+    """Pair unmatched old and new fields with equal key values
+
+    Both arguments are {position: field} of the fields still unmatched and
+    are updated in place; returns [(old position, new position)]. Repeated
+    keys pair up in order.
+    """
+    waiting = defaultdict(deque)
+    for position, field in old_fields.items():
+        if field.get(key):
+            waiting[field[key]].append(position)
+    pairs = []
+    for position, field in list(new_fields.items()):
+        candidates = waiting.get(field.get(key))
+        if candidates:
+            old_position = candidates.popleft()
+            pairs.append((old_position, position))
+            del old_fields[old_position]
+            del new_fields[position]
+    return pairs
+
+def field_summary(field):
+    return {'uniqueId': field.get('uniqueId'), 'name': field.get('name'), 'section': field.get('section')}
+
+def diff_exports(old_exports, new_exports, rect_tolerance=DEFAULT_RECT_TOLERANCE):
+    """Diff two export sets; returns {change kind: [change dicts]}
+
+    A paired field can appear under several kinds (renamed and moved, ...).
+    """
+    old_list = export_fields(old_exports)
+    new_list = export_fields(new_exports)
+    old_unmatched = dict(enumerate(old_list))
+    new_unmatched = dict(enumerate(new_list))
+
+    pairs = []
+    for key in ('uniqueId', 'name', 'id'):
+        pairs.extend(join(old_unmatched, new_unmatched, key))
+
+    changes = {kind: [] for kind in CHANGE_KINDS}
+    changes['removed'] = [field_summary(field) for field in old_unmatched.values()]
+    changes['added'] = [field_summary(field) for field in new_unmatched.values()]
+
+    for old_position, new_position in sorted(pairs, key=lambda pair: pair[1]):
+        old, new = old_list[old_position], new_list[new_position]
+        summary = field_summary(new)
+        for kind, attribute in (('renamed', 'name'), ('retyped', 'type'), ('repaged', 'page'), ('resectioned', 'section')):
+            if old.get(attribute) != new.get(attribute):
+                changes[kind].append({**summary, 'old': old.get(attribute), 'new': new.get(attribute)})
+        delta = rect_delta(old.get('rect'), new.get('rect'))
+        if delta > rect_tolerance:
+            changes['moved'].append({**summary, 'delta': round(delta, 2), 'old': old.get('rect'), 'new': new.get('rect')})
+    return changes
+
+def section_counts(changes):
+    """{section: {change kind: count}}"""
+    counts = defaultdict(lambda: dict.fromkeys(CHANGE_KINDS, 0))
+    for kind, entries in changes.items():
+        for entry in entries:
+            counts[entry.get('section') or 0][kind] += 1
+    return dict(sorted(counts.items()))
@@ -0,0 +1,35 @@
+"""
+Reference export loading
+Locates and loads the per-section field exports in api/sections-references
+"""
+
+import json
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REFERENCES_DIR = os.path.join(REPO_ROOT, 'api', 'sections-references')
+
+SECTION_IDS = range(1, 31)
+
+def reference_path(section_id, references_dir=REFERENCES_DIR):
+    """Path of the section-N.json export for a section"""
+    return os.path.join(references_dir, f'section-{section_id}.json')
+
+def load_reference_index(references_dir=REFERENCES_DIR):
+    """Load index.json (section ids, names, field counts and file names)"""
+    with open(os.path.join(references_dir, 'index.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_section_reference(section_id, references_dir=REFERENCES_DIR):
+    """Load one section-N.json export"""
+    with open(reference_path(section_id, references_dir), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_all_section_references(references_dir=REFERENCES_DIR):
+    """Load every section export listed in index.json, keyed by section id"""
+    index = load_reference_index(references_dir)
+    references = {}
+    for section in index['sections']:
+        with open(os.path.join(references_dir, section['fileName']), 'r', encoding='utf-8') as f:
+            references[section['sectionId']] = json.load(f)
+    return references
@@ -0,0 +1,165 @@
+"""
+Per-section verification
+Checks one section at a time: its section-N.json export (field counts
+against index.json and EXPECTED_FIELD_COUNTS, section numbers, duplicate
+ids) and the literal field identifiers its interface and context sources
+pass to createFieldFromReference or declare as id/name pairs. Also maps
+changed file paths (git diff --name-only) to the sections they affect
+"""
+
+import os
+import re
+import subprocess
+
+from .references import REFERENCES_DIR, REPO_ROOT, SECTION_IDS, load_reference_index, load_section_reference
+
+LOADER_PATH = os.path.join(REPO_ROOT, 'api', 'utils', 'sections-references-loader.ts')
+INTERFACES_DIR = os.path.join(REPO_ROOT, 'api', 'interfaces', 'sections2.0')
+CONTEXTS_DIR = os.path.join(REPO_ROOT, 'app', 'state', 'contexts', 'sections2.0')
+
+# Repo-relative paths whose changes affect one section
+SECTION_PATH_PATTERNS = [
+    re.compile(r'^api/sections-references/section-(\d+)\.json$'),
+    re.compile(r'^api/sections-references/bundles/section-(\d+)\.json$'),
+    re.compile(r'^api/interfaces/sections2\.0/section(\d+)(?:-[\w-]+)?\.ts$'),
+    re.compile(r'^app/state/contexts/sections2\.0/section(\d+)(?:-[\w-]+)?\.tsx?$'),
+]
+# Changes to these affect every section
+SHARED_PATHS = {
+    'api/sections-references/index.json',
+    'api/utils/sections-references-loader.ts',
+    'api/interfaces/sections2.0/base.ts',
+}
+
+# createFieldFromReference(N, 'literal', ...) with a string literal identifier
+REFERENCE_CALL = re.compile(r'createFieldFromReference\s*(?:<[^>(]*>)?\(\s*(\d+)\s*,\s*([\'"`])([^\'"`]+)\2')
+# Inline field declarations: id: "1234 0 R", name: "form1[0]..."
+DECLARED_FIELD = re.compile(r'id:\s*[\'"](\d+(?: 0 R)?)[\'"]\s*,\s*name:\s*[\'"](form1\[0\][^\'"]*)[\'"]')
+
+def js_literal(text):
+    """Value of a simple JS string literal body (only backslash escapes)"""
+    return re.sub(r'\\(.)', r'\1', text)
+
+def sections_for_paths(paths):
+    """(affected section ids, whether a shared file changed) for repo-relative paths"""
+    sections = set()
+    shared = False
+    for path in paths:
+        path = path.replace(os.sep, '/')
+        if path in SHARED_PATHS:
+            shared = True
+            continue
+        for pattern in SECTION_PATH_PATTERNS:
+            match = pattern.match(path)
+            if match and int(match.group(1)) in SECTION_IDS:
+                sections.add(int(match.group(1)))
+                break
+    return sorted(sections), shared
+
+def changed_paths(base='HEAD', staged=False):
+    """Repo-relative paths changed against base (or staged for commit), plus untracked files"""
+    command = ['git', 'diff', '--name-only', '--cached' if staged else base]
+    if staged and base != 'HEAD':
+        command.append(base)
+    paths = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.split()
+    if not staged:
+        untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'],
+                                   cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.split()
+        paths.extend(untracked)
+    return paths
+
+def load_expected_field_counts(loader_path=LOADER_PATH):
+    """EXPECTED_FIELD_COUNTS from sections-references-loader.ts"""
+    with open(loader_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    block = re.search(r'EXPECTED_FIELD_COUNTS\s*=\s*\{(.*?)\}', source, re.S)
+    if not block:
+        return {}
+    return {int(section): int(count) for section, count in re.findall(r'^\s*(\d+)\s*:\s*(\d+)', block.group(1), re.M)}
+
+def section_source_paths(section_id):
+    """Interface and context sources of a section that exist in the tree"""
+    paths = []
+    for directory, extension in ((INTERFACES_DIR, '.ts'), (CONTEXTS_DIR, '.tsx')):
+        if not os.path.isdir(directory):
+            continue
+        for file_name in sorted(os.listdir(directory)):
+            match = re.fullmatch(rf'section{section_id}(?:-[\w-]+)?(\.tsx?)', file_name)
+            if match and (match.group(1) == extension or directory == CONTEXTS_DIR):
+                paths.append(os.path.join(directory, file_name))
+    return paths
+
+def iter_reference_calls(section_id):
+    """(repo-relative path, line, identifier) for literal createFieldFromReference calls of a section
+
+    Template literals with ${...} placeholders are skipped.
+    """
+    for path in section_source_paths(section_id):
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        relative = os.path.relpath(path, REPO_ROOT)
+        for match in REFERENCE_CALL.finditer(source):
+            if int(match.group(1)) != section_id or '${' in match.group(3):
+                continue
+            yield relative, source.count('\n', 0, match.start()) + 1, js_literal(match.group(3))
+
+def resolves(identifier, ids, names, unique_ids):
+    """Whether createFieldFromReference finds identifier (by id, then name, then uniqueId)"""
+    return identifier.replace(' 0 R', '', 1) in ids or identifier in names or identifier in unique_ids
+
+class SectionVerifier:
+    """Runs the checks for a section; shared inputs are loaded once"""
+
+    def __init__(self, references_dir=REFERENCES_DIR):
+        self.references_dir = references_dir
+        self.index_counts = {section['sectionId']: section.get('fieldCount')
+                             for section in load_reference_index(references_dir)['sections']}
+        self.expected_counts = load_expected_field_counts()
+
+    def verify(self, section_id):
+        """(errors, warnings, identifiers checked) for one section"""
+        errors = []
+        warnings = []
+        try:
+            data = load_section_reference(section_id, self.references_dir)
+        except (OSError, ValueError) as error:
+            return [f'section-{section_id}.json: {error}'], warnings, 0
+        fields = data.get('fields', [])
+
+        declared = data.get('metadata', {}).get('totalFields')
+        if declared is not None and declared != len(fields):
+            errors.append(f'metadata.totalFields is {declared}, export has {len(fields)} fields')
+        if self.index_counts.get(section_id) not in (None, len(fields)):
+            errors.append(f'index.json lists {self.index_counts[section_id]} fields, export has {len(fields)}')
+        if self.expected_counts.get(section_id) not in (None, len(fields)):
+            errors.append(f'EXPECTED_FIELD_COUNTS has {self.expected_counts[section_id]}, export has {len(fields)}')
+
+        misplaced = sum(1 for field in fields if field.get('section') != section_id)
+        if misplaced:
+            errors.append(f'{misplaced} fields carry a different section number')
+        for key in ('id', 'uniqueId'):
+            values = [field.get(key) for field in fields if field.get(key)]
+            duplicates = len(values) - len(set(values))
+            if duplicates:
+                warnings.append(f'{duplicates} duplicate {key} values')
+
+        by_id = {field['id'].replace(' 0 R', '', 1) for field in fields if field.get('id')}
+        names = {field['name'] for field in fields if field.get('name')}
+        unique_ids = {field['uniqueId'] for field in fields if field.get('uniqueId')}
+
+        checked = 0
+        for relative, line, identifier in iter_reference_calls(section_id):
+            checked += 1
+            if not resolves(identifier, by_id, names, unique_ids):
+                errors.append(f'{relative}:{line}: {identifier} is not a section {section_id} field')
+        for path in section_source_paths(section_id):
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+            relative = os.path.relpath(path, REPO_ROOT)
+            for match in DECLARED_FIELD.finditer(source):
+                checked += 1
+                field_id, name = match.group(1), js_literal(match.group(2))
+                if field_id.replace(' 0 R', '', 1) not in by_id or name not in names:
+                    line = source.count('\n', 0, match.start()) + 1
+                    warnings.append(f'{relative}:{line}: {field_id} / {name} is not a section {section_id} field')
+        return errors, warnings, checked
@@ -0,0 +1,326 @@
+"""
+Section interface parsing
+A small scanner for the declarations in api/interfaces/sections2.0: it
+collects interface and type alias bodies, expands the SectionN root into
+every Field<T> path (with the widget kind implied by T and any trailing
+comment), and reads the createFieldFromReference calls of the default
+factories back into (path, identifier) pairs
+"""
+
+import os
+import re
+
+from .references import REPO_ROOT
+
+INTERFACES_DIR = os.path.join(REPO_ROOT, 'api', 'interfaces', 'sections2.0')
+
+FIELD_WRAPPERS = {'Field', 'FieldWithOptions', 'FieldFromReference'}
+# Named string types that render as dropdowns
+DROPDOWN_TYPES = {'USState', 'Country'}
+MAX_DEPTH = 12
+
+def skip_string(source, position):
+    """Position just past the string literal starting at position"""
+    quote = source[position]
+    position += 1
+    while position < len(source) and source[position] != quote:
+        position += 2 if source[position] == '\\' else 1
+    return position + 1
+
+def skip_comment(source, position):
+    """Position past a // or /* comment at position, or position unchanged"""
+    if source.startswith('//', position):
+        end = source.find('\n', position)
+        return len(source) if end < 0 else end
+    if source.startswith('/*', position):
+        end = source.find('*/', position + 2)
+        return len(source) if end < 0 else end + 2
+    return position
+
+def matching_close(source, position):
+    """Index of the bracket closing the one at position (strings and comments skipped)"""
+    depth = 0
+    while position < len(source):
+        after_comment = skip_comment(source, position)
+        if after_comment != position:
+            position = after_comment
+            continue
+        char = source[position]
+        if char in '\'"`':
+            position = skip_string(source, position)
+            continue
+        if char in '{([':
+            depth += 1
+        elif char in '})]':
+            depth -= 1
+            if depth == 0:
+                return position
+        position += 1
+    return len(source) - 1
+
+def split_members(body):
+    """(name, optional, type text, trailing comment) for each property of an object type body"""
+    members = []
+    position = 0
+    while position < len(body):
+        after_comment = skip_comment(body, position)
+        if after_comment != position:
+            position = after_comment
+            continue
+        match = re.compile(r'\s*(?:readonly\s+)?([A-Za-z_$][\w$]*|\'[^\']*\'|"[^"]*")(\??)\s*:').match(body, position)
+        if not match:
+            # Index signatures, methods and stray separators carry no Field<T> paths
+            end = re.compile(r'[;,\n]').search(body, position + 1)
+            position = len(body) if end is None else end.end()
+            continue
+        name, optional = match.group(1).strip('\'"'), bool(match.group(2))
+        position = match.end()
+        start = position
+        depth = 0
+        while position < len(body):
+            after_comment = skip_comment(body, position)
+            if after_comment != position:
+                if depth == 0:
+                    break
+                position = after_comment
+                continue
+            char = body[position]
+            if char in '\'"`':
+                position = skip_string(body, position)
+                continue
+            if char in '{([<':
+                depth += 1
+            elif char in '})]' or (char == '>' and body[position - 1] != '='):
+                depth -= 1
+            elif char in ';,' and depth == 0:
+                break
+            elif char == '\n' and depth == 0 and body[start:position].strip():
+                if not re.match(r'\s*[|&]', body[position:]) and not body[start:position].rstrip().endswith(('|', '&')):
+                    break
+            position += 1
+        type_text = body[start:position].strip()
+        if position < len(body) and body[position] in ';,':
+            position += 1
+        line_end = body.find('\n', position)
+        rest = body[position:len(body) if line_end < 0 else line_end]
+        comment = rest.strip()[2:].strip() if rest.strip().startswith('//') else ''
+        members.append((name, optional, type_text, comment))
+    return members
+
+def parse_declarations(source):
+    """{name: ('interface', body, extends) | ('type', type text)} for a TypeScript source"""
+    declarations = {}
+    for match in re.finditer(r'^\s*(?:export\s+)?interface\s+(\w+)(?:<[^>{]*>)?(?:\s+extends\s+([^{]+))?\s*\{', source, re.M):
+        close = matching_close(source, match.end() - 1)
+        extends = [name.strip() for name in (match.group(2) or '').split(',') if name.strip()]
+        declarations[match.group(1)] = ('interface', source[match.end():close], extends)
+    for match in re.finditer(r'^\s*(?:export\s+)?type\s+(\w+)(?:<[^>=]*>)?\s*=', source, re.M):
+        position = match.end()
+        depth = 0
+        while position < len(source):
+            after_comment = skip_comment(source, position)
+            if after_comment != position:
+                position = after_comment
+                continue
+            char = source[position]
+            if char in '\'"`':
+                position = skip_string(source, position)
+                continue
+            if char in '{([<':
+                depth += 1
+            elif char in '})]' or (char == '>' and source[position - 1] != '='):
+                depth -= 1
+            elif char == ';' and depth == 0:
+                break
+            elif char == '\n' and depth == 0 and re.match(r'\n\s*(?:export|interface|type|const|function|/\*\*)\b', source[position:]):
+                break
+            position += 1
+        declarations.setdefault(match.group(1), ('type', source[match.end():position].strip()))
+    return declarations
+
+def strip_comments(text):
+    """text with // and /* */ comments removed (string literals kept intact)"""
+    kept = []
+    position = 0
+    start = 0
+    while position < len(text):
+        after_comment = skip_comment(text, position)
+        if after_comment != position:
+            kept.append(text[start:position])
+            position = start = after_comment
+            continue
+        position = skip_string(text, position) if text[position] in '\'"`' else position + 1
+    kept.append(text[start:])
+    return ''.join(kept)
+
+def strip_type(type_text):
+    """Type text without comments, surrounding parentheses, | undefined / | null and leading |"""
+    type_text = strip_comments(type_text).strip()
+    parts = [part.strip() for part in split_top_level(type_text, '|')]
+    parts = [part for part in parts if part and part not in ('undefined', 'null')]
+    type_text = ' | '.join(parts)
+    while type_text.startswith('(') and matching_close(type_text, 0) == len(type_text) - 1:
+        type_text = type_text[1:-1].strip()
+    return type_text
+
+def split_top_level(text, separator):
+    parts = []
+    depth = 0
+    start = 0
+    position = 0
+    while position < len(text):
+        char = text[position]
+        if char in '\'"`':
+            position = skip_string(text, position)
+            continue
+        if char in '{([<':
+            depth += 1
+        elif char in '})]' or (char == '>' and text[position - 1] != '='):
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:position])
+            start = position + 1
+        position += 1
+    parts.append(text[start:])
+    return parts
+
+class InterfaceModel:
+    """Declarations of one section file plus base.ts, expanded into Field<T> paths"""
+
+    def __init__(self, declarations):
+        self.declarations = declarations
+
+    @classmethod
+    def for_section(cls, section_id, interfaces_dir=INTERFACES_DIR):
+        declarations = {}
+        for file_name in ('base.ts', f'section{section_id}.ts'):
+            path = os.path.join(interfaces_dir, file_name)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    declarations.update(parse_declarations(f.read()))
+        return cls(declarations)
+
+    def value_kind(self, value_type, depth=0):
+        """'checkbox', 'choice', 'dropdown' or 'text' for the T of Field<T>"""
+        value_type = strip_type(value_type)
+        if value_type == 'boolean':
+            return 'checkbox'
+        if value_type in DROPDOWN_TYPES:
+            return 'dropdown'
+        parts = [part.strip() for part in split_top_level(value_type, '|')]
+        if len(parts) > 1 or re.fullmatch(r'([\'"`]).*\1', value_type):
+            return 'choice'
+        declaration = self.declarations.get(value_type)
+        if declaration and declaration[0] == 'type' and depth < MAX_DEPTH:
+            return self.value_kind(declaration[1], depth + 1)
+        return 'text'
+
+    def field_paths(self, root):
+        """[(path, kind, trailing comment)] for every Field<T> under the root interface"""
+        paths = []
+        self._expand_named(root, '', paths, 0, set())
+        return paths
+
+    def _expand_named(self, name, path, paths, depth, seen):
+        declaration = self.declarations.get(name)
+        if declaration is None or name in seen or depth > MAX_DEPTH:
+            return
+        seen = seen | {name}
+        if declaration[0] == 'type':
+            self._expand_type(declaration[1], path, '', paths, depth, seen)
+            return
+        _, body, extends = declaration
+        for parent in extends:
+            self._expand_named(parent.split('<')[0].strip(), path, paths, depth + 1, seen)
+        for member, _, type_text, comment in split_members(body):
+            member_path = f'{path}.{member}' if path else member
+            self._expand_type(type_text, member_path, comment, paths, depth + 1, seen)
+
+    def _expand_type(self, type_text, path, comment, paths, depth, seen):
+        type_text = strip_type(type_text)
+        if not type_text or depth > MAX_DEPTH:
+            return
+        if type_text.endswith('[]'):
+            self._expand_type(type_text[:-2], f'{path}[0]', comment, paths, depth + 1, seen)
+            return
+        array = re.fullmatch(r'(?:Readonly)?Array<(.*)>', type_text, re.S)
+        if array:
+            self._expand_type(array.group(1), f'{path}[0]', comment, paths, depth + 1, seen)
+            return
+        wrapper = re.fullmatch(r'(\w+)<(.*)>', type_text, re.S)
+        if wrapper and wrapper.group(1) in FIELD_WRAPPERS:
+            paths.append((path, self.value_kind(wrapper.group(2)), comment))
+            return
+        if type_text.startswith('[') and matching_close(type_text, 0) == len(type_text) - 1:
+            # Tuple: one path per element
+            for index, element in enumerate(split_top_level(type_text[1:-1], ',')):
+                if element.strip():
+                    self._expand_type(element, f'{path}[{index}]', comment, paths, depth + 1, seen)
+            return
+        if type_text.startswith('{'):
+            close = matching_close(type_text, 0)
+            for member, _, member_type, member_comment in split_members(type_text[1:close]):
+                self._expand_type(member_type, f'{path}.{member}', member_comment, paths, depth + 1, seen)
+            return
+        if wrapper:
+            type_text = wrapper.group(1)
+        if re.fullmatch(r'\w+', type_text):
+            self._expand_named(type_text, path, paths, depth + 1, seen)
+
+def default_reference_paths(source, section_id):
+    """(object path, identifier) for createFieldFromReference(section_id, '...') calls in object literals
+
+    Paths follow the property keys of the enclosing object literals; array
+    literal elements become [index]. Calls outside keyed properties are skipped.
+    """
+    pairs = []
+    stack = []  # (bracket, key, element index)
+    position = 0
+    pending_key = None
+    call = re.compile(r'createFieldFromReference\s*(?:<[^>(]*>)?\(\s*(\d+)\s*,\s*([\'"])((?:\\.|(?!\2).)*)\2')
+    while position < len(source):
+        after_comment = skip_comment(source, position)
+        if after_comment != position:
+            position = after_comment
+            continue
+        char = source[position]
+        if char in '\'"`':
+            position = skip_string(source, position)
+            pending_key = None
+            continue
+        key = re.compile(r'([A-Za-z_$][\w$]*|\'[^\']*\'|"[^"]*")\s*:(?!:)').match(source, position)
+        if key and (position == 0 or not re.match(r'[\w$.]', source[position - 1])):
+            pending_key = key.group(1).strip('\'"')
+            position = key.end()
+            continue
+        match = call.match(source, position)
+        if match:
+            if pending_key and int(match.group(1)) == section_id and stack and stack[-1][0] == '{':
+                keys = []
+                for bracket, frame_key, index in stack:
+                    if frame_key:
+                        keys.append(f'.{frame_key}')
+                    if bracket == '[':
+                        keys.append(f'[{index}]')
+                object_path = ''.join(keys).lstrip('.')
+                leaf = f'{object_path}.{pending_key}' if object_path else pending_key
+                pairs.append((leaf, re.sub(r'\\(.)', r'\1', match.group(3))))
+            # The call's '(' was consumed with its arguments; its ')' still closes a frame
+            stack.append(['(', None, 0])
+            pending_key = None
+            position = match.end()
+            continue
+        if char in '{[(':
+            stack.append([char, pending_key if char != '(' else None, 0])
+            pending_key = None
+        elif char in '}])':
+            if stack:
+                stack.pop()
+            pending_key = None
+        elif char == ',' and stack:
+            stack[-1][2] += 1
+            pending_key = None
+        elif char in ';=':
+            pending_key = None
+        position += 1
+    return pairs
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Suggest Field Mappings for Section Interfaces
+Extracts every Field<T> path from api/interfaces/sections2.0/sectionN.ts and
+proposes a PDF field for each, ranked by label/name token overlap, widget
+kind, comment hints and sibling subform/page/rect agreement (see
+sf86_toolkit/mapping_matcher.py). Writes one proposal for the whole form to
+reports/field-mapping-proposals.json, replacing hand-curated tables such as
+implemented_field_names in section9-field-audit.py as a starting point
+"""
+
+import argparse
+import json
+import os
+import time
+
+from sf86_toolkit.mapping_matcher import SectionMatcher
+from sf86_toolkit.references import REPO_ROOT, SECTION_IDS, load_all_section_references
+from sf86_toolkit.ts_interfaces import INTERFACES_DIR, InterfaceModel, default_reference_paths
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'reports', 'field-mapping-proposals.json')
+
+def field_entry(field, score=None):
+    entry = {'id': field['id'], 'name': field['name'], 'type': field['type'], 'label': field.get('label', '')}
+    if score is not None:
+        entry['score'] = round(score, 3)
+    return entry
+
+def existing_mappings(section_id, fields):
+    """{path: row} from the createFieldFromReference calls of the section's default factory"""
+    path = os.path.join(INTERFACES_DIR, f'section{section_id}.ts')
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    by_id = {field['id'].replace(' 0 R', '', 1): row for row, field in enumerate(fields)}
+    by_name = {field['name']: row for row, field in enumerate(fields)}
+    mappings = {}
+    for field_path, identifier in default_reference_paths(source, section_id):
+        row = by_id.get(identifier.replace(' 0 R', '', 1), by_name.get(identifier))
+        if row is not None:
+            mappings[field_path] = row
+    return mappings
+
+def main():
+    parser = argparse.ArgumentParser(description='Propose PDF field mappings for every Field<T> path of the section interfaces')
+    parser.add_argument('--sections', help='comma-separated section ids (default: all)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='proposal JSON path')
+    parser.add_argument('--alternatives', type=int, default=3, help='ranked alternatives kept per path')
+    args = parser.parse_args()
+
+    section_ids = [int(section) for section in args.sections.split(',')] if args.sections else list(SECTION_IDS)
+    references = load_all_section_references()
+
+    print('🔧 PROPOSING FIELD MAPPINGS')
+    print('=' * 60)
+    start = time.perf_counter()
+    proposal = {}
+    totals = {'paths': 0, 'proposed': 0, 'checked': 0, 'agreed': 0}
+
+    for section_id in section_ids:
+        fields = references.get(section_id, {}).get('fields', [])
+        field_paths = InterfaceModel.for_section(section_id).field_paths(f'Section{section_id}')
+        if not field_paths or not fields:
+            print(f'   Section {section_id:>2}: no Field<T> paths or reference fields')
+            continue
+
+        ranked = SectionMatcher(fields).propose(field_paths)
+        existing = existing_mappings(section_id, fields)
+        kinds = {path: kind for path, kind, _ in field_paths}
+        section_proposal = {}
+        agreed = checked = 0
+        for path, (row, candidates) in ranked.items():
+            entry = {
+                'kind': kinds[path],
+                'proposed': field_entry(fields[row], dict(candidates)[row]) if row is not None else None,
+                'alternatives': [field_entry(fields[other], score) for other, score in candidates
+                                 if other != row][:args.alternatives],
+            }
+            if path in existing:
+                entry['current'] = fields[existing[path]]['name']
+                checked += 1
+                agreed += row == existing[path]
+            section_proposal[path] = entry
+
+        proposed = sum(1 for row, _ in ranked.values() if row is not None)
+        proposal[str(section_id)] = section_proposal
+        totals['paths'] += len(ranked)
+        totals['proposed'] += proposed
+        totals['checked'] += checked
+        totals['agreed'] += agreed
+        agreement = f', agrees with {agreed}/{checked} current mappings' if checked else ''
+        print(f'   Section {section_id:>2}: {proposed:>4}/{len(ranked):<4} paths proposed '
+              f'({len(fields)} PDF fields){agreement}')
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(proposal, f, indent=2, ensure_ascii=False)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Proposed {totals['proposed']} of {totals['paths']} Field<T> paths in {elapsed:.2f}s")
+    if totals['checked']:
+        print(f"📊 Agreement with existing createFieldFromReference mappings: "
+              f"{totals['agreed']}/{totals['checked']} ({totals['agreed'] / totals['checked'] * 100:.0f}%)")
+    print(f'💾 Proposal written to {args.output}')
+
+if __name__ == '__main__':
+    main()
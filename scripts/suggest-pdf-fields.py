@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Suggest Nearest PDF Fields
+Batch repair for broken field mappings: builds a trigram index over every
+reference field name, uniqueId and generated mapping key, then suggests the
+nearest PDF fields for each broken identifier - read from files (one
+identifier per line, optionally "section<TAB>identifier") or found by
+scanning the section sources for createFieldFromReference identifiers that
+no longer resolve. The index can be exported as JSON for runtime lookups
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from sf86_toolkit.fuzzy_index import DEFAULT_MIN_SIMILARITY, FuzzyFieldIndex
+from sf86_toolkit.references import SECTION_IDS, load_all_section_references
+from sf86_toolkit.section_checks import iter_reference_calls, resolves
+
+def read_queries(paths):
+    """(section or None, identifier, source) from query files (- for stdin)"""
+    for path in paths:
+        stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        try:
+            for line_number, line in enumerate(stream, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                section, _, identifier = line.partition('\t')
+                if identifier and section.isdigit():
+                    yield int(section), identifier, f'{path}:{line_number}'
+                else:
+                    yield None, line, f'{path}:{line_number}'
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+def scan_broken_references(references):
+    """(section, identifier, source) for createFieldFromReference calls that do not resolve"""
+    for section_id in SECTION_IDS:
+        fields = references.get(section_id, {}).get('fields', [])
+        ids = {field['id'].replace(' 0 R', '', 1) for field in fields if field.get('id')}
+        names = {field['name'] for field in fields}
+        unique_ids = {field['uniqueId'] for field in fields if field.get('uniqueId')}
+        for path, line, identifier in iter_reference_calls(section_id):
+            if not resolves(identifier, ids, names, unique_ids):
+                yield section_id, identifier, f'{path}:{line}'
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest the nearest reference PDF fields for broken field identifiers')
+    parser.add_argument('inputs', nargs='*', help='files of broken identifiers (- for stdin)')
+    parser.add_argument('--scan', action='store_true', help='find unresolved createFieldFromReference identifiers in the section sources')
+    parser.add_argument('--any-section', action='store_true', help='do not restrict suggestions to the identifier\'s section')
+    parser.add_argument('--top', type=int, default=3, help='suggestions per identifier')
+    parser.add_argument('--min-similarity', type=float, default=DEFAULT_MIN_SIMILARITY,
+                        help='minimum 1 - distance / length, as in findFuzzyFieldMatches')
+    parser.add_argument('--output', help='write suggestions as JSON')
+    parser.add_argument('--export-index', help='write the fuzzy index as JSON for runtime use')
+    args = parser.parse_args()
+
+    if not args.inputs and not args.scan and not args.export_index:
+        parser.error('give identifier files, --scan or --export-index')
+
+    start = time.perf_counter()
+    references = load_all_section_references()
+    index = FuzzyFieldIndex.from_references(references)
+    print(f'🔧 Indexed {len(index.keys)} keys for {len(index.fields)} fields '
+          f'({len(index.postings)} trigrams) in {time.perf_counter() - start:.2f}s')
+
+    if args.export_index:
+        os.makedirs(os.path.dirname(os.path.abspath(args.export_index)), exist_ok=True)
+        index.save(args.export_index)
+        print(f'💾 Index written to {args.export_index} ({os.path.getsize(args.export_index):,} bytes)')
+
+    queries = list(read_queries(args.inputs))
+    if args.scan:
+        queries.extend(scan_broken_references(references))
+    if not queries:
+        return
+
+    start = time.perf_counter()
+    results = []
+    for section, identifier, source in queries:
+        suggestions = index.suggest(identifier, None if args.any_section else section, args.top, args.min_similarity)
+        results.append({
+            'source': source,
+            'section': section,
+            'identifier': identifier,
+            'suggestions': [{'section': suggestion_section, 'name': name, 'similarity': similarity, 'matchedOn': kind}
+                            for suggestion_section, name, similarity, kind in suggestions],
+        })
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        suggestions = result['suggestions']
+        best = suggestions[0] if suggestions else None
+        print(f"{'✅' if best else '❌'} {result['source']}  {result['identifier']}")
+        if best:
+            print(f"   -> {best['name']}  ({best['similarity']:.2f} on {best['matchedOn']}, section {best['section']})")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f'\n💾 Suggestions written to {args.output}')
+
+    repaired = sum(1 for result in results if result['suggestions'])
+    print(f'\n📊 {repaired}/{len(results)} identifiers have a suggestion ({elapsed * 1000:.0f} ms)')
+
+if __name__ == '__main__':
+    main()
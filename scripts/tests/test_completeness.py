@@ -0,0 +1,48 @@
+"""
+Completeness scoring from applicant dumps and from a columnar store
+"""
+
+import numpy as np
+import pytest
+
+from sf86_toolkit.columnar import ColumnarStore, ColumnarWriter
+from sf86_toolkit.completeness import CompletenessIndex, is_filled
+from sf86_toolkit.constraints import FIELD_TYPES, ConstraintTables
+
+CHECKBOX_VALUES = ['false', 'No', '0', False, 'off', 'true', 'Yes', '1', True, 'on']
+
+@pytest.fixture(scope='module')
+def constraints():
+    return ConstraintTables.from_references()
+
+def checkbox_rows(constraints, count):
+    checkbox = FIELD_TYPES.index('PDFCheckBox')
+    rows = [row for row in range(len(constraints.ids))
+            if constraints.types[row] == checkbox and constraints.by_id.get(constraints.ids[row]) == row
+            and constraints.unique_ids[row]]
+    return rows[:count]
+
+def test_is_filled_checkbox_values():
+    assert [is_filled(value, checkbox=True) for value in CHECKBOX_VALUES] == [False] * 5 + [True] * 5
+    assert is_filled('false') and is_filled('No') and is_filled(0)
+    assert not is_filled(None) and not is_filled('', checkbox=True)
+
+def test_dump_and_store_agree_on_string_checkboxes(constraints, tmp_path):
+    rows = checkbox_rows(constraints, len(CHECKBOX_VALUES))
+    records = []
+    for shift in range(3):
+        values = CHECKBOX_VALUES[shift:] + CHECKBOX_VALUES[:shift]
+        records.append({'section1': {f'box{position}': {'id': f'{constraints.ids[row]} 0 R', 'value': value}
+                                     for position, (row, value) in enumerate(zip(rows, values))}})
+
+    writer = ColumnarWriter(str(tmp_path / 'store'), constraints)
+    for number, data in enumerate(records):
+        writer.add(number, data)
+    writer.close()
+
+    index = CompletenessIndex(constraints)
+    dump_masks = index.masks(records)
+    store_masks = index.masks_from_store(ColumnarStore(str(tmp_path / 'store')))
+
+    assert np.array_equal(dump_masks, store_masks)
+    assert dump_masks.sum(axis=1).tolist() == [5, 5, 5]
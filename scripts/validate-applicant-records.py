@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch Applicant Record Validator
+Validates exported {section, data} form records (as persisted by
+api/repository/formDataRepository.ts) against the reference field constraints:
+field type, maxLength and dropdown/radio options. Constraints are loaded once
+per worker; records are validated in a process pool and per-record issue
+reports are streamed as NDJSON
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from sf86_toolkit.constraints import ConstraintTables, iter_form_fields
+from sf86_toolkit.records import iter_records, record_data
+
+# Set in each worker by init_worker (inherited from the parent under fork)
+CONSTRAINTS = None
+
+def init_worker():
+    global CONSTRAINTS
+    if CONSTRAINTS is None:
+        CONSTRAINTS = ConstraintTables.from_references()
+
+def validate_record(numbered_record):
+    """Validate one record; returns its report dict"""
+    number, text = numbered_record
+    try:
+        record = json.loads(text)
+    except json.JSONDecodeError as error:
+        return {'record': number, 'section': None, 'fieldsChecked': 0, 'valid': False,
+                'issues': [{'path': '', 'code': 'invalid-json', 'severity': 'error', 'message': str(error)}]}
+
+    data = record_data(record)
+    issues = []
+    checked = 0
+    for path, field in iter_form_fields(data):
+        checked += 1
+        row = CONSTRAINTS.find_row(field.get('id'), field.get('name'))
+        if row is None:
+            issues.append({'path': path, 'field': field.get('name') or field.get('id'), 'code': 'unknown-field',
+                           'severity': 'warning', 'message': 'not found in sections-references'})
+            continue
+        for code, severity, message in CONSTRAINTS.check_value(row, field.get('type'), field.get('value')):
+            issues.append({'path': path, 'field': CONSTRAINTS.names[row], 'code': code,
+                           'severity': severity, 'message': message})
+
+    return {
+        'record': number,
+        'section': record.get('section') if isinstance(record, dict) else None,
+        'fieldsChecked': checked,
+        'valid': not any(issue['severity'] == 'error' for issue in issues),
+        'issues': issues,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate exported applicant form records against reference constraints')
+    parser.add_argument('inputs', nargs='*', default=['-'], help='NDJSON or JSON-array record files (- for stdin)')
+    parser.add_argument('--output', help='NDJSON report path (default: stdout)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='validator processes')
+    parser.add_argument('--chunk-size', type=int, default=64, help='records handed to a worker at a time')
+    parser.add_argument('--issues-only', action='store_true', help='only report records that have issues')
+    args = parser.parse_args()
+
+    # Load once in the parent so forked workers share the tables
+    init_worker()
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    records = enumerate(iter_records(args.inputs))
+    totals = {'records': 0, 'invalid': 0, 'issues': 0}
+    start = time.perf_counter()
+
+    try:
+        if args.workers > 1:
+            pool = Pool(args.workers, initializer=init_worker)
+            reports = pool.imap(validate_record, records, chunksize=args.chunk_size)
+        else:
+            pool = None
+            reports = map(validate_record, records)
+
+        for report in reports:
+            totals['records'] += 1
+            totals['invalid'] += not report['valid']
+            totals['issues'] += len(report['issues'])
+            if report['issues'] or not args.issues_only:
+                output.write(json.dumps(report, ensure_ascii=False) + '\n')
+
+        if pool:
+            pool.close()
+            pool.join()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    rate = totals['records'] / elapsed if elapsed else 0
+    print(f"✅ Validated {totals['records']} records in {elapsed:.2f}s ({rate:,.0f} records/s): "
+          f"{totals['invalid']} invalid, {totals['issues']} issues", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Verify Changed Sections
+Fast path for pre-commit checks: reads git diff --name-only against a base
+ref (or the staged changes), maps changed section-N.json exports, sectionN.ts
+interfaces and sectionN.tsx contexts to their sections, and verifies only
+those. Changes to shared files (index.json, the references loader, base.ts)
+verify every section
+
+    python3 verify-changed-sections.py                # working tree vs HEAD
+    python3 verify-changed-sections.py --staged       # pre-commit hook
+    python3 verify-changed-sections.py --base origin/main
+"""
+
+import argparse
+import time
+
+from sf86_toolkit.references import SECTION_IDS
+from sf86_toolkit.section_checks import SectionVerifier, changed_paths, sections_for_paths
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify only the sections touched by a git diff')
+    parser.add_argument('--base', default='HEAD', help='git ref to diff against')
+    parser.add_argument('--staged', action='store_true', help='use the staged changes (for a pre-commit hook)')
+    parser.add_argument('--sections', help='comma-separated section ids to verify instead of using git')
+    parser.add_argument('--all', action='store_true', help='verify every section')
+    parser.add_argument('--strict', action='store_true', help='treat warnings as failures')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.all:
+        sections, reason = list(SECTION_IDS), 'all sections requested'
+    elif args.sections:
+        sections, reason = sorted(int(section) for section in args.sections.split(',')), 'sections requested'
+    else:
+        paths = changed_paths(args.base, args.staged)
+        sections, shared = sections_for_paths(paths)
+        if shared:
+            sections, reason = list(SECTION_IDS), 'shared reference files changed'
+        else:
+            reason = f'{len(paths)} changed files vs {"the index" if args.staged else args.base}'
+
+    print(f'🔍 Verifying {len(sections)} section(s) ({reason})')
+    if not sections:
+        print('✅ No section files changed')
+        return
+
+    verifier = SectionVerifier()
+    failed = []
+    for section_id in sections:
+        errors, warnings, checked = verifier.verify(section_id)
+        status = '❌' if errors or (args.strict and warnings) else '✅'
+        print(f'{status} Section {section_id}: {checked} field identifiers checked, '
+              f'{len(errors)} errors, {len(warnings)} warnings')
+        for message in errors:
+            print(f'   ❌ {message}')
+        for message in warnings:
+            print(f'   ⚠️  {message}')
+        if status == '❌':
+            failed.append(section_id)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if failed:
+        print(f'\n❌ {len(failed)} section(s) failed verification: {", ".join(map(str, failed))} ({elapsed_ms:.0f} ms)')
+        raise SystemExit(1)
+    print(f'\n✅ All {len(sections)} section(s) verified ({elapsed_ms:.0f} ms)')
+
+if __name__ == '__main__':
+    main()
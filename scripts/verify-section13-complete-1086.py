@@ -9,6 +9,20 @@ import os
 import re
 from collections import defaultdict
 
+from sf86_toolkit.field_records import group_records, records_from_fields
+
+def value_type(record):
+    """Category of a field's reference value"""
+    if isinstance(record.value, str):
+        return 'string'
+    if isinstance(record.value, bool):
+        return 'boolean'
+    if isinstance(record.value, list):
+        return 'list'
+    if record.value is None:
+        return 'null'
+    return 'other'
+
 def load_reference_data():
     """Load the section-13.json reference data"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,50 +40,22 @@ def load_interface_mappings():
         return f.read()
 
 def analyze_all_fields(data):
-    """Analyze all 1,086 fields in the reference data"""
-    fields_array = data['fields']
+    """Analyze all 1,086 fields in the reference data
+
+    Categories hold the shared FieldRecord objects, not per-category copies.
+    """
+    records = records_from_fields(data['fields'])
     
     field_analysis = {
-        'total_fields': len(fields_array),
-        'by_type': defaultdict(list),
-        'by_value_type': defaultdict(list),
-        'string_values': set(),
-        'field_names': set(),
-        'unique_ids': set()
+        'total_fields': len(records),
+        'records': records,
+        'by_type': group_records(records, lambda record: record.type),
+        'by_value_type': group_records(records, value_type),
+        'string_values': {record.value for record in records if isinstance(record.value, str)},
+        'field_names': {record.name for record in records},
+        'unique_ids': {record.unique_id or '' for record in records}
     }
     
-    for i, field in enumerate(fields_array):
-        field_type = field.get('type', 'unknown')
-        field_name = field.get('name', f'field_{i}')
-        field_value = field.get('value')
-        field_id = field.get('id', '')
-        unique_id = field.get('uniqueId', '')
-        
-        # Categorize by PDF field type
-        field_analysis['by_type'][field_type].append({
-            'index': i,
-            'name': field_name,
-            'value': field_value,
-            'id': field_id,
-            'uniqueId': unique_id
-        })
-        
-        # Categorize by value type
-        if isinstance(field_value, str):
-            field_analysis['by_value_type']['string'].append(field)
-            field_analysis['string_values'].add(field_value)
-        elif isinstance(field_value, bool):
-            field_analysis['by_value_type']['boolean'].append(field)
-        elif isinstance(field_value, list):
-            field_analysis['by_value_type']['list'].append(field)
-        elif field_value is None:
-            field_analysis['by_value_type']['null'].append(field)
-        else:
-            field_analysis['by_value_type']['other'].append(field)
-        
-        field_analysis['field_names'].add(field_name)
-        field_analysis['unique_ids'].add(unique_id)
-    
     return field_analysis
 
 def extract_interface_mappings(interface_content):
@@ -139,21 +125,21 @@ def verify_coverage(field_analysis, interface_mappings):
     results['missing_fields']['strings'] = list(string_values - mapped_strings)
     
     # Check checkbox coverage
-    checkbox_fields = [f['name'] for f in field_analysis['by_type']['PDFCheckBox']]
+    checkbox_fields = [f.name for f in field_analysis['by_type']['PDFCheckBox']]
     mapped_checkboxes = interface_mappings['checkbox_fields']
     checkbox_matches = set(checkbox_fields).intersection(mapped_checkboxes)
     results['checkbox_coverage'] = len(checkbox_matches) / len(checkbox_fields) * 100 if checkbox_fields else 0
     results['missing_fields']['checkboxes'] = list(set(checkbox_fields) - mapped_checkboxes)
     
     # Check radio button coverage
-    radio_fields = [f['name'] for f in field_analysis['by_type']['PDFRadioGroup']]
+    radio_fields = [f.name for f in field_analysis['by_type']['PDFRadioGroup']]
     mapped_radios = interface_mappings['radio_fields']
     radio_matches = set(radio_fields).intersection(mapped_radios)
     results['radio_coverage'] = len(radio_matches) / len(radio_fields) * 100 if radio_fields else 0
     results['missing_fields']['radios'] = list(set(radio_fields) - mapped_radios)
     
     # Check dropdown coverage
-    dropdown_fields = [f['name'] for f in field_analysis['by_type']['PDFDropdown']]
+    dropdown_fields = [f.name for f in field_analysis['by_type']['PDFDropdown']]
     mapped_dropdowns = interface_mappings['dropdown_fields']
     dropdown_matches = set(dropdown_fields).intersection(mapped_dropdowns)
     results['dropdown_coverage'] = len(dropdown_matches) / len(dropdown_fields) * 100 if dropdown_fields else 0
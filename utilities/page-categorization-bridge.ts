@@ -405,6 +405,18 @@ const complexFieldPatterns = [
 let fieldPageMapping: Record<string, number> | null = null;
 // Section statistics cache
 let sectionStats: any = null;
+// Precomputed field-to-section table (generated by scripts/categorize-fields.py)
+interface PrecomputedSection {
+  section: number;
+  stage: string;
+  confidence: number;
+}
+
+// Precomputed entries below this confidence are re-categorized at runtime
+const PRECOMPUTED_MIN_CONFIDENCE = 0.95;
+
+// Precomputed field-to-section table cache
+let fieldSectionMapping: Record<string, PrecomputedSection> | null = null;
 
 /**
  * Load field page mapping data if it exists
@@ -437,6 +449,35 @@ export function loadFieldPageMapping(): Record<string, number> {
   }
 }
 
+/**
+ * Load the precomputed field-to-section table if it exists
+ * (generated offline by scripts/categorize-fields.py)
+ */
+export function loadFieldSectionMapping(): Record<string, PrecomputedSection> {
+  if (fieldSectionMapping !== null) {
+    return fieldSectionMapping;
+  }
+
+  try {
+    const sectionMapPath = path.join(
+      __dirname,
+      "../reports/field-section-mapping.json"
+    );
+
+    if (fs.existsSync(sectionMapPath)) {
+      const data = JSON.parse(fs.readFileSync(sectionMapPath, "utf-8"));
+      fieldSectionMapping = data;
+      console.log(`Loaded section mapping for ${Object.keys(data).length} fields`);
+      return data;
+    }
+  } catch (error) {
+    console.error("Error loading field section mapping:", error);
+  }
+
+  fieldSectionMapping = {};
+  return fieldSectionMapping;
+}
+
 /**
  * Load section statistics data if it exists
  */
@@ -1360,13 +1401,18 @@ export function enhancedCategorizeField(field: any): {
   const pageNum = getFieldPage(fieldName);
   const fieldValue = field.value || "";
 
-  // Use enhanced categorization with field value
-  const sectionInfo = enhancedSectionCategorization(
-    fieldName,
-    fieldLabel,
-    pageNum,
-    fieldValue
-  );
+  // Use the precomputed table when the field was categorized offline with high
+  // confidence, otherwise fall back to enhanced categorization with field value
+  const precomputed = loadFieldSectionMapping()[fieldName];
+  const sectionInfo =
+    precomputed && precomputed.confidence >= PRECOMPUTED_MIN_CONFIDENCE
+      ? { section: precomputed.section, confidence: precomputed.confidence }
+      : enhancedSectionCategorization(
+          fieldName,
+          fieldLabel,
+          pageNum,
+          fieldValue
+        );
 
   if (!sectionInfo) return null;
 
@@ -1417,6 +1463,8 @@ export function initPageCategorization(): boolean {
   loadFieldPageMapping();
   loadSectionStats();
   loadFieldLabels();
+  loadFieldSectionMapping();
+  loadFieldNeighborTable();
 
   // Return true if both data sets were loaded successfully
   return !!fieldPageMapping && !!sectionStats;
@@ -2596,6 +2644,83 @@ export function enhancedMultiDimensionalCategorization(
   return bestMatch;
 }
 
+// Precomputed neighbour adjacency table (generated by scripts/generate-neighbor-table.py)
+interface FieldNeighborTable {
+  k: number;
+  names: string[];
+  neighbors: number[];
+  subformOf: number[];
+  subformOffsets: number[];
+  subformMembers: number[];
+}
+
+let fieldNeighborTable: FieldNeighborTable | null = null;
+let neighborIndexByName: Map<string, number> | null = null;
+
+/**
+ * Load the precomputed neighbour table if it exists
+ */
+export function loadFieldNeighborTable(): FieldNeighborTable | null {
+  if (neighborIndexByName !== null) {
+    return fieldNeighborTable;
+  }
+
+  neighborIndexByName = new Map();
+  try {
+    const tablePath = path.join(
+      __dirname,
+      "../reports/field-neighbor-table.json"
+    );
+
+    if (fs.existsSync(tablePath)) {
+      const table: FieldNeighborTable = JSON.parse(fs.readFileSync(tablePath, "utf-8"));
+      table.names.forEach((name, index) => {
+        if (!neighborIndexByName!.has(name)) neighborIndexByName!.set(name, index);
+      });
+      fieldNeighborTable = table;
+      console.log(`Loaded neighbour table for ${table.names.length} fields`);
+    }
+  } catch (error) {
+    console.error("Error loading field neighbour table:", error);
+  }
+
+  return fieldNeighborTable;
+}
+
+/**
+ * Subform siblings followed by the nearest same-page widgets of a field,
+ * or null when the field is not in the precomputed table
+ */
+export function getPrecomputedNeighbors(fieldName: string): string[] | null {
+  const table = loadFieldNeighborTable();
+  const index = neighborIndexByName?.get(fieldName);
+  if (!table || index === undefined) return null;
+
+  const subform = table.subformOf[index];
+  const related = new Set<number>(
+    table.subformMembers.slice(table.subformOffsets[subform], table.subformOffsets[subform + 1])
+  );
+  for (const neighbor of table.neighbors.slice(index * table.k, (index + 1) * table.k)) {
+    if (neighbor >= 0) related.add(neighbor);
+  }
+  related.delete(index);
+
+  return Array.from(related, (neighbor) => table.names[neighbor]);
+}
+
+// Name sets of the field lists passed to getNeighborFieldContext, built once
+// per list (and again if its length changes) instead of on every call
+const fieldNameSets = new WeakMap<string[], { length: number; names: Set<string> }>();
+
+function fieldNameSet(fields: string[]): Set<string> {
+  let cached = fieldNameSets.get(fields);
+  if (!cached || cached.length !== fields.length) {
+    cached = { length: fields.length, names: new Set(fields) };
+    fieldNameSets.set(fields, cached);
+  }
+  return cached.names;
+}
+
 /**
  * Extract context from neighboring fields
  */
@@ -2603,6 +2728,14 @@ export function getNeighborFieldContext(
   fieldName: string,
   allFields: string[]
 ): string[] {
+  // Known reference fields have their neighbours precomputed; keep only
+  // those present in the caller's field set
+  const precomputed = getPrecomputedNeighbors(fieldName);
+  if (precomputed) {
+    const present = fieldNameSet(allFields);
+    return precomputed.filter((neighbor) => present.has(neighbor));
+  }
+
   // Get fields that appear nearby in the form structure
   // This is a simplistic approach - ideally we'd have x,y coordinates from the PDF
 
@@ -2778,6 +2911,9 @@ export default {
   enhancedSectionCategorization,
   loadFieldPageMapping,
   loadSectionStats,
+  loadFieldSectionMapping,
+  loadFieldNeighborTable,
+  getPrecomputedNeighbors,
   refinedSectionPageRanges,
   extractSectionInfoFromName,
   createEmptyFieldPageMapping,